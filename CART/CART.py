@@ -11,13 +11,18 @@ from slicer.ScriptedLoadableModule import *
 from slicer.i18n import tr as _
 from slicer.util import VTKObservationMixin
 
-from CARTLib.core.DataManager import DataManager
+from CARTLib.core.DataManager import DataManager, auto_cache_budget
 from CARTLib.core.LayoutManagement import OrientationButtonArrayWidget
 from CARTLib.core.TaskBaseClass import TaskBaseClass
 from CARTLib.core.SetupWizard import CARTSetupWizard, JobSetupWizard
 from CARTLib.utils import CART_PATH, get_cart_version
 from CARTLib.utils.config import JobProfileConfig, MasterProfileConfig
+from CARTLib.utils.data import CARTStandardUnit, NODE_POOL, SPILLED_EDITS, VOXEL_CACHE
+from CARTLib.utils.indexing import DIRECTORY_CRAWLER
+from CARTLib.utils.navigation import NavigationScheduler
 from CARTLib.utils.task import CART_TASK_REGISTRY
+from CARTLib.utils.timing import TRACER, timed, traced
+from CARTLib.utils.widgets import showErrorPrompt
 
 # These become available when Slicer initializes
 # noinspection PyUnresolvedReferences
@@ -299,6 +304,10 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         taskWidget = qt.QWidget(mainWidget)
         layout.addWidget(taskWidget)
 
+        # Add the (collapsed by default) diagnostics panel
+        diagnosticsPanel = self._diagnosticsPanel()
+        layout.addWidget(diagnosticsPanel)
+
         # Add a stretch to push everything to the top
         layout.addStretch()
 
@@ -394,6 +403,7 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             previousIncompleteButton.setEnabled(has_prior)
             previousButton.setEnabled(has_prior)
         self.logic.caseChanged.connect(updatePriorButtons)
+        self.logic.caseRequested.connect(updatePriorButtons)
 
         @qt.Slot(int, int)
         def updateNextButtons(__, ___):
@@ -401,6 +411,7 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             nextIncompleteButton.setEnabled(has_next)
             nextButton.setEnabled(has_next)
         self.logic.caseChanged.connect(updateNextButtons)
+        self.logic.caseRequested.connect(updateNextButtons)
 
         @qt.Slot(int, int)
         def updateSelectedCase(__: int, new_idx: int):
@@ -413,6 +424,8 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             finally:
                 caseSelector.blockSignals(False)
         self.logic.caseChanged.connect(updateSelectedCase)
+        # Track the case being headed to right away, even if it has yet to load
+        self.logic.caseRequested.connect(updateSelectedCase)
 
         # Return the result
         return buttonPanel
@@ -429,7 +442,12 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
         # The primary "save" button
         saveButton = qt.QPushButton(self.SAVE_BUTTON_DEFAULT_TEXT)
-        saveButton.clicked.connect(self.logic.save_case)
+        @qt.Slot()
+        def save():
+            # Finish switching to the case the user navigated to, so it's the one saved
+            self.logic.flush_navigation()
+            self.logic.save_case()
+        saveButton.clicked.connect(save)
         self.saveButton = saveButton
 
         # A "Save an Iterate" button, as requested by collaborators
@@ -438,6 +456,7 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         ))
         @qt.Slot()
         def save_and_next():
+            self.logic.flush_navigation()
             self.logic.save_case()
             self.logic.next_case()
         saveAndNextButton.clicked.connect(save_and_next)
@@ -472,6 +491,81 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
         return layoutPanel
 
+    def _diagnosticsPanel(self) -> qt.QWidget:
+        # Setup
+        mainWidget = ctk.ctkCollapsibleButton()
+        mainWidget.text = _("Diagnostics")
+        mainWidget.collapsed = True
+        layout = qt.QVBoxLayout(mainWidget)
+
+        # Checkbox to start/stop recording timing spans
+        traceCheckBox = qt.QCheckBox(_("Record Timing Trace"))
+        traceCheckBox.setToolTip(_(
+            "Record how long each step of switching (and saving) cases takes, "
+            "so it can be exported and inspected in Perfetto or Chrome's tracing tool."
+        ))
+        traceCheckBox.setChecked(TRACER.enabled)
+
+        @qt.Slot(bool)
+        def onTraceToggled(checked: bool):
+            if checked:
+                TRACER.enable()
+            else:
+                TRACER.disable()
+
+        traceCheckBox.toggled.connect(onTraceToggled)
+        layout.addWidget(traceCheckBox)
+
+        # Button panel for exporting/clearing the recorded trace
+        buttonPanel = qt.QWidget(None)
+        buttonPanelLayout = qt.QHBoxLayout(buttonPanel)
+        layout.addWidget(buttonPanel)
+
+        # "Export" button
+        exportButton = qt.QPushButton(_("Export Trace..."))
+        exportButton.setToolTip(_("Save the recorded trace as a Chrome trace (JSON) file."))
+
+        @qt.Slot()
+        def onExportClicked():
+            trace_path = qt.QFileDialog.getSaveFileName(
+                None, _("Export Timing Trace"), "cart_trace.json", "JSON (*.json)"
+            )
+            if not trace_path:
+                return
+            TRACER.export(Path(trace_path))
+            logging.info(
+                f"Exported {len(TRACER.spans())} timing spans to '{trace_path}'."
+            )
+
+        exportButton.clicked.connect(onExportClicked)
+        buttonPanelLayout.addWidget(exportButton)
+
+        # "Clear" button
+        clearButton = qt.QPushButton(_("Clear"))
+        clearButton.setToolTip(_("Discard everything recorded so far."))
+        clearButton.clicked.connect(lambda: TRACER.clear())
+        buttonPanelLayout.addWidget(clearButton)
+
+        # Button to log which data units are still in memory
+        liveUnitsButton = qt.QPushButton(_("Report Live Cases"))
+        liveUnitsButton.setToolTip(_(
+            "Log every case still held in memory, and how many nodes each still has; "
+            "cases which were unloaded should not linger here."
+        ))
+
+        @qt.Slot()
+        def onLiveUnitsClicked():
+            data_manager = self.logic.data_manager
+            if data_manager is None:
+                logging.info("No job is active, so no cases are loaded.")
+                return
+            logging.info(data_manager.live_unit_report())
+
+        liveUnitsButton.clicked.connect(onLiveUnitsClicked)
+        layout.addWidget(liveUnitsButton)
+
+        return mainWidget
+
     ## Connections ##
     def start(self, job_name=None):
         # Check if a user profile exists, prompting the user to create one if not.
@@ -656,11 +750,18 @@ class CARTWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         """
         Called when the application closes and this widget is about to be destroyed.
         """
+        # Let the active task finish up before Slicer closes
+        self.logic.cleanup()
+
+        # Delete any unsaved edits we were keeping around
+        SPILLED_EDITS.clear()
+
         # Disconnect from the signals we hooked into so Slicer can close cleanly
         self.logic.jobChanged.disconnect()
         self.logic.jobListChanged.disconnect()
         self.logic.caseSaved.disconnect()
         self.logic.caseChanged.disconnect()
+        self.logic.caseRequested.disconnect()
         self.saveStateTimer.timeout.disconnect()
 
     def enter(self):
@@ -696,6 +797,10 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
     # The first int is -1 when no prior case exists (this is the first case loaded)
     caseChanged = qt.Signal(int, int)
 
+    # Signal for when a switch from the case we were headed to (the first int) to another
+    # (the second) was requested; the switch itself happens later (see `caseChanged`)
+    caseRequested = qt.Signal(int, int)
+
     # Emitted when the case at a given index just tried to save
     caseSaved = qt.Signal(int)
 
@@ -708,6 +813,9 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
         self._data_manager: Optional[DataManager] = None
         self._task_instance: Optional[TaskBaseClass] = None
 
+        # Coalesces rapid case switches, so only the last one is actually loaded
+        self._navigation = NavigationScheduler(self._switch_to_case)
+
         # Logging
         self.logger = logging.getLogger("CARTLogic")
 
@@ -791,13 +899,53 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
             )
         duf = new_task_cls.getDataUnitFactory()
 
-        # Initialize a new data manager
+        # Stop the previous data manager from pre-fetching any further
+        if self._data_manager is not None:
+            self._data_manager.cancel_prefetch()
+
+        # Unload the previous task BEFORE building the new one, letting it finish
+        #  any saves still in progress; otherwise the new task (and its completion
+        #  index) would be built from outputs missing those saves
+        self.unload_task()
+
+        # Release the previous job's cases now, rather than whenever they're garbage collected
+        if self._data_manager is not None:
+            self._data_manager.clean()
+        self._data_manager = None
+        self._task_instance = None
+
+        # Unsaved edits only ever apply to the job they were made in
+        SPILLED_EDITS.clear()
+
+        # Cache decoded volumes on disk, if the user has opted into it
+        VOXEL_CACHE.configure(
+            self.master_profile_config.voxel_cache_dir,
+            self.master_profile_config.voxel_cache_budget,
+        )
+
+        # Limit how many unused nodes are kept around for re-use
+        NODE_POOL.configure(self.master_profile_config.node_pool_limit)
+
+        # Limit how much disk space the unsaved edits of unloaded cases can take up
+        SPILLED_EDITS.configure(self.master_profile_config.spill_budget)
+
+        # Have cases display before they finish loading, if the user requested it
+        #  (and the task's data units support it; see `SUPPORTS_PROGRESSIVE_LOADING`)
+        CARTStandardUnit.progressive_loading = self.master_profile_config.progressive_loading
+
+        # Determine how much memory cached cases can use
+        cache_budget = self.master_profile_config.cache_budget
+        if cache_budget == MasterProfileConfig.AUTO_CACHE_BUDGET:
+            cache_budget = auto_cache_budget()
+
+        # Initialize a new data manager; if we couldn't determine a memory
+        # budget, fall back to only caching a fixed number of cases instead
         data_manager = DataManager(
             cohort_file=job_profile.cohort_path,
             data_source=job_profile.data_path,
             data_unit_factory=duf,
-            # TODO: Allow user configuration of this
-            cache_size=2,
+            cache_size=2 if cache_budget is None else None,
+            cache_budget=cache_budget,
         )
 
         # Initialize the new task
@@ -805,24 +953,26 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
             self.master_profile_config, job_profile, data_manager.feature_labels
         )
 
-        # Unload the previous task
-        # TODO
-
         if self.master_profile_config.load_previous_outputs:
             # If the user has requested we load previous outputs, pass
             # the task to the data manager so it can "seek" them.
             data_manager.reference_task = new_task
 
+        # Check which cases the task has already completed, all at once
+        data_manager.build_completion_index(new_task)
+
         # Install the new task and give it its first data unit!
         self._data_manager = data_manager
         self._task_instance = new_task
+        new_task.save_finished_callback = self._on_background_save_finished
 
         # Pass the appropriate case to the task, skipping to the first "incomplete" if requested
         if self.master_profile_config.skip_to_first_incomplete:
             unit = self.data_manager.first_incomplete(self._task_instance)
         else:
             unit = self.data_manager.first()
-        self._task_instance.receive(unit)
+        with timed("Task receive"):
+            self._task_instance.receive(unit)
 
         # Initialize the new task
         self.active_job_config = job_profile
@@ -833,7 +983,8 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
 
         # Emit our job changed + a syncing case changed signal
         self.jobChanged()
-        self.caseChanged(-1, self.data_manager.current_case_index)
+        with timed("Case change listeners"):
+            self.caseChanged(-1, self.data_manager.current_case_index)
 
     def register_job_config(self, job_config: JobProfileConfig):
         self.master_profile_config.register_new_job(job_config)
@@ -845,7 +996,27 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
         # Just checks if we've defined an author before or not
         return self.author is not None
 
+    def cleanup(self):
+        """
+        Called when the module is about to be destroyed; unloads the active
+        task, and ensures no scheduled case switch can run afterward.
+        """
+        self.unload_task()
+        self._navigation.clean()
+
     ## Task Management ##
+    def unload_task(self):
+        """
+        Clean up the active task (if any), letting it finish anything still
+        running in the background (such as saving) first.
+        """
+        if self._task_instance is None:
+            return
+        # Drop any case switch still waiting to happen
+        self._navigation.cancel()
+        self._task_instance.cleanup()
+        self._task_instance.save_finished_callback = None
+
     def load_registered_tasks(self):
         """
         Attempt to load all registered tasks for reference throughout the program
@@ -995,14 +1166,26 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
             self.logger.warning("Could not check for case completion, CART has not initialized!")
             return False
         # Check if the selected case is completed or not
-        case = self.data_manager.case_data[idx]
-        return self._task_instance.isTaskComplete(case)
+        return self.data_manager.is_case_completed(idx, self._task_instance)
+
+    @property
+    def target_case_index(self) -> int:
+        """
+        The index of the case we are headed to; the case a switch is pending to
+        (if any), or the current case otherwise.
+        """
+        if self._navigation.is_pending:
+            return self._navigation.pending_index
+        if self._data_manager is None:
+            return -1
+        return self._data_manager.current_case_index
 
     def has_next_case(self):
         if self._data_manager is None:
             return False
-        return self._data_manager.has_next_case()
+        return self.target_case_index + 1 < len(self._data_manager.case_data)
 
+    @traced()
     def next_case(self) -> bool:
         # If we're in an invalid state, return False
         if not (
@@ -1011,46 +1194,33 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
             and self._task_instance
         ):
             return False
-        # Tell the task to save its current unit
-        self._autosave_case()
-        # Iterate to the next data unit and proceed
-        old_idx = self._data_manager.current_case_index
-        try:
-            new_unit = self._data_manager.next()
-            self._task_instance.receive(new_unit)
-            self.caseChanged(old_idx, self._data_manager.current_case_index)
-        except Exception as e:
-            # Roll back to the previous case if the task failed to receive the new unit
-            self.select_case(old_idx)
-            raise e
-        return True
+        # Schedule a switch to the case after the one we're headed to
+        return self._request_case(self.target_case_index + 1)
 
+    @traced()
     def next_incomplete_case(self):
         # If we're in an invalid state, return False
         if not (
             self._data_manager
-            and self._data_manager.has_next_case()
+            and self.has_next_case()
             and self._task_instance
         ):
             return
-        # Tell the task to save its current unit
-        self._autosave_case()
-        # Iterate to the next incomplete data unit and proceed
-        old_idx = self._data_manager.current_case_index
-        try:
-            new_unit = self._data_manager.next_incomplete(self._task_instance)
-            self._task_instance.receive(new_unit)
-            self.caseChanged(old_idx, self._data_manager.current_case_index)
-        except Exception as e:
-            # Roll back to the previous case if the task failed to receive the new unit
-            self.select_case(old_idx)
-            raise e
+        # Find the next incomplete case past the one we're headed to
+        from_idx = self.target_case_index
+        idx = self._data_manager.next_incomplete_index(self._task_instance, from_idx)
+        # If all subsequent cases are completed, just move to the next one instead
+        if idx is None:
+            logging.warning("All cases were completed! Loaded next unit instead.")
+            idx = from_idx + 1
+        self._request_case(idx)
 
     def has_previous_case(self):
         if self._data_manager is None:
             return False
-        return self._data_manager.has_previous_case()
+        return self.target_case_index > 0
 
+    @traced()
     def previous_case(self) -> bool:
         # If we're in an invalid state, return False
         if not (
@@ -1059,20 +1229,10 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
             and self._task_instance
         ):
             return False
-        # Tell the task to save its current unit
-        self._autosave_case()
-        # Iterate to the previous data unit and proceed
-        old_idx = self._data_manager.current_case_index
-        try:
-            new_unit = self._data_manager.previous()
-            self._task_instance.receive(new_unit)
-            self.caseChanged(old_idx, self._data_manager.current_case_index)
-        except Exception as e:
-            # Roll back to the previous case if the task failed to receive the new unit
-            self.select_case(old_idx)
-            raise e
-        return True
+        # Schedule a switch to the case before the one we're headed to
+        return self._request_case(self.target_case_index - 1)
 
+    @traced()
     def previous_incomplete_case(self) -> bool:
         # If we're in an invalid state, return False
         if not (
@@ -1081,52 +1241,121 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
             and self._task_instance
         ):
             return False
-        # Tell the task to save its current unit
-        self._autosave_case()
-        # Iterate to the previous data unit and proceed
-        old_idx = self._data_manager.current_case_index
-        try:
-            new_unit = self._data_manager.previous_incomplete(self._task_instance)
-            self._task_instance.receive(new_unit)
-            self.caseChanged(old_idx, self._data_manager.current_case_index)
-        except Exception as e:
-            # Roll back to the previous case if the task failed to receive the new unit
-            self.select_case(old_idx)
-            raise e
-        return True
-
+        # Find the previous incomplete case before the one we're headed to
+        from_idx = self.target_case_index
+        idx = self._data_manager.previous_incomplete_index(self._task_instance, from_idx)
+        # If all prior cases are completed, just move to the previous one instead
+        if idx is None:
+            logging.warning("All cases were completed! Loaded previous unit instead.")
+            idx = from_idx - 1
+        return self._request_case(idx)
+
+    @traced()
     def select_case(self, idx: int):
         # If we aren't in a state to swap cases, raise an error
         if self._data_manager is None:
             raise ValueError("CART cannot change cases; we do not have a data manager yet!")
         if self._task_instance is None:
             raise ValueError("CART cannot change cases; there is no task to receive the new one!")
+        self._request_case(idx)
+
+    def _request_case(self, idx: int) -> bool:
+        """
+        Schedule a switch to the case at the given index. Rapid requests are
+        coalesced, with only the last one actually being loaded; GUIs are
+        notified of each one immediately via `caseRequested`, however.
+        """
+        old_target = self.target_case_index
+        if idx == old_target:
+            return False
+
+        if idx == self._data_manager.current_case_index:
+            # We're back where we started; there's nothing to switch to anymore,
+            #  so resume pre-fetching around the case we're staying on
+            self._navigation.cancel()
+            self._data_manager.resume_prefetch()
+        else:
+            # Stop pre-fetching around a case we're no longer staying on
+            self._data_manager.cancel_prefetch()
+            self._navigation.request(idx)
+
+        self.caseRequested(old_target, idx)
+        return True
+
+    def flush_navigation(self):
+        """
+        Immediately switch to the case we're headed to, if a switch is pending.
+        """
+        if self._data_manager is None or self._task_instance is None:
+            return
+        self._navigation.flush()
+
+    @traced()
+    def _switch_to_case(self, idx: int):
+        # The job may have been unloaded since this switch was scheduled
+        if self._data_manager is None or self._task_instance is None:
+            return
         # Auto-save the case, if the user has configured it
         self._autosave_case()
         # Swap to the new unit
         prior_idx = self._data_manager.current_case_index
-        new_unit = self._data_manager.select_unit_at(idx)
-        self._task_instance.receive(new_unit)
-        self.caseChanged(prior_idx, idx)
+        try:
+            new_unit = self._data_manager.select_unit_at(idx)
+            with timed("Task receive"):
+                self._task_instance.receive(new_unit)
+            with timed("Case change listeners"):
+                self.caseChanged(prior_idx, idx)
+        except Exception as e:
+            # Roll back to the previous case if the task failed to receive the new unit
+            if prior_idx != -1:
+                new_unit = self._data_manager.select_unit_at(prior_idx)
+                self._task_instance.receive(new_unit)
+                self.caseChanged(prior_idx, prior_idx)
+            raise e
 
+    @traced()
     def _autosave_case(self):
         # Just checks the profile's configuration option before proceeding
-        if self.master_profile_config.autosave_on_switch:
-            self.save_case()
+        if not self.master_profile_config.autosave_on_switch:
+            return
+        # A case which is still loading can't be edited yet, so there's nothing to save
+        if self._data_manager.current_case_index != -1 and \
+                not self._data_manager.current_data_unit().is_fully_loaded:
+            return
+        self.save_case()
 
+    @traced()
     def save_case(self):
-        try:
-            # If we don't have what we need to save, raise an error
-            if self._task_instance is None:
-                raise ValueError("CART could not save; no task has been initialized!")
-            if self._data_manager is None:
-                raise ValueError(
-                    "CART could not save; the data manager has not been initialized!"
-                )
-            self._task_instance.save()
-        finally:
-            # Always emit a signal so any GUIs can sync properly
-            self.caseSaved(self.data_manager.current_case_index)
+        # If we don't have what we need to save, raise an error
+        if self._task_instance is None:
+            raise ValueError("CART could not save; no task has been initialized!")
+        if self._data_manager is None:
+            raise ValueError(
+                "CART could not save; the data manager has not been initialized!"
+            )
+        # If the save fails outright, the error is reported instead; the case wasn't saved
+        self._task_instance.save()
+
+        idx = self.data_manager.current_case_index
+        # If the task is still saving in the background, wait for it to report back
+        uid = self.data_manager.case_data[idx].get("uid")
+        if not self._task_instance.is_save_pending(uid):
+            self._report_case_saved(idx)
+
+    def _on_background_save_finished(self, uid: str, error: Optional[Exception] = None):
+        # Find the case that was saved, and report on it if its still in our cohort
+        idx = self.data_manager.index_for_uid(uid) if self.data_manager else None
+        if idx is not None:
+            self._report_case_saved(idx)
+        # If the save failed, the user needs to know; the case's edits were not written!
+        if error is not None:
+            showErrorPrompt(_(f"Failed to save case '{uid}': {error}"), None)
+
+    def _report_case_saved(self, idx: int):
+        # Re-check whether the case is complete now, keeping our index in sync
+        self.data_manager.update_completion(idx)
+        # Always emit a signal so any GUIs can sync properly
+        self.caseSaved(idx)
 
     ## Config Management ##
     def save_master_config(self):
@@ -1148,6 +1377,8 @@ class CARTLogic(ScriptedLoadableModuleLogic, qt.QObject):
             )
             # Update the config to use the new version
             self.master_profile_config.version = current_cart_version
+        # Limit how many directories are listed at once when searching for cases
+        DIRECTORY_CRAWLER.configure(self.master_profile_config.scan_workers)
 
     ## GUI Management ##
     def enter(self):
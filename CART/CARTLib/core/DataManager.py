@@ -1,20 +1,43 @@
 import csv
 import logging
+import weakref
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future
 from functools import cached_property
 from pathlib import Path
 from threading import RLock
-from typing import Optional, Callable
+from typing import Any, Optional, Callable
 
-from .DataUnitBase import DataUnitBase, DataUnitFactory
+from .DataUnitBase import DataUnitBase, DataUnitFactory, live_units
 from .TaskBaseClass import TaskBaseClass
-
-
-def dynamic_lru_cache_wrapper(func: Callable, maxsize: int, n_hashing_vars: int = None) -> Callable:
+from CARTLib.utils.background import BackgroundWorker
+from CARTLib.utils.scene import batch_scene_updates
+from CARTLib.utils.timing import timed, traced
+
+
+def dynamic_lru_cache_wrapper(
+    func: Callable,
+    maxsize: Optional[int],
+    n_hashing_vars: int = None,
+    max_weight: Optional[int] = None,
+    weigher: Callable[[Any], int] = None,
+    on_evict: Callable[[Any], None] = None,
+) -> Callable:
     """
     Re-implementation of `functools:lru_cache` extended to allow for the following:
       * Dynamically resizing.
       * Considers only n variables when checking for a cached value.
       * Check whether the given value already exists in the cache or not.
+      * Evicting based on the total "weight" of the cached results (i.e. how much
+        memory they use), as determined by `weigher`, rather than just their count.
+      * Pinning entries, preventing them from being evicted.
+      * Re-weighing entries whose results have grown (or shrunk) since caching.
+      * Notifying `on_evict` of each result as soon as it leaves the cache, so it
+        can be cleaned up deterministically rather than whenever it happens to
+        be garbage collected.
+
+    Either limit can be None to disable it. The most recently added entry is
+    never evicted, even if it alone exceeds the limits.
 
     You really shouldn't use this; if you need specialized caches, you should
     consider the cachetools package instead. The only reason this exists is to
@@ -25,7 +48,10 @@ def dynamic_lru_cache_wrapper(func: Callable, maxsize: int, n_hashing_vars: int
         raise ValueError("Number of considered ")
 
     # Ensure the maximum size is valid
-    def _validate_maxsize(new_size: int):
+    def _validate_maxsize(new_size: Optional[int]):
+        # No size means no limit
+        if new_size is None:
+            return
         # If the max size is invalid, raise an error
         if type(new_size) != int or new_size < 0:
             raise ValueError(
@@ -43,11 +69,15 @@ def dynamic_lru_cache_wrapper(func: Callable, maxsize: int, n_hashing_vars: int
 
 
     _validate_maxsize(maxsize)
+    _validate_maxsize(max_weight)
 
     # The cache itself, plus some statistics
-    cache: dict[int, list[int]] = {}
+    cache: dict[int, list] = {}
     hits = misses = 0
-    full = False
+    total_weight = 0
+
+    # Keys which should never be evicted
+    pinned: set[int] = set()
 
     # Explict binds to make it run a little faster
     cache_get = cache.get
@@ -56,21 +86,67 @@ def dynamic_lru_cache_wrapper(func: Callable, maxsize: int, n_hashing_vars: int
     # Lock to help with thread safety
     lock = RLock()
 
-    # Linked list to track the elements
-    PREV, NEXT, KEY, RESULT = 0, 1, 2, 3
+    # Linked list to track the elements; the root's "next" is the oldest element
+    PREV, NEXT, KEY, RESULT, WEIGHT = 0, 1, 2, 3, 4
     root = []
     # Initialize by pointing to ourselves in both directions
-    root[:] = [root, root, None, None]
+    root[:] = [root, root, None, None, 0]
+
+    def _over_capacity() -> bool:
+        if maxsize is not None and cache_len() > maxsize:
+            return True
+        if max_weight is not None and total_weight > max_weight:
+            return True
+        return False
+
+    def _evict(results: list):
+        """
+        Notify our eviction callback of each evicted result. MUST be called
+        w/o the lock held, as the callback can run arbitrary code.
+        """
+        if on_evict is None:
+            return
+        for result in results:
+            on_evict(result)
+
+    def _trim() -> list:
+        """
+        Evict the least recently used (un-pinned) entries until we're back
+        within our limits. MUST be called with the lock held.
+
+        Returns the evicted results; the caller should hold onto them until
+        the lock is released, as their garbage collection could run arbitrary
+        code (via a __del__ dunder, for example) which could break things. Once
+        it is, they should be passed to `_evict`.
+        """
+        nonlocal total_weight
+        results_holdout = []
+        newest = root[PREV]
+        current_link = root[NEXT]
+        while _over_capacity() and current_link is not root and current_link is not newest:
+            next_link = current_link[NEXT]
+            if current_link[KEY] not in pinned:
+                # Splice the link out of our list
+                prev_link = current_link[PREV]
+                prev_link[NEXT] = next_link
+                next_link[PREV] = prev_link
+                # Drop the corresponding element in our cache
+                del cache[current_link[KEY]]
+                total_weight -= current_link[WEIGHT]
+                results_holdout.append(current_link[RESULT])
+                current_link[:] = [None, None, None, None, 0]
+            current_link = next_link
+        return results_holdout
 
     # Build the wrapper function
     def wrapper(*args, **kwargs):
-        nonlocal root, hits, misses, maxsize, full
+        nonlocal hits, misses, total_weight
         key = make_key(*args, **kwargs)
         with lock:
             new_link = cache_get(key)
             if new_link is not None:
                 # Move the link to the front of our list
-                prev_link, next_link, old_key, result = new_link
+                prev_link, next_link, old_key, result, __ = new_link
                 prev_link[NEXT] = next_link
                 next_link[PREV] = prev_link
                 last = root[PREV]
@@ -83,41 +159,27 @@ def dynamic_lru_cache_wrapper(func: Callable, maxsize: int, n_hashing_vars: int
             # Otherwise we had a miss, track it and run the function
             misses += 1
         result = func(*args, **kwargs)
+        weight = weigher(result) if weigher is not None else 0
         with lock:
-            if key in cache:
+            existing_link = cache_get(key)
+            if existing_link is not None:
                 # Getting here means that this same key was added to the
-                # cache while the lock was released.  Since the link
-                # update is already done, we need only return the
-                # computed result and update the count of misses.
-                pass
-            # If we're at capacity, trim off the last-used link
-            elif full:
-                # Insert our new values into the previous root
-                old_root = root
-                old_root[KEY] = key
-                old_root[RESULT] = result
-                # Empty the oldest link and make it the new root
-                root = old_root[NEXT]
-                old_key = root[KEY]
-                # De-allocate the old root's contents so it can be garbage collected.
-                # NOTE: We hold out the old result to prevent it from being garbage
-                # collected early. Doing so could run arbitrary code (via a __del__
-                # dunder, for example) which could break things.
-                result_holdout = root[RESULT]
-                root[KEY] = root[RESULT] = None
-                # Drop the corresponding element in our cache
-                del cache[old_key]
-                # Re-insert last to ensure everything is consistent before risking
-                # and override (re-entrant key)
-                cache[key] = old_root
-            # If not, insert our new result and check if we're at capacity now
+                # cache while the lock was released. Since the link update
+                # is already done, we return the cached result instead,
+                # evicting our own (as nothing else will ever see it).
+                results_holdout = [result]
+                result = existing_link[RESULT]
             else:
                 # Put the result in a new link at the front
                 last_link = root[PREV]
-                new_link = [last_link, root, key, result]
+                new_link = [last_link, root, key, result, weight]
                 last_link[NEXT] = root[PREV] = cache[key] = new_link
-                # Check if we're full now
-                full = (cache_len() >= maxsize)
+                total_weight += weight
+                # Trim off the last-used links until we're within our limits again
+                results_holdout = _trim()
+        # Release the evicted results only once the lock is free again
+        _evict(results_holdout)
+        del results_holdout
         # Finally return the result
         return result
 
@@ -134,61 +196,129 @@ def dynamic_lru_cache_wrapper(func: Callable, maxsize: int, n_hashing_vars: int
         with lock:
             return cache_len()
 
+    def cache_weight() -> int:
+        with lock:
+            return total_weight
+
     def is_cached(*args, **kwargs) -> bool:
         key = make_key(*args, **kwargs)
         with lock:
             return key in cache.keys()
 
+    def cached_results() -> list:
+        # Every result currently in the cache, least recently used first
+        with lock:
+            results = []
+            link = root[NEXT]
+            while link is not root:
+                results.append(link[RESULT])
+                link = link[NEXT]
+            return results
+
     def clear_cache():
-        nonlocal hits, misses, full
+        nonlocal hits, misses, total_weight
         with lock:
+            results_holdout = [link[RESULT] for link in cache.values()]
             cache.clear()
-            root[:] = [root, root, None, None]
-            hits = misses = 0
-            full = False
+            pinned.clear()
+            root[:] = [root, root, None, None, 0]
+            hits = misses = total_weight = 0
+        # Everything in the cache was just evicted, pinned or not
+        _evict(results_holdout)
+        del results_holdout
 
-    def set_maxsize(new_size: int):
-        nonlocal root, full, maxsize
+    def set_maxsize(new_size: Optional[int]):
+        nonlocal maxsize
 
         # Make sure our max size is valid
         _validate_maxsize(new_size)
 
-        # If the new size is smaller than our current size, we need to trim
+        # Update our size, trimming anything which no longer fits
         with lock:
-            if new_size < cache_len():
-                # Hold onto the cached results until the end to avoid premature garbage collection
-                results_holdout = []
-                # Iterate through our cache until we've reached where we should cut
-                current_tail = root[PREV]
-                current_idx = cache_len() - 1
-                while current_idx >= new_size:
-                    results_holdout.append(current_tail[RESULT])
-                    key = current_tail[KEY]
-                    del cache[key]
-                    current_tail[NEXT] = current_tail[RESULT] = current_tail[KEY] = None
-                    current_tail = current_tail[PREV]
-                    current_idx -= 1
-                # Re-connect the tail to the root; this will isolate the trimmed section, allowing
-                # it to be garbage collected.
-                current_tail[NEXT] = root
-                # Mark ourselves as full
-                full = True
-            # If its larger and we were full, we're no longer full!
-            elif full and new_size > maxsize:
-                full = False
-            # Update our size to match
             maxsize = new_size
+            results_holdout = _trim()
+        _evict(results_holdout)
+        del results_holdout
+
+    def set_max_weight(new_weight: Optional[int]):
+        nonlocal max_weight
+
+        # Make sure our max weight is valid
+        _validate_maxsize(new_weight)
+
+        # Update our weight limit, trimming anything which no longer fits
+        with lock:
+            max_weight = new_weight
+            results_holdout = _trim()
+        _evict(results_holdout)
+        del results_holdout
+
+    def pin(*args, **kwargs):
+        # Prevent the entry w/ these arguments from being evicted
+        with lock:
+            pinned.add(make_key(*args, **kwargs))
+
+    def unpin(*args, **kwargs):
+        # Allow the entry w/ these arguments to be evicted again
+        with lock:
+            pinned.discard(make_key(*args, **kwargs))
+            results_holdout = _trim()
+        _evict(results_holdout)
+        del results_holdout
+
+    def reweigh(*args, **kwargs):
+        # Re-calculate the weight of the entry w/ these arguments, trimming if it grew
+        nonlocal total_weight
+        if weigher is None:
+            return
+        key = make_key(*args, **kwargs)
+        with lock:
+            link = cache_get(key)
+            if link is None:
+                return
+            new_weight = weigher(link[RESULT])
+            total_weight += new_weight - link[WEIGHT]
+            link[WEIGHT] = new_weight
+            results_holdout = _trim()
+        _evict(results_holdout)
+        del results_holdout
 
     wrapper.cache_hits = cache_hits
     wrapper.cache_misses = cache_misses
     wrapper.cache_size = cache_size
+    wrapper.cache_weight = cache_weight
     wrapper.is_cached = is_cached
+    wrapper.cached_results = cached_results
     wrapper.clear_cache = clear_cache
     wrapper.set_maxsize = set_maxsize
+    wrapper.set_max_weight = set_max_weight
+    wrapper.pin = pin
+    wrapper.unpin = unpin
+    wrapper.reweigh = reweigh
 
     return wrapper
 
 
+def auto_cache_budget(fraction: float = 0.5) -> Optional[int]:
+    """
+    Derive a memory budget (in bytes) for cached data units from the memory
+    currently available on the system, as reported by `/proc/meminfo`.
+
+    Returns None if the available memory could not be determined (i.e. we're
+    not running on Linux).
+    """
+    try:
+        with open("/proc/meminfo") as fp:
+            for line in fp:
+                # Formatted as "MemAvailable:   12345678 kB"
+                if line.startswith("MemAvailable:"):
+                    available_kb = int(line.split()[1])
+                    return int(available_kb * 1024 * fraction)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
 class DataManager:
     """
     Manages a CSV-based cohort and provides a cache of DataUnit objects for
@@ -201,15 +331,24 @@ class DataManager:
         case_data: List of row dictionaries loaded from CSV.
         data_unit_factory: The factory method for creating DataUnits from case entries
         cache_size: Maximum number of Data Unit objects held in memory at once.
+        cache_budget: Maximum memory (in bytes) the Data Units held in memory can use.
+        prefetch_next: Number of cases after the current one to pre-fetch.
+        prefetch_previous: Number of cases before the current one to pre-fetch.
     """
 
+    # How often (in milliseconds) the main thread checks on a running pre-fetch
+    PREFETCH_POLL_INTERVAL = 50
+
     def __init__(
         self,
         cohort_file: Optional[Path],
         data_source: Optional[Path],
         data_unit_factory: DataUnitFactory,
         reference_task: Optional[TaskBaseClass] = None,
-        cache_size: int = 2,
+        cache_size: Optional[int] = 2,
+        cache_budget: Optional[int] = None,
+        prefetch_next: int = 1,
+        prefetch_previous: int = 0,
     ):
         """
         Initialize DataManager with optional configuration and window size.
@@ -217,10 +356,23 @@ class DataManager:
         We employ limited caching to help streamline the task process; namely,
           the most recently used Data Units are kept in memory until they fall
           out of scope, allowing the user to return to them without needing to
-          load their data from file again.
-
-        # TODO Add pre-fetching as well.
+          load their data from file again. The cache can be limited by either
+          the number of units within it (`cache_size`), the total size of their
+          voxel data (`cache_budget`), or both. The currently selected unit is
+          never evicted, regardless of these limits.
+
+        We also pre-fetch the Data Units surrounding the current one in the
+          background, so that they are (ideally) already in the cache by the
+          time the user moves to them. As pre-fetched units share the cache,
+          it is widened to fit them if `cache_size` is too small to do so.
         """
+        # Whether we've been cleaned up already; set first, as `clean` runs
+        #  (via `__del__`) even if we fail partway through construction
+        self._cleaned: bool = False
+
+        # Make sure our pre-fetch window is valid
+        if prefetch_next < 0 or prefetch_previous < 0:
+            raise ValueError("Number of cases to pre-fetch cannot be negative!")
         # The cohort data, and the file from which it was pulled
         self.cohort_csv: Path = cohort_file
         self.data_source: Path = data_source
@@ -234,10 +386,30 @@ class DataManager:
         # Current index being tracked; -1 indicates one hasn't been selected yet
         self.current_case_index: int = -1
 
+        # Index of which cases were completed, for the task which built it
+        self._completion_task: Optional[TaskBaseClass] = None
+        self._completion_status: list[Optional[bool]] = list()
+        # Sorted indices of all cases which are not complete
+        self._incomplete_indices: list[int] = list()
+
+        # Pre-fetching window around the current case
+        self.prefetch_next: int = prefetch_next
+        self.prefetch_previous: int = prefetch_previous
+
+        # The cache needs to fit the current unit, the one we just left, and
+        #  all pre-fetched units, lest they evict one another
+        if cache_size is not None:
+            cache_size = max(cache_size, 2 + prefetch_next + prefetch_previous)
+
         # Convert the protected '_get_data_unit' into a public version,
-        #  w/ the desired number of cached elements.
+        #  w/ the desired number of cached elements and memory budget.
         self.get_data_unit: Callable[[int, dict], DataUnitBase] = dynamic_lru_cache_wrapper(
-            self._get_data_unit, maxsize=cache_size, n_hashing_vars=1
+            self._get_data_unit,
+            maxsize=cache_size,
+            n_hashing_vars=1,
+            max_weight=cache_budget,
+            weigher=self._unit_weight,
+            on_evict=self._evict_unit,
         )
 
         # The data unit factory to parse case information with
@@ -246,6 +418,14 @@ class DataManager:
         # Logger
         self.logger = logging.getLogger("CART Data Manager")
 
+        # Pre-fetching state; files are decoded by a single background worker,
+        #  with the resulting unit being built on the main thread once its done
+        self._prefetch_worker = BackgroundWorker(
+            self._poll_prefetch, "CARTPrefetch", self.PREFETCH_POLL_INTERVAL
+        )
+        self._prefetch_queue: list[int] = list()
+        self._prefetch_job: Optional[tuple[int, Optional[dict], Optional[Future]]] = None
+
         # Load the data from file
         self._load_from_file()
 
@@ -260,6 +440,16 @@ class DataManager:
                     break
         return return_list
 
+    @cached_property
+    def _uid_indices(self) -> dict[str, int]:
+        return {c.get("uid"): i for i, c in enumerate(self.case_data)}
+
+    def index_for_uid(self, uid: str) -> Optional[int]:
+        """
+        The index of the case with the given UID, or None if there isn't one.
+        """
+        return self._uid_indices.get(uid)
+
     @property
     def valid_features(self):
         return [f for f in self.feature_labels if f.lower() != "uid"]
@@ -295,18 +485,76 @@ class DataManager:
         current_case_data = self.case_data[idx]
 
         # TODO: replace this with a user-selectable data unit type
-        new_unit = self.data_unit_factory(
-            case_data=current_case_data,
-            data_path=self.data_source,
-            prior_data=prior_data,
-        )
+        # Batch the scene changes made while building it, so observers only react once
+        with timed("Build data unit"), batch_scene_updates():
+            new_unit = self.data_unit_factory(
+                case_data=current_case_data,
+                data_path=self.data_source,
+                prior_data=prior_data,
+            )
 
         # Validate the data unit (and thus before it enters the cache)
         new_unit.validate()
 
+        # If the unit is still loading, re-weigh it in the cache once it's done
+        if not new_unit.is_fully_loaded:
+            manager_ref = weakref.ref(self)
+            def _reweigh(__):
+                # Avoid the unit keeping us alive (and vice versa)
+                manager = manager_ref()
+                if manager is not None:
+                    manager.get_data_unit.reweigh(idx)
+            new_unit.when_fully_loaded(_reweigh)
+
         # Return the new data unit
         return new_unit
 
+    @staticmethod
+    def _unit_weight(unit: DataUnitBase) -> int:
+        # Weigh each unit in the cache by the memory its data occupies
+        return unit.memory_footprint()
+
+    def _evict_unit(self, unit: DataUnitBase):
+        """
+        Release a unit as soon as it falls out of our cache, returning its nodes
+        to the scene immediately rather than whenever it is garbage collected.
+
+        Unless we're being cleaned up (the job is closing), the unit gets to
+        spill any unsaved edits beforehand, so they survive being unloaded.
+        Units still being saved in the background are not spilled, as their
+        edits are already being written to disk.
+        """
+        save_pending = (
+            self.reference_task is not None
+            and unit.uid is not None
+            and self.reference_task.is_save_pending(unit.uid)
+        )
+        if not self._cleaned and not save_pending:
+            try:
+                unit.spill()
+            except Exception as e:
+                self.logger.warning(f"Failed to keep the unsaved edits for case '{unit.uid}': {e}")
+        try:
+            unit.release()
+        except Exception as e:
+            self.logger.warning(f"Failed to clean up evicted case '{unit.uid}': {e}")
+            return
+        self.logger.debug(f"Evicted case '{unit.uid}' from the cache.")
+
+    def _prior_data_for(self, idx: int) -> Optional[dict]:
+        # If we have no task to check for prior outputs, there's nothing to generate
+        if self.reference_task is None:
+            return None
+
+        # If we somehow lack a UID, raise an error
+        case_data = self.case_data[idx]
+        uid = case_data.get("uid")
+        if uid is None:
+            raise ValueError("Tried to get a data unit for a case without a UID!")
+
+        # Using the reference task, generate our prior data
+        return self.reference_task.generate_prior_data_for(case_data)
+
     def _unit_at(self, idx: int) -> Optional[DataUnitBase]:
         # If we have no task to check for prior outputs, delegate to `get_data_unit` directly
         if self.reference_task is None:
@@ -316,17 +564,8 @@ class DataManager:
         if self.get_data_unit.is_cached(idx):
             return self.get_data_unit(idx)
 
-        # If we somehow lack a UID, raise an error
-        case_data = self.case_data[idx]
-        uid = self.case_data[idx].get("uid")
-        if uid is None:
-            raise ValueError("Tried to get a data unit for a case without a UID!")
-
-        # Using the reference task, generate our prior data and build the corresponding data unit
-        prior_data = None
-        if self.reference_task is not None:
-            prior_data = self.reference_task.generate_prior_data_for(case_data)
-        return self.get_data_unit(idx, prior_data)
+        # Otherwise, build the data unit using any prior data for it
+        return self.get_data_unit(idx, self._prior_data_for(idx))
 
     def current_data_unit(self) -> DataUnitBase:
         """
@@ -350,6 +589,7 @@ class DataManager:
     def has_previous_case(self) -> bool:
         return self.current_case_index > 0
 
+    @traced()
     def select_unit_at(self, idx: int) -> DataUnitBase:
         """
         Update the current selection index + loaded data unit. This involves:
@@ -357,6 +597,8 @@ class DataManager:
         * Revoking focus to the previously selected data unit
         * Granting focus to the new data unit
         * Updating our currently selected index
+        * Pinning the new data unit in the cache, so it cannot be evicted
+        * Re-targeting our pre-fetching around the new index
 
         In that order; how the first steps are managed depends on the DataUnit's
          specific implementation.
@@ -367,17 +609,30 @@ class DataManager:
         elif idx >= len(self.case_data):
             raise ValueError("Index cannot be greater than the number of loaded cases.")
 
-        # Attempt to grab the next data unit and focus it
-        new_unit = self._unit_at(idx)
+        # Batch the scene changes made while switching units, so observers only react once
+        with timed("Select data unit"), batch_scene_updates():
+            # Attempt to grab the next data unit and focus it
+            new_unit = self._unit_at(idx)
 
-        # Try to transfer focus from the previous unit (if any) to our new one
-        if self.current_case_index != -1:
-            prior_unit = self.current_data_unit()
-            prior_unit.focus_lost()
-        new_unit.focus_gained()
+            # Try to transfer focus from the previous unit (if any) to our new one
+            if self.current_case_index != -1:
+                prior_unit = self.current_data_unit()
+                prior_unit.focus_lost()
+            new_unit.focus_gained()
 
-        # Set the current index to that of the new unit
+        # Set the current index to that of the new unit, moving its pin to match
+        prior_idx = self.current_case_index
         self.current_case_index = idx
+        self.get_data_unit.pin(idx)
+        if prior_idx != idx:
+            self.get_data_unit.unpin(prior_idx)
+
+        # Start pre-fetching the units around the new one
+        self._pre_fetch_elements()
+
+        # Report which units are still alive, to confirm evicted ones were freed
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self.live_unit_report())
 
         # Return the new unit
         return new_unit
@@ -407,15 +662,11 @@ class DataManager:
         if not from_idx:
             from_idx = self.current_case_index
 
-        # Step to the "next" case
-        idx = from_idx + 1
+        # Find the next incomplete case, if there is one
+        idx = self.next_incomplete_index(task, from_idx)
+        if idx is not None:
+            return self.select_unit_at(idx)
 
-        # Iterate until we run out of cases
-        while idx < len(self.case_data):
-            case = self.case_data[idx]
-            if not task.isTaskComplete(case):
-                return self.select_unit_at(idx)
-            idx += 1
         # Fallback; if all subsequent cases are completed, print a warning and return the
         # next case instead
         logging.warning("All cases were completed! Loaded next unit instead.")
@@ -450,15 +701,10 @@ class DataManager:
         elif from_idx == -1:
             from_idx = len(self.case_data)
 
-        # Step to the "previous" case
-        idx = from_idx - 1
-
-        # Iterate until we run out of cases
-        while idx > -1:
-            case = self.case_data[idx]
-            if not task.isTaskComplete(case):
-                return self.select_unit_at(idx)
-            idx -= 1
+        # Find the previous incomplete case, if there is one
+        idx = self.previous_incomplete_index(task, from_idx)
+        if idx is not None:
+            return self.select_unit_at(idx)
 
         # Fallback; if all prior cases are completed, print a warning and return the
         # previous case instead
@@ -482,6 +728,100 @@ class DataManager:
         # Wrapper function for the somewhat unintuitive "find the last" syntax
         return self.previous_incomplete(task, -1)
 
+    ## Completion Tracking ##
+    def build_completion_index(self, task: TaskBaseClass):
+        """
+        Build an index of which cases have been completed for the provided
+        task, querying it about every case at once.
+
+        Once built, checking whether a case is complete for this task
+        (including when skipping to incomplete cases) becomes a simple lookup.
+        Use `update_completion` to keep it in sync when a case's status may
+        have changed (i.e. after it was saved).
+        """
+        statuses = list(task.isTaskCompleteForCases(self.case_data))
+        if len(statuses) != len(self.case_data):
+            raise ValueError(
+                f"Task reported the completion status of {len(statuses)} cases; "
+                f"expected {len(self.case_data)}."
+            )
+        self._completion_task = task
+        self._completion_status = statuses
+        self._incomplete_indices = [i for i, s in enumerate(statuses) if not s]
+
+    def update_completion(self, idx: int) -> Optional[bool]:
+        """
+        Re-check whether the case at the given index is complete, updating
+        our completion index to match. Returns the case's new status.
+        """
+        # If we don't have an index to update, there's nothing to do
+        if self._completion_task is None:
+            return None
+
+        status = self._completion_task.isTaskComplete(self.case_data[idx])
+        self._completion_status[idx] = status
+
+        # Add or remove the case from our incomplete cases, keeping them sorted
+        pos = bisect_left(self._incomplete_indices, idx)
+        is_tracked = (
+            pos < len(self._incomplete_indices) and self._incomplete_indices[pos] == idx
+        )
+        if status and is_tracked:
+            del self._incomplete_indices[pos]
+        elif not status and not is_tracked:
+            self._incomplete_indices.insert(pos, idx)
+
+        return status
+
+    def is_case_completed(self, idx: int, task: TaskBaseClass) -> Optional[bool]:
+        # If our index was built for this task, just look the status up
+        if task is self._completion_task:
+            return self._completion_status[idx]
+        # Otherwise, ask the task directly
+        return task.isTaskComplete(self.case_data[idx])
+
+    def next_incomplete_index(self, task: TaskBaseClass, from_idx: int) -> Optional[int]:
+        """
+        The index of the first case after `from_idx` which hasn't been completed
+        for the provided task, or None if there isn't one. Selects nothing.
+        """
+        # If our index was built for this task, just look it up
+        if task is self._completion_task:
+            pos = bisect_right(self._incomplete_indices, from_idx)
+            if pos < len(self._incomplete_indices):
+                return self._incomplete_indices[pos]
+            return None
+
+        # Otherwise, iterate until we run out of cases
+        idx = from_idx + 1
+        while idx < len(self.case_data):
+            case = self.case_data[idx]
+            if not task.isTaskComplete(case):
+                return idx
+            idx += 1
+        return None
+
+    def previous_incomplete_index(self, task: TaskBaseClass, from_idx: int) -> Optional[int]:
+        """
+        The index of the last case before `from_idx` which hasn't been completed
+        for the provided task, or None if there isn't one. Selects nothing.
+        """
+        # If our index was built for this task, just look it up
+        if task is self._completion_task:
+            pos = bisect_left(self._incomplete_indices, from_idx)
+            if pos > 0:
+                return self._incomplete_indices[pos - 1]
+            return None
+
+        # Otherwise, iterate until we run out of cases
+        idx = from_idx - 1
+        while idx > -1:
+            case = self.case_data[idx]
+            if not task.isTaskComplete(case):
+                return idx
+            idx -= 1
+        return None
+
     # TODO Change rows to rows and define row typing at the definition of rows
     @staticmethod
     def _validate_columns(rows: list[dict[str, str]]) -> None:
@@ -507,25 +847,218 @@ class DataManager:
         if duplicates:
             raise ValueError(f"Duplicate uid values found in file: {duplicates}")
 
+    ## Pre-Fetching ##
+    def _prefetch_targets(self) -> list[int]:
+        """
+        The indices of the cases which should be pre-fetched around the current
+        one, nearest first, skipping over those which are already cached.
+        """
+        targets = []
+        for offset in range(1, max(self.prefetch_next, self.prefetch_previous) + 1):
+            if offset <= self.prefetch_next:
+                targets.append(self.current_case_index + offset)
+            if offset <= self.prefetch_previous:
+                targets.append(self.current_case_index - offset)
+        return [
+            i for i in targets
+            if 0 <= i < len(self.case_data) and not self.get_data_unit.is_cached(i)
+        ]
+
     def _pre_fetch_elements(self):
         """
-        Rebuild the cache of pre-fetched DataUnits.
+        Rebuild the queue of pre-fetched DataUnits around the current case.
 
-        Run via `async` in the background, allowing the user to continue
-          completing their tasks while pre-fetching is run.
+        Any pre-fetch already running for a case that is no longer a target
+          is cancelled. Files are read and decoded on a background thread;
+          once that's done, `_poll_prefetch` builds the data unit itself (and
+          its MRML nodes) on the main thread, placing it into our cache.
         """
-        # TODO
-        pass
+        targets = self._prefetch_targets()
+
+        # Let the running pre-fetch finish if we still want it; otherwise cancel it
+        if self._prefetch_job is not None:
+            running_idx = self._prefetch_job[0]
+            if running_idx in targets:
+                targets.remove(running_idx)
+            else:
+                self._cancel_prefetch_job()
+
+        # Replace the queue with our new targets and start working on them
+        self._prefetch_queue = targets
+        self._submit_next_prefetch()
+
+    def _submit_next_prefetch(self):
+        # Only run one pre-fetch at a time, to avoid hogging the disk
+        if self._prefetch_job is not None:
+            return
+
+        prefetch = getattr(self.data_unit_factory, "prefetch", None)
+        while self._prefetch_queue:
+            idx = self._prefetch_queue.pop(0)
+            # Skip cases which were loaded since they were queued
+            if self.get_data_unit.is_cached(idx):
+                continue
+            try:
+                prior_data = self._prior_data_for(idx)
+            except Exception as e:
+                self.logger.warning(f"Skipped pre-fetching case {idx}: {e}")
+                continue
+            # Decode the case's files in the background, if the factory supports it
+            future = None
+            if prefetch is not None:
+                future = self._prefetch_worker.submit(
+                    prefetch, self.case_data[idx], self.data_source, prior_data
+                )
+            self._prefetch_job = (idx, prior_data, future)
+            self._prefetch_worker.start_polling()
+            return
+
+        # If we ran out of cases to pre-fetch, stop checking in
+        self._prefetch_worker.stop_polling()
+
+    def _poll_prefetch(self):
+        """
+        Run periodically on the main thread while a pre-fetch is in progress.
+        Once its files have been decoded, builds the corresponding data unit.
+        """
+        # If there's nothing running, stop checking in
+        if self._prefetch_job is None:
+            self._prefetch_worker.stop_polling()
+            return
+
+        # If the background work is still running, check back later
+        idx, prior_data, future = self._prefetch_job
+        if future is not None and not future.done():
+            return
+        self._prefetch_job = None
+
+        handle = None
+        try:
+            if future is not None:
+                handle = future.result()
+            # Start decoding the next case while we build this one
+            self._submit_next_prefetch()
+            # Build the data unit, unless the user loaded it in the meantime
+            if not self.get_data_unit.is_cached(idx):
+                with batch_scene_updates():
+                    new_unit = self.get_data_unit(idx, prior_data)
+                    # Keep it hidden until the user actually selects it
+                    new_unit.focus_lost()
+                self.logger.debug(f"Pre-fetched case {idx}.")
+        except Exception as e:
+            self.logger.warning(f"Failed to pre-fetch case {idx}: {e}")
+        finally:
+            # Drop anything which was decoded, but not used
+            self._discard_prefetched(handle)
+
+        # Proceed to the next case, if we didn't already
+        self._submit_next_prefetch()
+
+    def _cancel_prefetch_job(self):
+        # If nothing is running, there's nothing to cancel
+        if self._prefetch_job is None:
+            return
+        future = self._prefetch_job[2]
+        self._prefetch_job = None
+
+        # If the background work hasn't started yet, we can just cancel it
+        if future is None or future.cancel():
+            return
+
+        # Otherwise, discard whatever it produces once it finishes
+        def _on_done(f: Future):
+            if f.cancelled() or f.exception() is not None:
+                return
+            self._discard_prefetched(f.result())
+
+        future.add_done_callback(_on_done)
+
+    def _discard_prefetched(self, handle: Any):
+        discard = getattr(self.data_unit_factory, "discard_prefetched", None)
+        if discard is not None and handle is not None:
+            discard(handle)
+
+    def cancel_prefetch(self):
+        """
+        Cancel all pending pre-fetches, dropping anything they had prepared.
+
+        Pre-fetching resumes the next time a unit is selected, or once
+         `resume_prefetch` is called.
+        """
+        self._prefetch_queue.clear()
+        self._cancel_prefetch_job()
+        self._prefetch_worker.stop_polling()
+
+    def resume_prefetch(self):
+        """
+        Restart pre-fetching around the current case (i.e. after
+         `cancel_prefetch`, if we ended up staying on it after all).
+        """
+        if self.current_case_index == -1:
+            return
+        self._pre_fetch_elements()
+
+    ## Diagnostics ##
+    def live_unit_report(self) -> str:
+        """
+        Summarize every data unit which is still alive, alongside how many MRML
+        nodes each still manages. Units which were released (i.e. evicted from
+        our cache) should disappear from this report shortly after; if they
+        linger, something is still referencing them.
+        """
+        cached = {id(u) for u in self.get_data_unit.cached_results()}
+        current_unit = None
+        if self.current_case_index != -1 and self.get_data_unit.is_cached(self.current_case_index):
+            current_unit = self.current_data_unit()
+
+        lines = []
+        n_lingering = 0
+        for unit in live_units():
+            if unit is current_unit:
+                state = "current"
+            elif id(unit) in cached:
+                state = "cached"
+            elif unit.is_released:
+                state = "released, but still referenced"
+                n_lingering += 1
+            else:
+                # Most likely held by another data manager
+                state = "not cached"
+            lines.append(
+                f"  {unit.uid} ({type(unit).__name__}, {state}): "
+                f"{unit.node_count()} nodes, {unit.memory_footprint() / 1024 ** 2:.1f} MiB"
+            )
+
+        header = (
+            f"{len(lines)} live data units "
+            f"({len(cached)} cached, {n_lingering} released but still referenced)"
+        )
+        return "\n".join([header, *lines])
 
     ## Cleanup ##
     def clean(self):
         """
-        Explicitly delete the cache right before deletion.
+        Explicitly delete the cache right before deletion, releasing every
+         unit within it.
 
         This is in case the data inside references the DataManager (or one of its
          components), forming a cyclical reference that results in a memory leak
         """
-        del self.get_data_unit
+        # Only clean up once
+        if self._cleaned:
+            return
+        self._cleaned = True
+
+        # If construction failed partway through, only clean up what was set up
+        if hasattr(self, "_prefetch_worker"):
+            # Stop pre-fetching, and shut down the worker doing so
+            self.cancel_prefetch()
+            self._prefetch_worker.shutdown(wait=False)
+
+        # Release every unit we have cached, including the current one
+        if hasattr(self, "get_data_unit"):
+            self.get_data_unit.clear_cache()
+            del self.get_data_unit
 
     def __del__(self):
         self.clean()
@@ -1,6 +1,7 @@
+import weakref
 from abc import abstractmethod, ABC
 from pathlib import Path
-from typing import Any, Mapping, Optional, Protocol, TYPE_CHECKING
+from typing import Any, Callable, Mapping, Optional, Protocol, TYPE_CHECKING
 
 import slicer
 from slicer.i18n import tr as _
@@ -73,6 +74,10 @@ class ResourceType(Protocol):
         return None
 
 
+# Every data unit which has yet to be garbage collected; see `live_units`
+_LIVE_UNITS: "weakref.WeakSet[DataUnitBase]" = weakref.WeakSet()
+
+
 class DataUnitBase(ABC):
 
     def __init__(
@@ -109,6 +114,16 @@ class DataUnitBase(ABC):
         # as it has MRML nodes, it needs to be cleaned up on a per-unit basis.
         self._layout_handler: Optional[LayoutHandler] = None
 
+        # Whether all of this unit's resources have been loaded; see `when_fully_loaded`
+        self._fully_loaded: bool = True
+        self._fully_loaded_callbacks: list[Callable[["DataUnitBase"], None]] = list()
+
+        # Whether this unit has been released; see `release`
+        self._released: bool = False
+
+        # Track this unit until it is garbage collected, for debugging leaks
+        _LIVE_UNITS.add(self)
+
     ## Abstract Methods ##
     @abstractmethod
     def to_dict(self) -> dict:
@@ -177,15 +192,139 @@ class DataUnitBase(ABC):
         # If we have a layout handler, have it clean up after itself
         if self._layout_handler:
             self.layout_handler.clean()
+            self._layout_handler = None
+
+    def spill(self):
+        """
+        Called when this unit is unloaded from memory (falls out of the
+         DataManager's cache) to make way for other cases, right before it is
+         released.
+
+        You should preserve any unsaved changes (i.e. edits made with autosave
+         disabled) somewhere they can be restored from the next time this case
+         is loaded. By default, does nothing.
+        """
+        pass
+
+    def release(self):
+        """
+        Clean up this data unit, if it has not been already. Called by the
+        DataManager as soon as the unit falls out of its cache, rather than
+        relying on it being garbage collected (which reference cycles, i.e.
+        through Qt widgets, can delay indefinitely).
+
+        Unlike `clean`, this is safe to call more than once; you should
+        override `clean` instead of this.
+        """
+        if self._released:
+            return
+        self._released = True
+        self.clean()
+
+    @property
+    def is_released(self) -> bool:
+        """
+        Whether this unit has been released (see `release`); its data should
+         no longer be used if so.
+        """
+        return self._released
+
+    def memory_footprint(self) -> int:
+        """
+        The (approximate) amount of memory, in bytes, this data unit's data
+         occupies. Used to decide when cached units should be unloaded.
+
+        By default, returns 0 (the unit is "free"); you should override this
+         if your data unit manages anything sizeable.
+        """
+        return 0
+
+    def node_count(self) -> int:
+        """
+        The number of MRML nodes this data unit currently manages. Used to
+         confirm that units release their nodes once they are evicted.
+
+        By default, returns 0; you should override this if your data unit
+         manages any nodes.
+        """
+        return 0
+
+    ## Progressive Loading ##
+    @property
+    def is_fully_loaded(self) -> bool:
+        """
+        Whether every resource managed by this unit has been loaded. Units which
+         load progressively may be placed into focus before this is the case.
+        """
+        return self._fully_loaded
+
+    def when_fully_loaded(self, callback: Callable[["DataUnitBase"], None]):
+        """
+        Run the callback (with this unit as its argument) once every resource
+         managed by this unit has been loaded; immediately, if it already has.
+
+        Tasks should use this to hold off on anything which requires the unit's
+         complete contents (i.e. editing a segmentation) until they're present.
+        """
+        if self._fully_loaded:
+            callback(self)
+        else:
+            self._fully_loaded_callbacks.append(callback)
+
+    def _mark_fully_loaded(self):
+        """
+        Mark this unit as being fully loaded, notifying everything waiting on it.
+         Subclasses which load progressively should set `_fully_loaded` to
+         False in their constructor, and call this once they're done.
+        """
+        self._fully_loaded = True
+        callbacks, self._fully_loaded_callbacks = self._fully_loaded_callbacks, list()
+        for callback in callbacks:
+            callback(self)
+
+    ## Pre-Fetching ##
+    @classmethod
+    def prefetch(
+        cls, case_data: dict[str, str], data_path: Path, prior_data: dict = None
+    ) -> Any:
+        """
+        Called from a BACKGROUND THREAD before a unit for this case is created,
+         allowing it to read and decode any files it will need ahead of time.
+
+        You MUST NOT interact with the MRML scene (or any other Qt/Slicer
+         object) here; just prepare the data such that the constructor can
+         build its nodes from it quickly on the main thread afterward.
+
+        Returns a "handle" to the prepared data, which is passed to
+         `discard_prefetched` once the unit has been built (or the pre-fetch
+         was cancelled). By default, does nothing.
+        """
+        return None
+
+    @classmethod
+    def discard_prefetched(cls, handle: Any):
+        """
+        Release any pre-fetched data (see `prefetch`) which was not used
+         during the construction of a data unit. By default, does nothing.
+        """
+        pass
 
     ## Dunder Methods ##
     def __del__(self):
-        # When the object is garbage collected, run cleaning first
-        self.clean()
+        # When the object is garbage collected, run cleaning first (if it wasn't already)
+        self.release()
 
     def __delete__(self, instance):
-        # When the object is explicitly deleted, run cleaning first
-        self.clean()
+        # When the object is explicitly deleted, run cleaning first (if it wasn't already)
+        self.release()
+
+
+def live_units() -> list[DataUnitBase]:
+    """
+    Every data unit which has not yet been garbage collected, including those
+    which were released, but are still referenced by something.
+    """
+    return list(_LIVE_UNITS)
 
 
 class DataUnitFactory(Protocol):
@@ -17,6 +17,12 @@ import qt
 import slicer
 from slicer.i18n import tr as _
 
+from CARTLib.utils.timing import traced
+
+# These become available when Slicer initializes
+# noinspection PyUnresolvedReferences
+import vtk
+
 
 ## Orientation Helpers ##
 class Orientation(Flag):
@@ -128,6 +134,10 @@ def lookup_color(idx: int) -> tuple[int, int, int]:
 
 ## Viewer Layout Management ##
 class LayoutHandler:
+    # Geometry of the primary volume Slicer's views were last fit to; shared, as
+    # every handler lays out the same set of views
+    _fitted_geometry: Optional[tuple] = None
+
     def __init__(
         self,
         volume_nodes: list[slicer.vtkMRMLVolumeNode],
@@ -259,53 +269,44 @@ class LayoutHandler:
         self.orientation = other_handler.orientation
         self.horizontal_volumes = other_handler.horizontal_volumes
 
+    @property
+    def signature(self) -> tuple[int, Orientation, bool]:
+        """
+        The structure of this handler's layout; the number of volumes, the
+        orientations shown, and whether volumes are laid out horizontally.
+        Handlers with the same signature produce identical viewer layouts,
+        differing only in which volumes their views display.
+        """
+        return len(self.tracked_volumes), self.orientation, self.horizontal_volumes
+
     def rebuild_layout(self):
         # If we don't have any tracked volumes yet, raise an error
         if not self.tracked_volumes:
             raise ValueError("This layout manager has no volumes to lay out!")
 
-        # Determine how we will lay out our volumes (and each of their views)
-        volume_layout = "horizontal" if self.horizontal_volumes else "vertical"
-        orientation_layout = "horizontal" if self.vertical_volumes else "vertical"
-
-        # Begin building the layout XML
-        layout_xml = f'<layout type="{volume_layout}">'
-
-        # Reset our volume name map, as we are about to rebuild it
-        self._view_name_map = dict()
-
-        # Keep track of a color index interator to update through these loops
-        color_idx = 1
-        for v in self.tracked_volumes:
-            # Add a sub-layout for each volume node's orientations
-            layout_xml += f' <item> <layout type="{orientation_layout}">\n'
-            for o in self.orientation:
-                # Set up our parameters to build the XML entry
-                ori = o.slicer_node_label()
-                name = f"{v.GetName()}--{ori}"
-                color = layout_color(color_idx)
-                color_idx += 1
+        # Get the (shared) layout for our signature
+        layout_xml, view_entries = _build_layout_xml(*self.signature)
 
-                # Generate the corresponding XML entry and add it to our overall schema
-                layout_xml += self._build_viewer_entry(name, ori, color)
-
-                # Add the corresponding entry to our value name map
-                self._view_name_map[name] = (v, ori)
-
-            # Close the sub-layout
-            layout_xml += "</layout></item>\n"
-
-        # Close the layout
-        layout_xml += "</layout>"
+        # Map each view to the volume and orientation it should display
+        self._view_name_map = {
+            name: (self.tracked_volumes[vol_idx], ori)
+            for name, vol_idx, ori in view_entries
+        }
 
         # Track it for later
         self._layout = layout_xml
 
+    @traced()
     def apply_layout(self):
         """
         Apply the current layout to the scene. Should be called when a given GUI needs
         to bring itself back into focus.
 
+        If the viewers are already arranged in this layout (i.e. the prior case had
+        the same signature), they are kept as-is, with only the volumes they
+        display being swapped out. Likewise, views are only re-fit when the
+        geometry of the primary volume differs from the one they were last fit to.
+
         TODO: Figure out a way that doesn't assume our desired layout node will be the
          first in the list of layout nodes within the MRML scene
         """
@@ -313,20 +314,33 @@ class LayoutHandler:
         if not self._layout:
             self.rebuild_layout()
 
-        # Apply our layout XML to the current scene
+        # Apply our layout XML to the current scene, unless it's already in place
         layout_node = slicer.util.getNode("*LayoutNode*")
-        if layout_node.IsLayoutDescription(layout_node.SlicerLayoutUserView):
-            layout_node.SetLayoutDescription(
-                layout_node.SlicerLayoutUserView, self.layout
-            )
-        else:
-            layout_node.AddLayoutDescription(
-                layout_node.SlicerLayoutUserView, self.layout
-            )
-        layout_node.SetViewArrangement(layout_node.SlicerLayoutUserView)
+        user_view = layout_node.SlicerLayoutUserView
+        is_applied = (
+            layout_node.GetViewArrangement() == user_view
+            and layout_node.IsLayoutDescription(user_view)
+            and layout_node.GetLayoutDescription(user_view) == self.layout
+        )
+        if not is_applied:
+            if layout_node.IsLayoutDescription(user_view):
+                layout_node.SetLayoutDescription(user_view, self.layout)
+            else:
+                layout_node.AddLayoutDescription(user_view, self.layout)
+            layout_node.SetViewArrangement(user_view)
 
-        # Have slicer process the new layout XML
-        slicer.app.processEvents()
+            # Have slicer process the new layout XML
+            slicer.app.processEvents()
+
+            # The views are new, and will need to be fit to their contents
+            LayoutHandler._fitted_geometry = None
+
+        # Only re-fit the views if they haven't been fit to this geometry already
+        rotation_geometry = _volume_geometry(self.primary_volume_node)
+        should_fit = (
+            rotation_geometry is None
+            or rotation_geometry != LayoutHandler._fitted_geometry
+        )
 
         # Build up our slice nodes for each of the views we have in our layout.
         layout_manager = slicer.app.layoutManager()
@@ -356,12 +370,16 @@ class LayoutHandler:
             # Get the slice node which manages the slice the widget views
             slice_node = slice_widget.mrmlSliceNode()
 
+            # Label the view after the volume it's showing
+            slice_node.SetLayoutLabel(f"{vol_node.GetName()}--{ori}")
+
             # Ensure it matches its associated volume's orientation and rotation.
-            slice_node.SetOrientation(ori)
-            # Use the volume for rotation, not the orientation
-            rotation_volume = self.primary_volume_node or vol_node
-            slice_node.RotateToVolumePlane(rotation_volume)
-            slice_widget.fitSliceToBackground()
+            if should_fit:
+                slice_node.SetOrientation(ori)
+                # Use the volume for rotation, not the orientation
+                rotation_volume = self.primary_volume_node or vol_node
+                slice_node.RotateToVolumePlane(rotation_volume)
+                slice_widget.fitSliceToBackground()
 
             # Link the node's together, so moving one moves the rest
             composite_node.SetLinkedControl(True)
@@ -369,24 +387,95 @@ class LayoutHandler:
             # Track the slice node for later
             self._slice_node_map[layout_name] = slice_node
 
+        if should_fit:
+            LayoutHandler._fitted_geometry = rotation_geometry
+
         # Snap everything to IJK
         snap_all_to_ijk()
 
-    ## XML Helpers ##
-    def _build_viewer_entry(self, name: str, orientation: str, color: str):
-        return f"""
-        <item><view class="vtkMRMLSliceNode" singletontag="{name}">
-            <property name="orientation" action="default">{orientation}</property>
-            <property name="viewlabel" action="default">{name}</property>
-            <property name="viewcolor" action="default">{color}</property>
-        </view></item>
-        """
-
     ## Memory Handling
     def clean(self):
-        # Clear all slice nodes from the MRML scene
-        for n in self._slice_node_map.values():
-            slicer.mrmlScene.RemoveNode(n)
+        # Our views are shared with every other handler with the same signature
+        # (and managed by Slicer's layout manager), so just forget about them
+        self._slice_node_map = dict()
+        # Drop our references to the unit's volumes too, so they can be freed
+        self._tracked_volumes = list()
+        self._primary_volume_node = None
+        self._view_name_map = None
+        self._layout = None
+
+
+## Layout Reuse ##
+def _build_viewer_entry(name: str, orientation: str, color: str):
+    return f"""
+    <item><view class="vtkMRMLSliceNode" singletontag="{name}">
+        <property name="orientation" action="default">{orientation}</property>
+        <property name="viewlabel" action="default">{name}</property>
+        <property name="viewcolor" action="default">{color}</property>
+    </view></item>
+    """
+
+
+@cache
+def _build_layout_xml(
+    n_volumes: int, orientation: Orientation, horizontal_volumes: bool
+) -> tuple[str, tuple[tuple[str, int, str], ...]]:
+    """
+    Build the layout XML for a given layout signature (see `LayoutHandler.signature`).
+
+    Views are named after their position in the layout rather than the volume they
+    show, allowing them to be re-used by any layout with the same signature.
+
+    Cached, as only a handful of distinct signatures are used in practice.
+
+    :return: The layout XML, alongside a (name, volume index, orientation) entry for
+        each view within it.
+    """
+    # Determine how we will lay out our volumes (and each of their views)
+    volume_layout = "horizontal" if horizontal_volumes else "vertical"
+    orientation_layout = "vertical" if horizontal_volumes else "horizontal"
+
+    # Begin building the layout XML
+    layout_xml = f'<layout type="{volume_layout}">'
+    view_entries = []
+
+    # Keep track of a color index interator to update through these loops
+    color_idx = 1
+    for vol_idx in range(n_volumes):
+        # Add a sub-layout for each volume node's orientations
+        layout_xml += f' <item> <layout type="{orientation_layout}">\n'
+        for o in orientation:
+            # Set up our parameters to build the XML entry
+            ori = o.slicer_node_label()
+            name = f"CART-{vol_idx + 1}--{ori}"
+            color = layout_color(color_idx)
+            color_idx += 1
+
+            # Generate the corresponding XML entry and add it to our overall schema
+            layout_xml += _build_viewer_entry(name, ori, color)
+
+            # Track which volume and orientation this view is for
+            view_entries.append((name, vol_idx, ori))
+
+        # Close the sub-layout
+        layout_xml += "</layout></item>\n"
+
+    # Close the layout
+    layout_xml += "</layout>"
+
+    return layout_xml, tuple(view_entries)
+
+
+def _volume_geometry(volume_node) -> Optional[tuple]:
+    # The dimensions and IJK -> RAS matrix of a volume; None if it has no image
+    if volume_node is None or volume_node.GetImageData() is None:
+        return None
+    ijk_to_ras = vtk.vtkMatrix4x4()
+    volume_node.GetIJKToRASMatrix(ijk_to_ras)
+    return (
+        volume_node.GetImageData().GetDimensions(),
+        tuple([ijk_to_ras.GetElement(i, j) for i in range(4) for j in range(4)]),
+    )
 
 
 ## Layout GUI ##
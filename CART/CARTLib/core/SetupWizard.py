@@ -7,14 +7,15 @@ from slicer.i18n import tr as _
 
 from CARTLib.utils import CART_PATH
 from CARTLib.utils.cohort import (
-    cohort_from_generator,
     CohortTableWidget,
     CohortEditorDialog,
     NewCohortDialog,
     CohortModel,
 )
 from CARTLib.utils.config import JobProfileConfig, MasterProfileConfig, DictBackedConfig
+from CARTLib.utils.data import VOXEL_CACHE
 from CARTLib.utils.task import CART_TASK_REGISTRY
+from CARTLib.utils.voxel_cache import VoxelDiskCache
 from CARTLib.utils.widgets import CARTPathLineEdit
 
 if TYPE_CHECKING:
@@ -436,6 +437,56 @@ class _ProfileWizardPage(qt.QWizardPage):
         skipToIncompleteLabel.setToolTip(skipToIncompleteToolTip)
         toggleLayout.addRow(skipToIncompleteCheckBox, skipToIncompleteLabel)
 
+        # Display cases progressively
+        progressiveLoadingCheckBox = qt.QCheckBox()
+        progressiveLoadingLabel = qt.QLabel(_("Show Cases Before They Finish Loading"))
+        progressiveLoadingToolTip = _(
+            "When toggled, CART will display each case as soon as its reference volume "
+            "has loaded, adding its other volumes, segmentations, and markups as they "
+            "become available. Only supported by some tasks (i.e. Segmentation), which "
+            "may prevent editing until loading finishes."
+        )
+        progressiveLoadingCheckBox.setToolTip(progressiveLoadingToolTip)
+        progressiveLoadingLabel.setToolTip(progressiveLoadingToolTip)
+        toggleLayout.addRow(progressiveLoadingCheckBox, progressiveLoadingLabel)
+
+        ### Decoded Volume Cache ###
+        voxelCacheCheckBox = qt.QCheckBox()
+        voxelCacheLabel = qt.QLabel(_("Cache Decoded Volumes on Disk"))
+        voxelCacheToolTip = _(
+            "When toggled, CART will keep an uncompressed copy of each volume it loads "
+            "in the folder below, allowing it to be loaded much faster the next time it is "
+            "used. Copies are discarded automatically when the original file changes, or "
+            "when the cache grows larger than the size limit below."
+        )
+        voxelCacheCheckBox.setToolTip(voxelCacheToolTip)
+        voxelCacheLabel.setToolTip(voxelCacheToolTip)
+        toggleLayout.addRow(voxelCacheCheckBox, voxelCacheLabel)
+
+        # Where the cache should be placed
+        voxelCacheDirLabel = qt.QLabel(_("Cache Folder:"))
+        voxelCacheDirEntry: CARTPathLineEdit = CARTPathLineEdit()
+        voxelCacheDirEntry.filters = ctk.ctkPathLineEdit.Dirs
+        voxelCacheDirEntry.setPlaceholderText(
+            _("A scratch folder with plenty of free space, ideally on a fast drive.")
+        )
+        voxelCacheDirLabel.setBuddy(voxelCacheDirEntry)
+        layout.addRow(voxelCacheDirLabel, voxelCacheDirEntry)
+
+        # How large it can get, and a button to clear it
+        voxelCacheSizeLabel = qt.QLabel(_("Cache Size Limit:"))
+        voxelCacheSizeWidget = qt.QWidget(None)
+        voxelCacheSizeLayout = qt.QHBoxLayout(voxelCacheSizeWidget)
+        voxelCacheSizeLayout.setContentsMargins(0, 0, 0, 0)
+        voxelCacheSizeSpinBox = qt.QSpinBox()
+        voxelCacheSizeSpinBox.setRange(1, 10000)
+        voxelCacheSizeSpinBox.setSuffix(" GB")
+        voxelCacheSizeLayout.addWidget(voxelCacheSizeSpinBox, 1)
+        clearVoxelCacheButton = qt.QPushButton(_("Clear Cache"))
+        voxelCacheSizeLayout.addWidget(clearVoxelCacheButton)
+        voxelCacheSizeLabel.setBuddy(voxelCacheSizeSpinBox)
+        layout.addRow(voxelCacheSizeLabel, voxelCacheSizeWidget)
+
         ## CONNECTIONS ##
         @qt.Slot(str)
         def authorNameChanged(new_author: str):
@@ -467,6 +518,51 @@ class _ProfileWizardPage(qt.QWizardPage):
             config.skip_to_first_incomplete = skipToIncompleteCheckBox.isChecked()
         skipToIncompleteCheckBox.toggled.connect(skipIncompleteOutputToggled)
 
+        @qt.Slot()
+        def progressiveLoadingToggled():
+            config.progressive_loading = progressiveLoadingCheckBox.isChecked()
+        progressiveLoadingCheckBox.toggled.connect(progressiveLoadingToggled)
+
+        def syncVoxelCacheWidgets():
+            # Only allow the cache to be configured while it is enabled
+            is_enabled = voxelCacheCheckBox.isChecked()
+            voxelCacheDirEntry.setEnabled(is_enabled)
+            voxelCacheSizeSpinBox.setEnabled(is_enabled)
+            clearVoxelCacheButton.setEnabled(config.voxel_cache_dir is not None)
+
+        @qt.Slot()
+        def voxelCacheToggled():
+            # An empty cache directory disables the cache
+            cache_dir = voxelCacheDirEntry.currentPath
+            if voxelCacheCheckBox.isChecked() and cache_dir:
+                config.voxel_cache_dir = Path(cache_dir)
+            else:
+                config.voxel_cache_dir = None
+            syncVoxelCacheWidgets()
+        voxelCacheCheckBox.toggled.connect(voxelCacheToggled)
+        voxelCacheDirEntry.textChanged.connect(voxelCacheToggled)
+
+        @qt.Slot(int)
+        def voxelCacheSizeChanged(new_size: int):
+            config.voxel_cache_budget = new_size * 1024 ** 3
+        voxelCacheSizeSpinBox.valueChanged.connect(voxelCacheSizeChanged)
+
+        @qt.Slot()
+        def clearVoxelCache():
+            cache_dir = config.voxel_cache_dir
+            if cache_dir is None:
+                return
+            # Go through the live cache if it's the one in use, so we respect its lock
+            #  (and don't delete entries being written by pre-fetching, etc.)
+            if VOXEL_CACHE.root is not None and VOXEL_CACHE.root.resolve() == Path(cache_dir).resolve():
+                VOXEL_CACHE.clear()
+            else:
+                VoxelDiskCache(cache_dir, config.voxel_cache_budget).clear()
+            qt.QMessageBox.information(
+                self, _("Cache Cleared"), _("The decoded volume cache has been cleared.")
+            )
+        clearVoxelCacheButton.clicked.connect(clearVoxelCache)
+
         ## SYNC ##
         if (author := config.author) is not None:
             authorLineEdit.setText(author)
@@ -475,6 +571,15 @@ class _ProfileWizardPage(qt.QWizardPage):
         autoSaveCheckBox.setChecked(config.autosave_on_switch)
         loadPreviousOutputsCheckBox.setChecked(config.load_previous_outputs)
         skipToIncompleteCheckBox.setChecked(config.skip_to_first_incomplete)
+        progressiveLoadingCheckBox.setChecked(config.progressive_loading)
+        voxelCacheSizeSpinBox.setValue(max(1, config.voxel_cache_budget // 1024 ** 3))
+        if (voxel_cache_dir := config.voxel_cache_dir) is not None:
+            # Block the toggle's signal, lest it disable the cache before the folder is filled in
+            voxelCacheCheckBox.blockSignals(True)
+            voxelCacheCheckBox.setChecked(True)
+            voxelCacheCheckBox.blockSignals(False)
+            voxelCacheDirEntry.currentPath = str(voxel_cache_dir)
+        syncVoxelCacheWidgets()
 
     ## Fields/Properties ##
     @property
@@ -961,17 +1066,14 @@ class _DataSelectionPage(qt.QWizardPage):
         """
         Walk the user through the creation of a new cohort file from scratch
         """
-        # Prompt the user for the new cohort file's specifications
+        # Prompt the user for the new cohort file's specifications; the dialog
+        #  generates the backing cohort (and its associated files) itself
         dialog = NewCohortDialog(self.data_path)
 
         # If the user backs out or cancels, end here
         if not dialog.exec():
             return
-
-        # Create the backing cohort (and its associated files)
-        cohort = cohort_from_generator(
-            dialog.cohort_file, self.data_path, dialog.current_generator
-        )
+        cohort = dialog.cohort
         # Immediately disconnect all of its signals to avoid a memory leak
         cohort.disconnectChangeEvents()
 
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar
+from typing import Callable, Generic, Optional, TypeVar
 
 import qt
 from slicer.i18n import tr as _
@@ -30,6 +30,10 @@ class TaskBaseClass(ABC, Generic[D]):
     itself.!
     """
 
+    # Called with a case's UID (and the error it failed with, if any) when a
+    # background save for it finishes; set by CART
+    save_finished_callback: Optional[Callable[[str, Optional[Exception]], None]] = None
+
     def __init__(
         self,
         master_profile: MasterProfileConfig,
@@ -205,6 +209,48 @@ class TaskBaseClass(ABC, Generic[D]):
         """
         return None
 
+    def isTaskCompleteForCases(
+        self, cases: list[dict[str, str]]
+    ) -> list[Optional[bool]]:
+        """
+        Bulk version of `isTaskComplete`, checking every case in the cohort
+        at once. Should return one result per case, in the same order, with
+        each matching what `isTaskComplete` would return for it.
+
+        This is run once when a job is loaded to build CART's index of which
+        cases are complete; afterward, only cases which were just saved are
+        re-checked (via `isTaskComplete`).
+
+        By default, just checks each case in turn. Override this if your task
+        can answer more efficiently in bulk (i.e. by listing its output
+        directory once, rather than checking for each file individually).
+        """
+        return [self.isTaskComplete(c) for c in cases]
+
+    def is_save_pending(self, uid: str) -> bool:
+        """
+        Whether a save for the case with the given UID is still running in
+        the background.
+
+        If your task writes its outputs in the background (rather than within
+        `save` itself), return True here until it has finished; CART will then
+        wait until you call `notify_save_finished` to check whether the case
+        was completed and report the result to the user.
+
+        By default, tasks save synchronously, so this is always False.
+        """
+        return False
+
+    def notify_save_finished(self, uid: str, error: Optional[Exception] = None):
+        """
+        Notify CART that a background save for the case with the given UID
+        has finished, successfully or otherwise. If it failed, provide the
+        error it failed with, so it can be reported to the user. Must be
+        called from the main thread!
+        """
+        if self.save_finished_callback is not None:
+            self.save_finished_callback(uid, error)
+
     def cleanup(self):
         """
         Called when the task is destroyed (Slicer was closed, a new task was loaded, etc.).
@@ -1,10 +1,11 @@
-import csv
 import json
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
 
 from CARTLib.utils.config import JobProfileConfig
+from CARTLib.utils.journal import CSVJournal
+from CARTLib.utils.timing import traced
 
 from GenericClassificationUnit import GenericClassificationUnit
 
@@ -55,6 +56,14 @@ class GenericClassificationOutputManager:
         """
         return self.output_dir / f"cart_classifications.csv"
 
+    @cached_property
+    def csv_journal(self) -> CSVJournal:
+        """
+        Append-only journal backing the CSV data file; new entries are written
+        here, being periodically folded back into the CSV file itself.
+        """
+        return CSVJournal(self.csv_data_file, self.LOG_HEADERS)
+
     @cached_property
     def csv_data(self) -> dict[tuple[str, str], dict]:
         """
@@ -68,29 +77,32 @@ class GenericClassificationOutputManager:
         # Initialize a blank CSV dict
         csv_data = dict()
 
-        # If a CSV data file already exists, try to load its contents
-        if self.csv_data_file.exists():
-            with open(self.csv_data_file) as fp:
-                reader = csv.DictReader(fp)
-                for i, row in enumerate(reader):
-                    # Skip rows w/o a valid UID entry
-                    uid = row.get(self.UID_KEY, None)
-                    if not uid:
-                        print(f"Skipped entry #{i} in {self.csv_data_file}, as it lacks a UID.")
-                        continue
-                    # Skip rows w/o a valid profile label
-                    uid = row.get(self.JOB_NAME_KEY, None)
-                    if not uid:
-                        print(f"Skipped entry #{i} in {self.csv_data_file}, as it lacks a Profile ID.")
-                        continue
-                    # Generate a UID + profile pair to act as our key
-                    profile = row.get(self.JOB_NAME_KEY, None)
-                    # Insert it into the data dict
-                    csv_data[(uid, profile)] = row
+        # Load the CSV data file and its journal, if they exist; later
+        #  entries replace earlier ones
+        for i, row in enumerate(self.csv_journal.rows()):
+            # Skip rows w/o a valid UID entry
+            uid = row.get(self.UID_KEY, None)
+            if not uid:
+                print(f"Skipped entry #{i} in {self.csv_data_file}, as it lacks a UID.")
+                continue
+            # Skip rows w/o a valid profile label
+            uid = row.get(self.JOB_NAME_KEY, None)
+            if not uid:
+                print(f"Skipped entry #{i} in {self.csv_data_file}, as it lacks a Profile ID.")
+                continue
+            # Generate a UID + profile pair to act as our key
+            profile = row.get(self.JOB_NAME_KEY, None)
+            # Insert it into the data dict
+            csv_data[(uid, profile)] = row
 
         # Return the resulting data
         return csv_data
 
+    def compact_log(self):
+        # Fold any journaled entries back into the CSV data file itself
+        if self.csv_journal.pending > 0:
+            self.csv_journal.compact(self.csv_data.values())
+
     @property
     def json_metadata_file(self) -> Path:
         """
@@ -100,6 +112,7 @@ class GenericClassificationOutputManager:
         """
         return self.output_dir / f"cart_classifications.json"
 
+    @traced()
     def save_unit(self, data_unit: GenericClassificationUnit):
         # Generate the entry key
         entry_key = (data_unit.uid, self.job_name)
@@ -110,7 +123,7 @@ class GenericClassificationOutputManager:
             unit_classes = ""
 
         # Add/replace the corresponding entry in our data dict
-        self.csv_data[entry_key] = {
+        entry = {
             self.UID_KEY: data_unit.uid,
             self.JOB_NAME_KEY: self.job_name,
             self.TIMESTAMP_KEY: datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -118,12 +131,10 @@ class GenericClassificationOutputManager:
             self.CLASSES_KEY: unit_classes,
             self.REMARKS_KEY: data_unit.remarks
         }
+        self.csv_data[entry_key] = entry
 
-        # Save the results to file
-        with open(self.csv_data_file, "w") as fp:
-            writer = csv.DictWriter(fp, fieldnames=self.LOG_HEADERS)
-            writer.writeheader()
-            writer.writerows(self.csv_data.values())
+        # Append the new entry to the CSV file's journal
+        self.csv_journal.append(entry, self.csv_data.values())
 
         # Return a success message
         result_msg = (
@@ -9,6 +9,7 @@ from CARTLib.core.DataUnitBase import DataUnitFactory
 from CARTLib.examples.GenericClassification.GenericClassificationOutputManager import GenericClassificationOutputManager
 from CARTLib.utils.config import JobProfileConfig, MasterProfileConfig
 from CARTLib.utils.task import cart_task
+from CARTLib.utils.timing import traced
 from CARTLib.utils.widgets import showSuccessPrompt
 
 from GenericClassificationGUI import GenericClassificationGUI
@@ -81,6 +82,7 @@ class GenericClassificationTask(TaskBaseClass[GenericClassificationUnit]):
         if self.gui:
             self.gui.syncWithDataUnit()
 
+    @traced()
     def save(self) -> Optional[str]:
         # Attempt to save the data unit + current metadata
         result_msg = self.output_manager.save_unit(self.current_unit)
@@ -91,6 +93,10 @@ class GenericClassificationTask(TaskBaseClass[GenericClassificationUnit]):
         if self.gui and result_msg:
             showSuccessPrompt(result_msg)
 
+    def cleanup(self):
+        # Bring the CSV log up to date with everything saved this session
+        self.output_manager.compact_log()
+
     @classmethod
     def getDataUnitFactory(cls) -> DataUnitFactory:
         return GenericClassificationUnit
@@ -1,4 +1,3 @@
-import csv
 from datetime import datetime
 from enum import Enum
 from functools import cached_property
@@ -20,7 +19,9 @@ from CARTLib.utils.data import (
     save_json_sidecar,
     add_generated_by_entry,
 )
+from CARTLib.utils.journal import CSVJournal
 from CARTLib.utils.task import cart_task
+from CARTLib.utils.timing import traced
 from CARTLib.utils.widgets import CARTMarkupEditorWidget
 
 
@@ -91,8 +92,14 @@ class MarkupTask(TaskBaseClass[CARTStandardUnit]):
         if self.gui:
             self.gui.sync()
 
+    @traced()
     def save(self) -> Optional[str]:
+        stamps = self.data_unit.edit_stamps()
         msg = self._output_manager.save_unit(self.data_unit, self.master_profile)
+        # Only the markups were saved; edits to anything else still need to be kept
+        self.data_unit.mark_saved(
+            {k: stamps[k] for k in self.data_unit.markup_nodes.keys()}
+        )
         if self.gui and msg is not None:
             self.gui.saveSuccessPrompt(msg)
 
@@ -101,6 +108,10 @@ class MarkupTask(TaskBaseClass[CARTStandardUnit]):
         uid = case_data['uid']
         return self._output_manager.is_unit_complete(author, uid)
 
+    def cleanup(self):
+        # Bring the log file up to date with everything saved this session
+        self._output_manager.compact_log()
+
     @classmethod
     def getDataUnitFactory(cls) -> DataUnitFactory:
         return CARTStandardUnit
@@ -159,6 +170,7 @@ class MarkupOutput:
         # Clear the log cache, so it can implicitly sync when needed
         if self.log:
             del self.log
+        self.__dict__.pop("log_journal", None)
 
     @property
     def log_file(self) -> Path:
@@ -184,6 +196,14 @@ class MarkupOutput:
         VERSION_KEY
     ]
 
+    @cached_property
+    def log_journal(self) -> CSVJournal:
+        """
+        Append-only journal backing the log file; new log entries are written
+        here, being periodically folded back into the log file itself.
+        """
+        return CSVJournal(self.log_file, self.LOG_HEADERS)
+
     @cached_property
     def log(self) -> dict[tuple[str, str], dict[str, str]]:
         """
@@ -203,21 +223,20 @@ class MarkupOutput:
 
         log_data = dict()
 
-        if self.log_file.exists():
-            with open(self.log_file, 'r') as fp:
-                reader = csv.DictReader(fp)
-                for i, row in enumerate(reader):
-                    uid = row.get(self.UID_KEY, None)
-                    username = row.get(self.AUTHOR_KEY, None)
-                    if any([x is None for x in [uid, username]]):
-                        print(
-                            f"Skipped entry #{i} in '{self.log_file}', as it lacked a UID or username."
-                        )
-                        continue
-                    log_data[(username, uid)] = row
+        # Replay the log file and its journal; later entries replace earlier ones
+        for i, row in enumerate(self.log_journal.rows()):
+            uid = row.get(self.UID_KEY, None)
+            username = row.get(self.AUTHOR_KEY, None)
+            if any([x is None for x in [uid, username]]):
+                print(
+                    f"Skipped entry #{i} in '{self.log_file}', as it lacked a UID or username."
+                )
+                continue
+            log_data[(username, uid)] = row
 
         return log_data
 
+    @traced()
     def save_unit(self, data_unit: CARTStandardUnit, profile: MasterProfileConfig) -> str:
         # Define (and, if need be, create) an output folder for this unit's case ID
         case_output = self.output_dir / data_unit.uid
@@ -276,19 +295,17 @@ class MarkupOutput:
         # Update our log file to match
         log_entry_key = (profile.author, data_unit.uid)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log[log_entry_key] = {
+        log_entry = {
             self.AUTHOR_KEY: profile.author,
             self.UID_KEY: data_unit.uid,
             self.TIMESTAMP_KEY: timestamp,
             self.OUTPUT_KEY: str(case_output.resolve()),
             self.VERSION_KEY: VERSION,
         }
+        self.log[log_entry_key] = log_entry
 
-        # Save the new contents to file
-        with open(self.log_file, "w") as fp:
-            writer = csv.DictWriter(fp, fieldnames=self.LOG_HEADERS)
-            writer.writeheader()
-            writer.writerows(self.log.values())
+        # Append the new entry to the log's journal
+        self.log_journal.append(log_entry, self.log.values())
 
         # Build the result message
         result_msg = ""
@@ -308,6 +325,11 @@ class MarkupOutput:
     def is_unit_complete(self, author: str, uid: CARTStandardUnit):
         return (author, uid) in self.log.keys()
 
+    def compact_log(self):
+        # Fold any journaled entries back into the log file itself
+        if self.log_journal.pending > 0:
+            self.log_journal.compact(self.log.values())
+
 
 class MarkupOutputStructure(Enum):
     BIDS = "BIDS"
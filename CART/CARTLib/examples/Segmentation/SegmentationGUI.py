@@ -39,3 +39,6 @@ class SegmentationGUI:
 
     def refresh(self):
         self._segmentEditorWidget.refresh()
+
+    def setEditingEnabled(self, enabled: bool):
+        self._segmentEditorWidget.setEnabled(enabled)
@@ -1,16 +1,21 @@
-import csv
 import logging
+from concurrent.futures import Future, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
 import numpy as np
 import slicer.util
 
 from CARTLib.utils import get_cart_version
+from CARTLib.utils.background import BackgroundWorker
 from CARTLib.utils.config import JobProfileConfig, MasterProfileConfig
+from CARTLib.utils.journal import CSVJournal
+from CARTLib.utils.timing import traced
 from CARTLib.utils.data import (
-    save_segmentation_to_nifti,
+    LabelSnapshot,
+    snapshot_segmentation_as_label,
+    write_label_snapshot_to_nifti,
     save_json_sidecar,
     load_json_sidecar,
     find_json_sidecar_path,
@@ -56,6 +61,9 @@ class SegmentationIO:
         VERSION_KEY,
     ]
 
+    # How often (in milliseconds) the main thread checks on background saves
+    SAVE_POLL_INTERVAL = 50
+
     ## Constructor ##
     def __init__(self, master_config: MasterProfileConfig, job_config: JobProfileConfig, task_config: "SegmentationConfig"):
         self.master_config: MasterProfileConfig = master_config
@@ -65,6 +73,18 @@ class SegmentationIO:
         # Map of previous CSV log entries
         self._log_data: Optional[dict[str, dict[str, str]]] = None
 
+        # Append-only journal backing the log file
+        self._log_journal: Optional[CSVJournal] = None
+
+        # Files are written by a single background worker, in the order they were saved
+        self._save_worker = BackgroundWorker(
+            self._poll_saves, "CARTSegmentationSave", self.SAVE_POLL_INTERVAL
+        )
+        self._pending_saves: list[_PendingSave] = list()
+
+        # Called w/ a case's UID once all of its files have been saved
+        self.on_save_finished: Optional[Callable[[str, Optional[Exception]], None]] = None
+
     ## Log Management ##
     @property
     def log_path(self) -> Path:
@@ -95,31 +115,40 @@ class SegmentationIO:
         # Otherwise, try to (re-)build the CSV log
         log_data = dict()
         self._log_data = log_data
-
-        # If there's not existing TSV file to pull from, end here
-        if not self.log_path.exists():
-            return log_data
-
-        # If the CSV file already exists, load its contents
-        with open(self.log_path, newline="") as csvfile:
-            reader = csv.DictReader(csvfile, delimiter='\t')
-            for i, row in enumerate(reader):
-                # Confirm the row has a UID; if not, skip it
-                uid = row.get(self.UID_KEY, None)
-                if uid is None:
-                    logging.warning(
-                        f"Skipping entry #{i} in {self.log_path}, lacked a valid UID."
-                    )
-                    continue
-                # Update CSV log dictionary
-                log_data[uid] = row
+        self._log_journal = CSVJournal(self.log_path, self.HEADERS, delimiter='\t')
+
+        # Load the contents of the TSV file and its journal, if they exist;
+        #  later entries for a UID replace earlier ones
+        for i, row in enumerate(self._log_journal.rows()):
+            # Confirm the row has a UID; if not, skip it
+            uid = row.get(self.UID_KEY, None)
+            if uid is None:
+                logging.warning(
+                    f"Skipping entry #{i} in {self.log_path}, lacked a valid UID."
+                )
+                continue
+            # Update CSV log dictionary
+            log_data[uid] = row
 
         # Track and return the result
         self._log_data = log_data
         return log_data
 
+    def compact_log(self):
+        """
+        Fold any journaled log entries back into the TSV log file, so it
+        reflects everything saved so far.
+        """
+        if self._log_journal is not None and self._log_journal.pending > 0:
+            self._log_journal.compact(self._log_data.values())
+
     ## Save/Load Management ##
-    def is_case_done(self, uid: str, input_volume_path: Optional[Path] = None):
+    def is_case_done(
+        self,
+        uid: str,
+        input_volume_path: Optional[Path] = None,
+        path_exists: Callable[[Path], bool] = Path.exists,
+    ):
         """
         Check whether the expected output files for the given case
         UID exist or not.
@@ -129,6 +158,8 @@ class SegmentationIO:
             BIDS entities beyond the uid (e.g. acq-*, modality suffix) are
             included in the expected output filename, matching what
             _generate_output_paths_for would produce at save time.
+        :param path_exists: Function used to check whether each output file
+            exists; can be replaced to check many cases more efficiently.
         """
         # If our log file doesn't have an entry, return None
         log_entry = self.log_data.get(uid)
@@ -149,12 +180,12 @@ class SegmentationIO:
                 # Get the "final" name for this segmentation
                 seg_name = EditableSegmentationResource.get_short_name(seg_id)
                 nifti_path = self._generate_output_paths_for(uid, seg_name, input_volume_path)
-                if not nifti_path.exists():
+                if not path_exists(nifti_path):
                     return False
                 # If it's a NIfTI file, check for the sidecar as well
                 if self.task_config.file_format == SegmentationFileFormat.NIFTI:
                     json_path = find_json_sidecar_path(nifti_path)
-                    if not json_path.exists():
+                    if not path_exists(json_path):
                         return False
 
         return True
@@ -238,11 +269,23 @@ class SegmentationIO:
 
         return output_path
 
+    @traced()
     def save_unit(self, unit: SegmentationUnit):
+        """
+        Save each "to-edit" segmentation in the data unit.
+
+        NIfTI outputs are snapshotted here, but compressed and written to disk
+        in the background; the log entry for the unit is only written (and
+        `on_save_finished` called) once all of them are done. Use
+        `is_save_pending` to check whether this is still in progress. Any
+        segmentation which fails to save (whether preparing or writing it) is
+        reported through `on_save_finished` as well.
+        """
+        # Stamp the segmentations as they are now, so they can be marked as saved afterward
+        stamps = unit.edit_stamps()
+
         # Save each segmentation that was marked as "to-edit" during Job config
-        saved_records = list()
-        failed_records = list()
-        exceptions = list()
+        pending = _PendingSave(unit.uid, list(), list(), list(), list(), dict(), unit.mark_saved)
         for segmentation_id, segmentation_node in unit.segmentation_nodes.items():
             # If this segmentation is "view-only", skip it
             if ReferenceSegmentationResource.is_type(segmentation_id):
@@ -271,43 +314,27 @@ class SegmentationIO:
             # Try to save this segmentation
             segmentation_name = EditableSegmentationResource.get_short_name(segmentation_id)
             try:
-                self._save_segmentation(segmentation_node, unit, segmentation_name)
-                saved_records.append(segmentation_name)
+                write_job = self._save_segmentation(segmentation_node, unit, segmentation_name)
+                pending.stamps[segmentation_name] = (segmentation_id, stamps[segmentation_id])
+                if write_job is None:
+                    pending.saved.append(segmentation_name)
+                else:
+                    pending.jobs.append((segmentation_name, write_job))
             except Exception as e:
-                failed_records.append(segmentation_name)
-                exceptions.append(e)
-        # Create a new log entry detailing these changes
-        log_entry = {
-            self.UID_KEY: unit.uid,
-            self.AUTHOR_KEY: self.master_config.author,
-            self.TIMESTAMP_KEY: datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            self.SAVED_KEY: ", ".join(saved_records),
-            self.FAILED_KEY: ", ".join(failed_records),
-            self.VERSION_KEY: VERSION,
-        }
-        self.log_data[unit.uid] = log_entry
-        # Save the updated log data to file
-        with open(self.log_path, mode='w') as fp:
-            writer = csv.DictWriter(fp, fieldnames=self.HEADERS, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(self.log_data.values())
-
-        # If we had any errors, log a message and raise the first
-        no_exceptions = len(exceptions)
-        if no_exceptions > 0:
-            logging.error(
-                f"While saving a the segmentations for data unit '{unit.uid}', "
-                f"{no_exceptions} error(s) occurred! "
-                f"See the critical stack trace for details "
-                f"on the first of these.")
-            raise exceptions[0]
+                # Reported alongside any background write failures once the save finishes
+                pending.failed.append(segmentation_name)
+                pending.exceptions.append(e)
+
+        # Queue the unit's log entry to be written once everything is on disk
+        self._pending_saves.append(pending)
+        self._save_worker.start_polling()
 
     def _save_segmentation(
         self,
         seg_node: "slicer.vtkMRMLSegmentationNode",
         unit: SegmentationUnit,
         seg_name: str,
-    ) -> Path:
+    ) -> Optional[Future]:
         """
         Save the specified segmentation node, referencing the given data
         unit and segmentation ID to fill in the resulting files w/ additional
@@ -316,7 +343,7 @@ class SegmentationIO:
         :param seg_node: The segmentation node that should be saved
         :param unit: The data unit the segmentation node is part of
         :param seg_name: The identifier used by the segmentation within the data unit
-        :return: The output path of the MAIN (.nii.gz) saved file
+        :return: The background job writing the files, if they were not written immediately
         :raises ValueError: If the values provided would result in a corrupted save file.
         """
         # Resolve the input volume path so _generate_output_paths_for can
@@ -358,14 +385,110 @@ class SegmentationIO:
             )
             sidecar_data["GeneratedBy"] = generated_by
 
-            # Save everything
-            save_segmentation_to_nifti(
-                seg_node, unit.reference_volume_node, output_path
+            # Copy the segmentation's contents now, then write them in the background
+            snapshot = snapshot_segmentation_as_label(seg_node, unit.reference_volume_node)
+            return self._save_worker.submit(
+                _write_nifti_output, snapshot, sidecar_data, output_path
             )
-            save_json_sidecar(output_path, sidecar_data)
         else:
             # Delegate to Slicer for our other formats
             slicer.util.saveNode(seg_node, str(output_path))
 
-        # Report the output path for upstream use
-        return output_path.resolve()
+        return None
+
+    ## Background Saving ##
+    def is_save_pending(self, uid: str) -> bool:
+        """
+        Whether any save for the given case UID is still being written.
+        """
+        return any([p.uid == uid for p in self._pending_saves])
+
+    def _poll_saves(self):
+        """
+        Run periodically on the main thread while saves are in progress.
+        Finishes any (in order) whose files have all been written.
+        """
+        while self._pending_saves and all(
+            [f.done() for __, f in self._pending_saves[0].jobs]
+        ):
+            self._finish_save(self._pending_saves.pop(0))
+
+        # If there's nothing left to wait on, stop checking in
+        if not self._pending_saves:
+            self._save_worker.stop_polling()
+
+    def _finish_save(self, pending: "_PendingSave"):
+        # Sort the background writes into successes and failures
+        for seg_name, future in pending.jobs:
+            e = future.exception()
+            if e is None:
+                pending.saved.append(seg_name)
+            else:
+                pending.failed.append(seg_name)
+                pending.exceptions.append(e)
+
+        # Create a new log entry detailing these changes
+        log_entry = {
+            self.UID_KEY: pending.uid,
+            self.AUTHOR_KEY: self.master_config.author,
+            self.TIMESTAMP_KEY: datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            self.SAVED_KEY: ", ".join(pending.saved),
+            self.FAILED_KEY: ", ".join(pending.failed),
+            self.VERSION_KEY: VERSION,
+        }
+        self.log_data[pending.uid] = log_entry
+        # Append the new entry to the log's journal
+        self._log_journal.append(log_entry, self.log_data.values())
+
+        # Edits to the segmentations which were written no longer need to be kept if the unit is unloaded
+        pending.mark_saved(dict(
+            [v for seg_name, v in pending.stamps.items() if seg_name in pending.saved]
+        ))
+
+        # If we had any errors, log a message detailing the first
+        no_exceptions = len(pending.exceptions)
+        if no_exceptions > 0:
+            logging.error(
+                f"While saving a the segmentations for data unit '{pending.uid}', "
+                f"{no_exceptions} error(s) occurred! "
+                f"The first was: {pending.exceptions[0]}"
+            )
+
+        # Let anyone waiting on this save know that it's done, and how its background writes went
+        if self.on_save_finished is not None:
+            first_error = pending.exceptions[0] if pending.exceptions else None
+            self.on_save_finished(pending.uid, first_error)
+
+    def flush(self):
+        """
+        Block until every pending save has been written, finishing them all.
+        """
+        for pending in self._pending_saves:
+            wait([f for __, f in pending.jobs])
+        self._poll_saves()
+
+    def shutdown(self):
+        """
+        Finish all pending saves, then stop the background worker.
+        """
+        self.flush()
+        self._save_worker.shutdown(wait=True)
+
+
+class _PendingSave(NamedTuple):
+    # A data unit's save, which may still be writing files in the background
+    uid: str
+    saved: list[str]
+    failed: list[str]
+    exceptions: list[Exception]
+    jobs: list[tuple[str, Future]]
+    # The edit stamp of each segmentation being saved, alongside its ID
+    stamps: dict[str, tuple[str, tuple]]
+    # Marks the saved segmentations' edits as saved within their data unit
+    mark_saved: Callable[[dict[str, tuple]], None]
+
+
+def _write_nifti_output(snapshot: LabelSnapshot, sidecar_data: dict, output_path: Path):
+    # Run in the background; the sidecar goes last, so it only exists w/ its segmentation
+    write_label_snapshot_to_nifti(snapshot, output_path)
+    save_json_sidecar(output_path, sidecar_data)
@@ -1,13 +1,18 @@
+import os
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 import qt
+from slicer.i18n import tr as _
 
 from CARTLib.core.TaskBaseClass import CARTTask
 from CARTLib.core.DataUnitBase import DataUnitFactory
 from CARTLib.utils.config import MasterProfileConfig, JobProfileConfig
 from CARTLib.utils.data import VolumeResource, ReferenceVolumeResource
+from CARTLib.utils.scene import batch_scene_updates
 from CARTLib.utils.task import cart_task
+from CARTLib.utils.timing import timed, traced
+from CARTLib.utils.widgets import showErrorPrompt
 
 from SegmentationConfig import SegmentationConfig
 from SegmentationGUI import SegmentationGUI
@@ -55,8 +60,9 @@ class SegmentationTask(
         # Self-managed configuration instance
         self.local_config = self.init_config(job_profile)
 
-        # I/O Manager
+        # I/O Manager; segmentations are written in the background, so have it tell us when they're done
         self.io = SegmentationIO(master_profile, job_profile, self.local_config)
+        self.io.on_save_finished = self.notify_save_finished
 
     @property
     def data_unit(self) -> SegmentationUnit:
@@ -115,7 +121,9 @@ class SegmentationTask(
         self.local_config.save()
 
     ## State Management ##
-    def _find_reference_volume_path(self, case_data: dict):
+    def _find_reference_volume_path(
+        self, case_data: dict, path_exists: Callable[[Path], bool] = Path.exists
+    ):
         # Identify the reference volume path for this case
         reference_path = None
         for k, v in case_data.items():
@@ -129,7 +137,7 @@ class SegmentationTask(
             p = Path(v)
             if not p.is_absolute():
                 p = self.job_profile.data_path / p
-            if not p.exists():
+            if not path_exists(p):
                 continue
             # Track the first valid volume we found as a fallback
             if reference_path is None:
@@ -157,12 +165,43 @@ class SegmentationTask(
         # Delegate to our IO manager
         return self.io.is_case_done(uid, reference_path)
 
+    def isTaskCompleteForCases(self, cases: list[dict[str, str]]) -> list[Optional[bool]]:
+        # Check for files by listing each directory once, rather than
+        # querying the filesystem for every file individually
+        path_exists = _listing_based_exists()
+
+        results = []
+        for case_data in cases:
+            # Same logic as `isTaskComplete`, using our listings instead
+            uid = case_data.get("uid", None)
+            if uid is None:
+                results.append(False)
+                continue
+            reference_path = self._find_reference_volume_path(case_data, path_exists)
+            if reference_path is None:
+                results.append(False)
+                continue
+            results.append(self.io.is_case_done(uid, reference_path, path_exists))
+        return results
+
+    @traced()
     def save(self) -> Optional[str]:
         # Try to save the data unit
         if not self.data_unit:
-            self.logger.error("Could not save, no data unit has been loaded!")
+            raise ValueError("Could not save, no data unit has been loaded!")
+        # Saving now would skip any segmentations which are still loading
+        if not self.data_unit.is_fully_loaded:
+            raise ValueError("Could not save, the case is still loading!")
+        # Saving a partially loaded case would log segmentations it never had as saved
+        if self.data_unit.load_error is not None:
+            raise ValueError(
+                f"Could not save, the case failed to load: {self.data_unit.load_error}"
+            )
         self.io.save_unit(self.data_unit)
 
+    def is_save_pending(self, uid: str) -> bool:
+        return self.io.is_save_pending(uid)
+
     def generate_prior_data_for(self, case_data: dict) -> Optional[dict]:
         # Ensure there's a valid UI
         uid = case_data.get("uid", None)
@@ -193,14 +232,38 @@ class SegmentationTask(
     def receive(self, data_unit: SegmentationUnit):
         self._data_unit = data_unit
 
-        # Apply our configuration options to the data unit
-        data_unit.apply_segmentation_configs(self.local_config)
+        # Hold off on editing until the unit's segmentations have all been loaded
+        if self.gui:
+            self.gui.setEditingEnabled(data_unit.is_fully_loaded)
+        data_unit.when_fully_loaded(self._prepare_unit)
+
+    def _prepare_unit(self, data_unit: SegmentationUnit):
+        # If the user moved onto another case while this one was loading, do nothing
+        if data_unit is not self._data_unit:
+            return
+
+        # If some of the unit's resources failed to load, editing it would only lose work
+        if data_unit.load_error is not None:
+            if self.gui:
+                self.gui.setEditingEnabled(False)
+                showErrorPrompt(
+                    _(f"Failed to load case '{data_unit.uid}': {data_unit.load_error}"),
+                    None,
+                )
+            return
+
+        # Batch the scene changes made while preparing the unit, so observers only react once
+        with timed("Prepare segmentation unit"), batch_scene_updates():
+            # Apply our configuration options to the data unit; adding the
+            #  segments we expect isn't an edit the user needs to keep
+            with data_unit.untracked_changes():
+                data_unit.apply_segmentation_configs(self.local_config)
 
-        # Change the interpolation settings to match current setting
-        self.apply_interp()
+            # Change the interpolation settings to match current setting
+            self.apply_interp()
 
-        # Ensure all segments are visible
-        self.show_all_segments()
+            # Ensure all segments are visible
+            self.show_all_segments()
 
         # Hide segments the user requested be hidden on load
         # TODO
@@ -208,6 +271,7 @@ class SegmentationTask(
         # If we have a GUI, refresh it
         if self.gui:
             self.gui.refresh()
+            self.gui.setEditingEnabled(True)
 
     def enter(self):
         if self.gui:
@@ -218,5 +282,43 @@ class SegmentationTask(
             self.gui.exit()
 
     def cleanup(self):
+        # Finish writing any segmentations still being saved
+        self.io.shutdown()
+
+        # Bring the log file up to date with everything saved this session
+        self.io.compact_log()
+
         # Break the cycling link
         self.gui = None
+
+
+def _listing_based_exists() -> Callable[[Path], bool]:
+    """
+    Build a drop-in replacement for `Path.exists` which lists the contents of
+    each directory the first time it is queried, answering queries for files
+    which aren't there from memory.
+
+    Files which appear in the listing (ignoring case, as the filesystem may)
+    are confirmed with `Path.exists`, so the results match it exactly; i.e.
+    for broken symlinks, or case-mismatched names on case-insensitive shares.
+
+    Only valid while the directories in question are not being modified!
+    """
+    listings: dict[Path, tuple[set[str], set[str]]] = dict()
+
+    def path_exists(p: Path) -> bool:
+        parent = p.parent
+        names = listings.get(parent)
+        if names is None:
+            try:
+                listed = set(os.listdir(parent))
+            except OSError:
+                listed = set()
+            names = (listed, {n.casefold() for n in listed})
+            listings[parent] = names
+        exact, folded = names
+        if p.name not in exact and p.name.casefold() not in folded:
+            return False
+        return p.exists()
+
+    return path_exists
@@ -15,6 +15,7 @@ from CARTLib.utils.data import (
     load_segmentation,
     ReferenceVolumeResource,
 )
+from CARTLib.utils.timing import traced
 
 from SegmentationConfig import ExtendedSegmentationResourceConfig
 
@@ -103,6 +104,9 @@ class SegmentationUnit(CARTStandardUnit):
         MarkupResource
     ]}
 
+    # The Segmentation task holds off on editing and saving until we're fully loaded
+    SUPPORTS_PROGRESSIVE_LOADING = True
+
     def __init__(
         self,
         case_data: dict[str, str],
@@ -117,6 +121,15 @@ class SegmentationUnit(CARTStandardUnit):
 
         super().__init__(case_data, data_path, scene)
 
+    @classmethod
+    def prefetch(
+        cls, case_data: dict[str, str], data_path: Path, prior_data: dict = None
+    ) -> list[Path]:
+        # Mirror the overrides our constructor applies, so we fetch the right files
+        if prior_data is not None:
+            case_data = {**case_data, **prior_data}
+        return super().prefetch(case_data, data_path)
+
     def apply_segmentation_configs(self, task_config: "SegmentationConfig"):
         """
         Apply the user-specified configuration options to the segmentations managed by
@@ -230,6 +243,7 @@ class SegmentationUnit(CARTStandardUnit):
 
         # TODO Add it to this unit's subject as well
 
+    @traced()
     def _load_segmentation_nodes(self, segmentation_paths: dict[str, Path]) -> None:
         """
         Modified version of the super-class, which "fills in" missing
@@ -0,0 +1,68 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import qt
+
+
+class BackgroundWorker:
+    """
+    A single background thread, paired with a timer which checks in on its
+    work from the main thread.
+
+    Work is `submit`ted to run in the background in the order it was
+    received; as the MRML scene (and GUI) can only be touched on the main
+    thread, the owner then `start_polling`s, having its poll function called
+    periodically until it decides there is nothing left to wait on and calls
+    `stop_polling`.
+    """
+
+    # How often (in ms) the main thread checks on the background work
+    DEFAULT_POLL_INTERVAL = 50
+
+    def __init__(
+        self,
+        poll: Callable[[], None],
+        thread_name_prefix: str,
+        poll_interval: int = DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        :param poll: Function to run on the main thread while polling.
+        :param thread_name_prefix: Name for the background thread, for debugging.
+        :param poll_interval: How often (in ms) to run `poll`.
+        """
+        self._poll = poll
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=thread_name_prefix
+        )
+        self._is_shut_down = False
+
+        # Timer which runs the poll function until told to stop
+        self._timer = qt.QTimer()
+        self._timer.setInterval(poll_interval)
+        self._timer.timeout.connect(self._poll)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Run the function in the background, after anything submitted before it.
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def start_polling(self):
+        self._timer.start()
+
+    def stop_polling(self):
+        self._timer.stop()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop polling for good, then shut down the background thread; if `wait`
+        is False, work which is already running is left to finish on its own.
+        """
+        if self._is_shut_down:
+            return
+        self._is_shut_down = True
+        # Make sure nothing is polled after we're gone
+        self._timer.stop()
+        self._timer.timeout.disconnect(self._poll)
+        self._executor.shutdown(wait=wait)
@@ -1,12 +1,16 @@
 import copy
 import csv
+import heapq
+import inspect
 import json
 import logging
-import os
 from collections import namedtuple
-from contextlib import contextmanager
+from concurrent.futures import Future, wait
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import Optional, Protocol, TYPE_CHECKING
+from queue import SimpleQueue
+from threading import Event
+from typing import Callable, Iterator, NamedTuple, Optional, Protocol, TYPE_CHECKING
 
 import numpy as np
 from numpy import typing as npt
@@ -15,12 +19,16 @@ import ctk
 import qt
 from slicer.i18n import tr as _
 
+from .background import BackgroundWorker
 from .config import DictBackedConfig
+from .indexing import BIDSIndex, DataTreeIndex
+from .table import GrowableTable
 from .widgets import (
     CSVBackedTableModel,
     CSVBackedTableWidget,
     CARTPathLineEdit,
     ChangeTrackingDialogue,
+    showErrorPrompt,
 )
 
 ## Type Utils ##
@@ -36,6 +44,7 @@ if TYPE_CHECKING:
 
 # Typing aliases for commonly used dictionary mappings
 CaseMap = dict[str, list[Path]]
+CaseEntry = tuple[str, list[Path]]
 FilterMap = dict[str, dict]
 NameMap = dict[str, str]
 
@@ -51,6 +60,92 @@ ResourceFilter = namedtuple(
     defaults=[""]*5  # Just default to empty strings for each if not provided.
 )
 
+
+def _find_first_valid_file(
+    data_path: Path, data_index: DataTreeIndex, search_paths: list[Path], filters: ResourceFilter
+) -> Optional[Path]:
+    # If both filters are blank, assume the user wants nothing rather than an effectively random file.
+    n_includes = len(filters.include)
+    n_excludes = len(filters.exclude)
+    if n_includes < 1 and n_excludes < 1:
+        logging.info("No filters were given, assuming user wanted a blank entry.")
+        return None
+
+    # If the path isn't absolute, root it to our data path
+    search_paths = [p if p.is_absolute() else data_path / p for p in search_paths]
+
+    # Make sure every path is indexed, crawling any new ones all at once
+    data_index.extend(search_paths)
+
+    # Search every path in turn; the last path with a match takes priority
+    result = None
+    for p in search_paths:
+        # Only look at files; directories (such as DICOM) are currently not supported for automated cohorts
+        for file_string in data_index.iter_files(p):
+            # Check if all inclusion criterion were met
+            if n_includes != 0 and any([i not in file_string for i in filters.include]):
+                continue
+            # Check that all exclusion criterion were met
+            if n_excludes != 0 and any([i in file_string for i in filters.exclude]):
+                continue
+            # Check if our extension matches
+            if not file_string.endswith(filters.extension):
+                continue
+            # If all prior checks passed, track the file and end
+            result = Path(file_string)
+            break
+
+    # If no valid files were found, return empty-handed
+    if result is None:
+        return None
+    # If the result is within the data dir, make it relative
+    elif data_path in result.parents:
+        return result.relative_to(data_path)
+    # Otherwise, return the result as-is
+    else:
+        return result
+
+
+class _LabelLookup:
+    """
+    Hash index from each label along one axis of a cohort's table (case UIDs
+    or resource labels) to its position.
+
+    Inserting or removing entries along the axis shifts every position after
+    them, so the lookup is lazily re-built whenever the table's version for
+    that axis changes; appends and renames are applied directly instead.
+    """
+
+    def __init__(self):
+        self.positions: dict[str, int] = dict()
+        # The table (and axis version) our positions are valid for
+        self._table: Optional[GrowableTable] = None
+        self._version: int = -1
+
+    def is_synced(self, table: Optional[GrowableTable], version: int) -> bool:
+        return table is not None and self._table is table and self._version == version
+
+    def rebuild(self, labels: "npt.NDArray[str]", table: GrowableTable, version: int):
+        # Iterate backwards, so the first occurrence of any duplicate wins (as a linear search would)
+        self.positions = {label: i for i, label in reversed(list(enumerate(labels)))}
+        self.mark_synced(table, version)
+
+    def mark_synced(self, table: GrowableTable, version: int):
+        self._table = table
+        self._version = version
+
+    def add(self, position: int, label: str):
+        # Only replace an existing entry if it lies after the new one
+        existing = self.positions.get(label)
+        if existing is None or existing > position:
+            self.positions[label] = position
+
+    def relabel(self, position: int, old_label: str, new_label: str):
+        if self.positions.get(old_label) == position:
+            self.positions.pop(old_label)
+        self.add(position, new_label)
+
+
 class CohortModel(CSVBackedTableModel):
     """
     More specialized version of the CSV-backed model w/ additional checks
@@ -87,6 +182,13 @@ class CohortModel(CSVBackedTableModel):
         self._data_path = data_path
         self.reference_task = reference_task
 
+        # Snapshot of the data path's contents, built when first needed
+        self._data_index: Optional[DataTreeIndex] = None
+
+        # Where each case (row) and resource (column) lies within the table
+        self._row_lookup = _LabelLookup()
+        self._column_lookup = _LabelLookup()
+
         # Initialize blank placeholders
         self._case_map = dict()
         self._resource_map: dict[str, ResourceFilter] = dict()
@@ -206,27 +308,69 @@ class CohortModel(CSVBackedTableModel):
         if case_label not in self.case_map.keys():
             # Create a new row at the end of the dataset
             row_idx = self.rowCount()
-            self.addRow(row_idx, new_paths)
-            # Set the header to this new label
-            self.setHeaderData(
-                row_idx, qt.Qt.Vertical, case_label, qt.Qt.EditRole
-            )
+            with self._appending():
+                self.addRow(row_idx, new_paths)
+                # Set the header to this new label
+                self.setHeaderData(
+                    row_idx, qt.Qt.Vertical, case_label, qt.Qt.EditRole
+                )
         # Otherwise, replace the row's values with the newly found paths
         else:
             # Find the column position which matches our resource label
-            row_idx = np.argwhere(self.indices == case_label).flatten()[0]
+            row_idx = self.row_of(case_label)
             # Change the column's contents to our new list of paths
             self.setRow(row_idx, new_paths)
 
         # Save the new filter for later
         self.case_map[case_label] = search_paths
 
+    def add_cases(self, cases: CaseMap):
+        """
+        Set the search paths for several cases at once. New cases are added
+        to the end of the cohort in a single block, rather than one-by-one.
+
+        :param cases: The search paths for each case, by label. Cases which
+            already exist have their search paths (and files) replaced.
+        """
+        # Existing cases are just updated in place
+        new_labels = list()
+        for case_label, search_paths in cases.items():
+            if case_label in self.case_map.keys():
+                self.set_case_data(case_label, search_paths)
+            else:
+                new_labels.append(case_label)
+        if not new_labels:
+            return
+
+        # Index every new case's search paths in one sweep, rather than one case at a time
+        if self.resource_map and self.data_path is not None:
+            self.data_index.extend(sorted({
+                self._rooted(p) for case_label in new_labels for p in cases[case_label]
+            }))
+
+        # Find the files for each new case
+        contents = np.empty((len(new_labels), self.columnCount()), dtype="object")
+        for i, case_label in enumerate(new_labels):
+            row_paths = self.find_row_files(cases[case_label])
+            contents[i, :] = [str(k) if k is not None else "" for k in row_paths]
+
+        # Add them all at the end of the dataset, labelled to match
+        row_idx = self.rowCount()
+        with self._appending():
+            self.addRows(row_idx, contents)
+            self.indices[row_idx:] = new_labels
+        self.headerDataChanged(qt.Qt.Vertical, row_idx, row_idx + len(new_labels) - 1)
+
+        # Save their search paths for later
+        for case_label in new_labels:
+            self.case_map[case_label] = cases[case_label]
+
     def rename_case(self, old_name: str, new_name: str):
         # Check if a case map with this name already exists
         if old_name not in self.case_map.keys():
             raise ValueError(f"Cannot rename case '{old_name}'; it doesn't exist!")
         # Update the backing model
-        row_idx = np.argwhere(self.indices == old_name).flatten()[0]
+        row_idx = self.row_of(old_name)
         self.setHeaderData(row_idx, qt.Qt.Vertical, new_name, qt.Qt.EditRole)
         # Update the case map to reflect the change
         case_map_entry = self.case_map.pop(old_name)
@@ -240,12 +384,13 @@ class CohortModel(CSVBackedTableModel):
                 raise ValueError(f"Cannot delete case '{name}'; it doesn't exist!")
 
         # Do everything in one go to avoid partial corruption
+        names = set(names)
+        self.dropRows([self.row_of(name) for name in names])
+        # Update the case map
         for name in names:
-            # Update the backing model
-            row_idx = np.argwhere(self.indices == name).flatten()[0]
-            self.dropRow(row_idx)
-            # Update the case map
             self.case_map.pop(name)
+        # Scattered rows reset the model rather than removing them; make sure the change is tracked
+        self._mark_changed()
 
     def set_resource_data(self, resource_label: str, filter_entry: ResourceFilter):
         """
@@ -256,22 +401,27 @@ class CohortModel(CSVBackedTableModel):
         :param filter_entry: The filter entry to associate with the new/updated resource.
         """
         # Find and process the list of paths associated with this filter
-        new_paths = self.find_column_files(filter_entry)
+        self._set_resource_paths(resource_label, filter_entry, self.find_column_files(filter_entry))
+
+    def _set_resource_paths(
+        self, resource_label: str, filter_entry: ResourceFilter, new_paths: list[Optional[Path]]
+    ):
+        # Set a resource's column to the (already found) file for each case, in row order
         new_paths = np.array([str(k) if k is not None else "" for k in new_paths])
 
         # If this is a new resource, create a new column to match
-        if resource_label not in self.header:
+        col_idx = self.column_of(resource_label)
+        if col_idx is None:
             # Add a new column to the end of the dataset
             col_idx = self.columnCount()
-            self.addColumn(col_idx, new_paths)
-            # Set the header to this new label
-            self.setHeaderData(
-                col_idx, qt.Qt.Horizontal, resource_label, qt.Qt.EditRole
-            )
+            with self._appending():
+                self.addColumn(col_idx, new_paths)
+                # Set the header to this new label
+                self.setHeaderData(
+                    col_idx, qt.Qt.Horizontal, resource_label, qt.Qt.EditRole
+                )
         # Otherwise, replace the column's values with the newly found paths
         else:
-            # Find the column position which matches our resource label
-            col_idx = np.argwhere(self.header == resource_label).flatten()[0]
             # Change the model's contents to our new list of paths
             self.setColumn(col_idx, new_paths)
 
@@ -287,7 +437,7 @@ class CohortModel(CSVBackedTableModel):
             raise ValueError(f"Cannot rename resource '{old_name}'; it doesn't exist!")
 
         # Update the backing model
-        col_idx = np.argwhere(self.header == old_name).flatten()[0]
+        col_idx = self.column_of(old_name)
         self.setHeaderData(col_idx, qt.Qt.Horizontal, new_name, qt.Qt.EditRole)
 
         # Update the resource entry to reflect the change
@@ -306,12 +456,13 @@ class CohortModel(CSVBackedTableModel):
                 raise ValueError(f"Cannot delete resource '{name}'; it doesn't exist!")
 
         # Do everything in one go to avoid partial corruption
+        names = set(names)
+        self.dropColumns([self.column_of(name) for name in names])
+        # Update the resource map
         for name in names:
-            # Update the backing model
-            col_idx = np.argwhere(self.header == name).flatten()[0]
-            self.dropColumn(col_idx)
-            # Update the case map
             self.resource_map.pop(name)
+        # Scattered columns reset the model rather than removing them; make sure the change is tracked
+        self._mark_changed()
 
     ## Data Management ##
     @property
@@ -324,6 +475,25 @@ class CohortModel(CSVBackedTableModel):
             self._data_path = None
         else:
             self._data_path = new_path
+        # Our index of the prior data path is no longer relevant
+        self._data_index = None
+
+    @property
+    def data_index(self) -> Optional[DataTreeIndex]:
+        """
+        An index of every file within our cases' search paths, built on first
+        use and re-used for all file searches afterward (i.e. for the duration
+        of a cohort editing session). Search paths added afterward are indexed
+        the first time they are searched.
+        """
+        if self.data_path is None:
+            return None
+        if self._data_index is None:
+            search_paths = {
+                self._rooted(p) for paths in self.case_map.values() for p in paths
+            }
+            self._data_index = DataTreeIndex(self.data_path, scopes=sorted(search_paths))
+        return self._data_index
 
     @property
     def csv_data(self) -> "Optional[npt.NDArray]":
@@ -371,17 +541,76 @@ class CohortModel(CSVBackedTableModel):
         self.beginRemoveColumns(parent, column, column + count - 1)
         # Offset by 1 to account for the new UID column
         idx = [column + i + 1 for i in range(count)]
-        self._csv_data = np.delete(self._csv_data, idx, axis=1)
+        self._table.delete_columns(idx)
         self.endRemoveColumns()
 
     def setHeaderData(self, section, orientation, value, role=...):
         if role == qt.Qt.EditRole:
             if orientation == qt.Qt.Horizontal:
+                self._relabel(self._column_lookup, self.column_version, self.header, section, value)
                 self.header[section] = value
             elif orientation == qt.Qt.Vertical:
+                self._relabel(self._row_lookup, self.row_version, self.indices, section, value)
                 self.indices[section] = value
             self.headerDataChanged(orientation, section, section)
 
+    ## Lookups ##
+    @property
+    def row_version(self) -> int:
+        return -1 if self._table is None else self._table.row_version
+
+    @property
+    def column_version(self) -> int:
+        return -1 if self._table is None else self._table.column_version
+
+    def row_of(self, case_label: str) -> Optional[int]:
+        """
+        The row holding the given case; None if there is no such case.
+        """
+        if self._table is None:
+            return None
+        if not self._row_lookup.is_synced(self._table, self.row_version):
+            self._row_lookup.rebuild(self.indices, self._table, self.row_version)
+        return self._row_lookup.positions.get(case_label)
+
+    def column_of(self, resource_label: str) -> Optional[int]:
+        """
+        The column holding the given resource; None if there is no such resource.
+        """
+        if self._table is None:
+            return None
+        if not self._column_lookup.is_synced(self._table, self.column_version):
+            self._column_lookup.rebuild(self.header, self._table, self.column_version)
+        return self._column_lookup.positions.get(resource_label)
+
+    def _relabel(
+        self, lookup: _LabelLookup, version: int, labels: "npt.NDArray[str]", position: int, new_label: str
+    ):
+        # Keep an up-to-date lookup in sync w/ a label being changed; stale ones are re-built anyway
+        if lookup.is_synced(self._table, version):
+            lookup.relabel(position, labels[position], new_label)
+
+    @contextmanager
+    def _appending(self):
+        """
+        Wrap edits which only add (labelled) rows/columns to the END of the
+        table. Existing lookup entries are left untouched by such edits, so
+        only the new ones are added afterward, rather than everything being
+        re-built from scratch.
+        """
+        rows_synced = self._row_lookup.is_synced(self._table, self.row_version)
+        columns_synced = self._column_lookup.is_synced(self._table, self.column_version)
+        n_rows, n_cols = self.rowCount(), self.columnCount()
+        yield
+        if rows_synced:
+            for i in range(n_rows, self.rowCount()):
+                self._row_lookup.add(i, self.indices[i])
+            self._row_lookup.mark_synced(self._table, self.row_version)
+        if columns_synced:
+            for i in range(n_cols, self.columnCount()):
+                self._column_lookup.add(i, self.header[i])
+            self._column_lookup.mark_synced(self._table, self.column_version)
+
     ## File Searching/Filtering ##
     def find_first_valid_file(
         self, search_paths: list[Path], filters: ResourceFilter
@@ -389,55 +618,13 @@ class CohortModel(CSVBackedTableModel):
         # If we don't have a data path to search within, return nothing
         if self.data_path is None:
             return None
+        return _find_first_valid_file(self.data_path, self.data_index, search_paths, filters)
 
-        # If both filters are blank, assume the user wants nothing rather than an effectively random file.
-        n_includes = len(filters.include)
-        n_excludes = len(filters.exclude)
-        if n_includes < 1 and n_excludes < 1:
-            logging.info("No filters were given, assuming user wanted a blank entry.")
-            return None
-
-        # Search every path in turn
-        result = None
-        for p in search_paths:
-            # If the path isn't absolute, root it to our data path
-            if not p.is_absolute():
-                p = self.data_path / p
-            # Only look at files; directories (such as DICOM) are currently not supported for automated cohorts
-            # TODO: Replace with path.walk when it becomes available
-            for r, __, fs in os.walk(p, topdown=True):
-                r = Path(r)
-                for f in fs:
-                    f = r / f
-                    file_string = str(f)
-                    # Check if all inclusion criterion were met
-                    if n_includes != 0 and any([i not in file_string for i in filters.include]):
-                        continue
-                    # Check that all exclusion criterion were met
-                    if n_excludes != 0 and any([i in file_string for i in filters.exclude]):
-                        continue
-                    # Check if our extension matches
-                    if not file_string.endswith(filters.extension):
-                        continue
-                    # If all prior checks passed, track the file and end
-                    result = f
-                    break
-                # Else-continue-break chain, allowing for the break to chain up the loops
-                else:
-                    continue
-                break
-            else:
-                continue
-
-        # If no valid files were found, return empty-handed
-        if result is None:
-            return None
-        # If the result is within the data dir, make it relative
-        elif self.data_path in result.parents:
-            return result.relative_to(self.data_path)
-        # Otherwise, return the result as-is
-        else:
-            return result
+    def _rooted(self, path: Path) -> Path:
+        # Root relative paths to our data path
+        if path.is_absolute():
+            return path
+        return self.data_path / path
 
     def find_row_files(self, search_paths: list[Path]) -> list[Optional[Path]]:
         result_map = {}
@@ -590,56 +777,79 @@ class CaseGenerator(Protocol):
     Function-like Protocol class for generating an initial set of cases.
 
     Allows for type-hinting, aiding in the registration of custom case generators for future extensions.
+
+    Generators can either return the full case map at once, or yield each
+    case (as a `(label, search_paths)` pair) as soon as it is found; the
+    latter lets cohort generation show cases to the user (and be cancelled)
+    while the generator is still searching.
+
+    Generators which accept a `cancelled` keyword argument are given an Event
+    which is set if generation is cancelled, so they can abandon any search
+    still in progress (i.e. by passing it on to `DirectoryCrawler.crawl`).
+    """
+
+    def __call__(self, data_path: Path) -> "CaseMap | Iterator[CaseEntry]": ...
+
+
+def iter_generated_cases(
+    generator: CaseGenerator, data_path: Path, cancelled: Optional[Event] = None
+) -> "Iterator[CaseEntry]":
+    """
+    Iterate through the cases a generator produces, regardless of whether it
+    returns them all at once or yields them one at a time.
     """
+    if cancelled is not None and _accepts_cancellation(generator):
+        cases = generator(data_path, cancelled=cancelled)
+    else:
+        cases = generator(data_path)
+    if isinstance(cases, dict):
+        yield from cases.items()
+    else:
+        yield from cases
+
 
-    def __call__(self, data_path: Path) -> CaseMap: ...
+def _accepts_cancellation(generator: CaseGenerator) -> bool:
+    # Whether the generator can be passed a cancellation event (see `CaseGenerator`)
+    try:
+        return "cancelled" in inspect.signature(generator).parameters
+    except (TypeError, ValueError):
+        return False
 
 
 # Default generators; simple BIDS support + blank slate
-def _bids_cases(data_path: Path) -> CaseMap:
-    # Identify the initial "source" paths
-    subject_map = {}
-    session_map = {}
-    # Search by subject first
-    for p in data_path.glob("sub*/"):
-        # Find any sessions associated with this subject
-        ses_ps = list(p.glob("ses*/"))
-        # If there were none, use the subject alone for this case
-        if len(ses_ps) < 1:
-            subject = p.parts[-1]
-            subject_map[subject] = [p.relative_to(data_path)]
+def _bids_cases(data_path: Path, cancelled: Optional[Event] = None) -> "Iterator[CaseEntry]":
+    # Index the dataset's subjects, sessions, and derivatives in one pass,
+    # producing each subject's cases as soon as it has been indexed
+    bids_index = BIDSIndex(data_path, build=False)
+
+    # Cases are produced sorted by label, to make them easier to work with. As
+    # subjects are indexed in sorted order (and a subject's cases never sort
+    # before the subject itself), a case can be produced once every subject
+    # sorting before it has been indexed.
+    found: list[CaseEntry] = []
+    for subject in bids_index.iter_build(cancelled):
+        sessions = bids_index.subjects[subject]
+        # If there were no sessions, use the subject alone for this case
+        if len(sessions) < 1:
+            search_paths = [Path(subject)]
+            # Add associated derivative paths, if any exist
+            search_paths.extend(bids_index.derivatives_for(subject))
+            heapq.heappush(found, (subject, search_paths))
         # Otherwise, prepare a case for each session
         else:
-            for p2 in ses_ps:
-                subject = p2.parts[-2]
-                session = p2.parts[-1]
-                key = f"{subject}__{session}"
-                session_map[key] = [p2.relative_to(data_path)]
-
-    # Add associated derivative paths, if such a directory exists
-    derivative_path = data_path / "derivatives"
-    if not derivative_path.exists():
+            for session in sessions:
+                search_paths = [Path(subject, session)]
+                search_paths.extend(bids_index.derivatives_for(subject, session))
+                heapq.heappush(found, (f"{subject}__{session}", search_paths))
+        while found and found[0][0] <= subject:
+            yield heapq.heappop(found)
+
+    if cancelled is not None and cancelled.is_set():
+        return
+    while found:
+        yield heapq.heappop(found)
+    if not bids_index.has_derivatives:
         logging.warning("No derivatives path found for BIDS directory, skipping.")
-    else:
-        # Parse subject-only cases
-        for subject, val_list in subject_map.items():
-            val_list.extend([
-                p.relative_to(data_path)
-                for p in derivative_path.glob(f"*/{subject}/")
-            ])
-        # Parse session-based cases
-        for key, val_list in session_map.items():
-            subject, session = key.split("__")
-            val_list.extend([
-                p.relative_to(data_path)
-                for p in derivative_path.glob(f"*/{subject}/{session}/")
-            ])
-    # Stack everything together
-    case_map = {k: v for k, v in subject_map.items()}
-    case_map.update(session_map)
-    # Sort the results to make them easier to work with
-    case_map = {k: case_map[k] for k in sorted(case_map.keys())}
-    return case_map
 
 
 def _blank(__: Path) -> CaseMap:
@@ -684,7 +894,7 @@ def cohort_from_generator(
     :param generator: The generator to user.
     """
     # Build the case map from the generator
-    case_map = generator(data_path)
+    case_map = dict(iter_generated_cases(generator, data_path))
     # Create the cohort model from that
     cohort = CohortModel.from_case_map(
         csv_path=cohort_path, data_path=data_path, case_map=case_map
@@ -692,6 +902,217 @@ def cohort_from_generator(
     return cohort
 
 
+class GenerationProgress(NamedTuple):
+    """
+    How far along a `CohortGenerationJob` is.
+    """
+    # The cases found so far
+    cases_found: int
+    # The files matched to resources so far, and how many could be matched in total
+    files_matched: int
+    files_total: int
+    # Whether the job is still finding cases (rather than matching files)
+    finding_cases: bool
+
+
+class CohortGenerationJob:
+    """
+    Generates a cohort in the background, so the GUI remains responsive (and
+    the user can cancel) while large datasets are searched.
+
+    A single worker runs the case generator, then matches any provided
+    resource filters against each case's files; its results are streamed into
+    `cohort` on the main thread as they arrive, which is periodically polled
+    much like background saves and pre-fetches are. Nothing is written to
+    disk until the job finishes; cancelled (or failed) jobs leave the
+    destination file untouched.
+    """
+
+    # How often (in milliseconds) the main thread checks on the worker
+    POLL_INTERVAL = 50
+
+    # The most results added to the cohort per poll, so the GUI stays responsive
+    MAX_RESULTS_PER_POLL = 250
+
+    def __init__(
+        self,
+        cohort_path: Path,
+        data_path: Path,
+        generator: CaseGenerator,
+        resource_filters: Optional[dict[str, ResourceFilter]] = None,
+    ):
+        """
+        :param cohort_path: The to-be-created (or overwritten) cohort file path.
+        :param data_path: The data path to reference when finding cases.
+        :param generator: The generator to use.
+        :param resource_filters: Resources to find the files for in each case,
+            once every case has been found.
+        """
+        self.cohort_path: Path = cohort_path
+        self.data_path: Path = data_path
+        self.generator: CaseGenerator = generator
+        self.resource_filters: dict[str, ResourceFilter] = dict(resource_filters or {})
+
+        # The cohort being generated; only saved to the cohort path once we finish
+        self.cohort = CohortModel(None, data_path, use_sidecar=True)
+        self.cohort._csv_data = np.array([["uid"]], dtype="object")
+
+        # Called on the main thread w/ our progress whenever it changes
+        self.on_progress: Optional[Callable[[GenerationProgress], None]] = None
+        # Called on the main thread once we finish; w/ the error if we failed, None otherwise
+        self.on_finished: Optional[Callable[[Optional[Exception]], None]] = None
+
+        # Results produced by the worker, waiting to be added to the cohort
+        self._results: SimpleQueue = SimpleQueue()
+        self._cancelled = Event()
+        self._finished = False
+
+        # Progress counters; only ever updated by the worker
+        self._cases_found = 0
+        self._files_matched = 0
+        self._files_total = 0
+        self._finding_cases = True
+
+        self._future: Optional[Future] = None
+        self._worker = BackgroundWorker(self._poll, "CARTCohortGeneration", self.POLL_INTERVAL)
+
+    ## Properties ##
+    @property
+    def progress(self) -> GenerationProgress:
+        return GenerationProgress(
+            self._cases_found, self._files_matched, self._files_total, self._finding_cases
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._future is not None and not self._finished
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    ## Control ##
+    def start(self):
+        """
+        Begin generating the cohort in the background.
+        """
+        if self._future is not None:
+            raise ValueError("Cohort generation job has already been started!")
+        self._future = self._worker.submit(self._generate)
+        self._worker.start_polling()
+
+    def cancel(self):
+        """
+        Stop generating the cohort, discarding everything found so far.
+
+        The worker stops at the next case (or file) it produces; directory
+        listings which have yet to start are dropped, and those in progress
+        are abandoned once they return.
+        """
+        if self._finished:
+            return
+        self._cancelled.set()
+        self._shutdown()
+
+    def wait(self) -> Optional[Exception]:
+        """
+        Block until the job finishes, returning the error it failed with (if any).
+        """
+        if self._future is None:
+            raise ValueError("Cannot wait on a cohort generation job which was never started!")
+        wait([self._future])
+        while not self._finished:
+            self._poll()
+        return self._future.exception()
+
+    ## Background Work ##
+    def _generate(self):
+        # Find every case, passing each on to the main thread as we go
+        case_map: CaseMap = dict()
+        # Close the generator if we stop early, so any search it is running stops too
+        with closing(iter_generated_cases(self.generator, self.data_path, self._cancelled)) as cases:
+            for label, search_paths in cases:
+                if self._cancelled.is_set():
+                    return
+                case_map[label] = search_paths
+                self._results.put((label, search_paths))
+                self._cases_found += 1
+        self._finding_cases = False
+
+        # If there are no resources to find files for, we're done
+        if not self.resource_filters or not case_map:
+            return
+
+        # Index every case's files in one (concurrent) sweep, then match each resource against them
+        self._files_total = len(case_map) * len(self.resource_filters)
+        data_index = DataTreeIndex(self.data_path, scopes=sorted({
+            p if p.is_absolute() else self.data_path / p
+            for paths in case_map.values() for p in paths
+        }), cancelled=self._cancelled)
+        if self._cancelled.is_set():
+            return
+        for resource_label, filter_entry in self.resource_filters.items():
+            column = list()
+            for search_paths in case_map.values():
+                if self._cancelled.is_set():
+                    return
+                column.append(_find_first_valid_file(
+                    self.data_path, data_index, search_paths, filter_entry
+                ))
+                self._files_matched += 1
+            self._results.put((resource_label, filter_entry, column))
+
+    def _poll(self):
+        """
+        Run periodically on the main thread while the job is running. Adds
+        the worker's latest results to the cohort, then reports our progress.
+        """
+        if self._finished or self._cancelled.is_set():
+            return
+
+        # Check whether the worker is done BEFORE draining, so nothing it produced is missed
+        worker_done = self._future.done()
+        new_cases: CaseMap = dict()
+        for __ in range(self.MAX_RESULTS_PER_POLL):
+            if self._results.empty():
+                break
+            result = self._results.get()
+            # New cases are (label, search paths) pairs; add them in bulk
+            if len(result) == 2:
+                label, search_paths = result
+                new_cases[label] = search_paths
+            # Resolved resources are (label, filter, files) triples; they always follow every case
+            else:
+                self.cohort.add_cases(new_cases)
+                new_cases = dict()
+                self.cohort._set_resource_paths(*result)
+        self.cohort.add_cases(new_cases)
+
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
+
+        # Once the worker is done and everything it produced has been added, wrap up
+        if worker_done and self._results.empty():
+            self._finish(self._future.exception())
+
+    def _finish(self, error: Optional[Exception]):
+        self._shutdown()
+        if error is None:
+            # Write the cohort (and its sidecar) to its destination now that its complete
+            self.cohort._csv_path = self.cohort_path
+            self.cohort.has_changed = True
+            self.cohort.save()
+        else:
+            logging.error(f"Failed to generate cohort '{self.cohort_path}': {error}")
+        if self.on_finished is not None:
+            self.on_finished(error)
+
+    def _shutdown(self):
+        self._finished = True
+        # Don't block the GUI waiting on a cancelled worker; it exits on its own
+        self._worker.shutdown(wait=False)
+
+
 ## Related Widgets ##
 class CohortTableView(qt.QTableView):
     """
@@ -1026,6 +1447,16 @@ class NewCohortDialog(ChangeTrackingDialogue):
         cohortTypeDescription.setReadOnly(True)
         layout.addRow(cohortTypeDescription)
 
+        # Progress of the cohort's generation; hidden until it begins
+        generationStatusLabel = qt.QLabel()
+        generationStatusLabel.setVisible(False)
+        self._generationStatusLabel = generationStatusLabel
+        layout.addRow(generationStatusLabel)
+        generationProgressBar = qt.QProgressBar()
+        generationProgressBar.setVisible(False)
+        self._generationProgressBar = generationProgressBar
+        layout.addRow(generationProgressBar)
+
         # Ok/Cancel Buttons
         buttonBox = qt.QDialogButtonBox()
         buttonBox.setStandardButtons(
@@ -1035,6 +1466,11 @@ class NewCohortDialog(ChangeTrackingDialogue):
         # Disable the OK button until the user selects valid options
         self._ok_button = buttonBox.button(qt.QDialogButtonBox.Ok)
 
+        # The job generating the cohort, once the user has accepted
+        self._job: Optional[CohortGenerationJob] = None
+        # The generated cohort, once the job has finished
+        self.cohort: Optional[CohortModel] = None
+
         # Connections
         @qt.Slot(str)
         def onCohortChanged(new_txt: str):
@@ -1058,9 +1494,13 @@ class NewCohortDialog(ChangeTrackingDialogue):
         def onButtonClicked(button: qt.QPushButton):
             button_role = buttonBox.buttonRole(button)
             if button_role == qt.QDialogButtonBox.RejectRole:
-                self.reject()
+                # If the cohort is being generated, stop that instead of closing
+                if self.is_generating:
+                    self.cancelGeneration()
+                else:
+                    self.reject()
             elif button_role == qt.QDialogButtonBox.AcceptRole:
-                self.accept()
+                self.startGeneration()
             else:
                 raise ValueError("Pressed a button with an invalid role!")
 
@@ -1082,11 +1522,94 @@ class NewCohortDialog(ChangeTrackingDialogue):
         # noinspection PyTypeChecker
         return CASE_GENERATORS.get(self._cohortTypeComboBox.currentText, None)
 
+    @property
+    def is_generating(self) -> bool:
+        return self._job is not None and self._job.is_running
+
     def validate(self):
         # Enable/disable the button based on current values
         self._ok_button.setEnabled(
-            self.cohort_file is not None and self.current_generator
+            self.cohort_file is not None and self.current_generator and not self.is_generating
+        )
+
+    ## Generation ##
+    def startGeneration(self):
+        """
+        Begin generating the cohort in the background; the dialog is accepted
+        once it finishes.
+        """
+        self._job = CohortGenerationJob(
+            self.cohort_file, self.data_path, self.current_generator
         )
+        self._job.on_progress = self._onGenerationProgress
+        self._job.on_finished = self._onGenerationFinished
+
+        # Lock the inputs until the generation finishes (or is cancelled)
+        self._setInputsEnabled(False)
+        self._onGenerationProgress(self._job.progress)
+        self._generationStatusLabel.setVisible(True)
+        self._generationProgressBar.setVisible(True)
+
+        self._job.start()
+
+    def cancelGeneration(self):
+        """
+        Stop generating the cohort, letting the user adjust their selection.
+        """
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+        self._generationStatusLabel.setVisible(False)
+        self._generationProgressBar.setVisible(False)
+        self._setInputsEnabled(True)
+
+    def _setInputsEnabled(self, enabled: bool):
+        self._cohortFileEdit.setEnabled(enabled)
+        self._cohortTypeComboBox.setEnabled(enabled)
+        self.validate()
+
+    def _onGenerationProgress(self, progress: GenerationProgress):
+        if progress.finding_cases:
+            self._generationStatusLabel.setText(
+                _(f"Searching for cases; {progress.cases_found} found so far...")
+            )
+            # We don't know how many cases there are, so just show that we're busy
+            self._generationProgressBar.setRange(0, 0)
+        else:
+            self._generationStatusLabel.setText(
+                _(
+                    f"Found {progress.cases_found} cases; matching files "
+                    f"({progress.files_matched} of {progress.files_total})..."
+                )
+            )
+            self._generationProgressBar.setRange(0, max(progress.files_total, 1))
+            self._generationProgressBar.setValue(progress.files_matched)
+
+    def _onGenerationFinished(self, error: Optional[Exception]):
+        job, self._job = self._job, None
+        # If we failed, let the user know and allow them to try again
+        if error is not None:
+            self.cancelGeneration()
+            showErrorPrompt(
+                _(f"Failed to generate the cohort: {error}"), self
+            )
+            return
+        self.cohort = job.cohort
+        self.accept()
+
+    @qt.Slot(int)
+    def done(self, val: int):
+        # Make sure nothing keeps running in the background once we close
+        if self.is_generating:
+            self.cancelGeneration()
+        super().done(val)
+
+    # noinspection PyMethodOverriding
+    def closeEvent(self, event: qt.QCloseEvent = None):
+        super().closeEvent(event)
+        # Closing the window skips `done`, so make sure generation stops here too
+        if event.isAccepted() and self.is_generating:
+            self.cancelGeneration()
 
 
 class CohortEditorDialog(ChangeTrackingDialogue):
@@ -2,7 +2,7 @@ import json
 from abc import ABC, abstractmethod, ABCMeta
 from pathlib import Path
 import re
-from typing import Generic, Optional, TypeVar, Callable, TYPE_CHECKING
+from typing import Generic, Optional, TypeVar, Callable, TYPE_CHECKING, Union
 
 import qt
 
@@ -491,6 +491,143 @@ class MasterProfileConfig(DictBackedConfig):
         self.backing_dict[self.SKIP_TO_INCOMPLETE_KEY] = new_val
         self.has_changed = True
 
+    PROGRESSIVE_LOADING_KEY = "progressive_loading"
+
+    @property
+    def progressive_loading(self) -> bool:
+        """
+        Dictates whether CART should display each case as soon as its reference
+        volume has loaded, streaming in the rest of its resources afterward.
+        """
+        return self.get_or_default(self.PROGRESSIVE_LOADING_KEY, False)
+
+    @progressive_loading.setter
+    def progressive_loading(self, new_val: bool):
+        self.backing_dict[self.PROGRESSIVE_LOADING_KEY] = new_val
+        self.has_changed = True
+
+    CACHE_BUDGET_KEY = "cache_budget"
+    AUTO_CACHE_BUDGET = "auto"
+
+    @property
+    def cache_budget(self) -> Union[int, str]:
+        """
+        The amount of memory (in bytes) that cases held in memory are allowed to
+        use before the least recently used ones are unloaded. If "auto", this
+        is derived from the memory available when a job is started instead.
+        """
+        return self.get_or_default(self.CACHE_BUDGET_KEY, self.AUTO_CACHE_BUDGET)
+
+    @cache_budget.setter
+    def cache_budget(self, new_val: Union[int, str]):
+        # Confirm the value is either a valid byte count or "auto"
+        if new_val != self.AUTO_CACHE_BUDGET and (
+            type(new_val) != int or new_val < 0
+        ):
+            raise ValueError(
+                f"Cache budget must be a positive integer or '{self.AUTO_CACHE_BUDGET}'!"
+            )
+        self.backing_dict[self.CACHE_BUDGET_KEY] = new_val
+        self.has_changed = True
+
+    NODE_POOL_LIMIT_KEY = "node_pool_limit"
+    DEFAULT_NODE_POOL_LIMIT = 8
+
+    @property
+    def node_pool_limit(self) -> int:
+        """
+        The number of unused MRML nodes (of each type) CART keeps around to
+        re-use for later cases, rather than deleting and re-creating them.
+        """
+        return self.get_or_default(
+            self.NODE_POOL_LIMIT_KEY, self.DEFAULT_NODE_POOL_LIMIT
+        )
+
+    @node_pool_limit.setter
+    def node_pool_limit(self, new_val: int):
+        if type(new_val) != int or new_val < 0:
+            raise ValueError("Node pool limit must be a positive integer!")
+        self.backing_dict[self.NODE_POOL_LIMIT_KEY] = new_val
+        self.has_changed = True
+
+    SPILL_BUDGET_KEY = "spill_budget"
+    DEFAULT_SPILL_BUDGET = 2 * 1024 ** 3
+
+    @property
+    def spill_budget(self) -> int:
+        """
+        The amount of scratch disk space (in bytes) CART can use to keep the
+        unsaved edits of cases which were unloaded from memory. If 0, edits
+        are lost once their case is unloaded instead.
+        """
+        return self.get_or_default(self.SPILL_BUDGET_KEY, self.DEFAULT_SPILL_BUDGET)
+
+    @spill_budget.setter
+    def spill_budget(self, new_val: int):
+        if type(new_val) != int or new_val < 0:
+            raise ValueError("Spill budget must be a positive integer!")
+        self.backing_dict[self.SPILL_BUDGET_KEY] = new_val
+        self.has_changed = True
+
+    SCAN_WORKERS_KEY = "scan_workers"
+    DEFAULT_SCAN_WORKERS = 8
+
+    @property
+    def scan_workers(self) -> int:
+        """
+        The number of directories CART lists at once when searching data
+        directories for cases and their files. Higher values help most on
+        network drives; 1 searches one directory at a time.
+        """
+        return self.get_or_default(self.SCAN_WORKERS_KEY, self.DEFAULT_SCAN_WORKERS)
+
+    @scan_workers.setter
+    def scan_workers(self, new_val: int):
+        if type(new_val) != int or new_val < 1:
+            raise ValueError("Scan worker count must be a positive integer!")
+        self.backing_dict[self.SCAN_WORKERS_KEY] = new_val
+        self.has_changed = True
+
+    VOXEL_CACHE_DIR_KEY = "voxel_cache_dir"
+
+    @property
+    def voxel_cache_dir(self) -> Optional[Path]:
+        """
+        Where decoded volume files should be cached on disk, so they load
+        faster the next time they are used. If None, nothing is cached.
+        """
+        cache_dir = self.backing_dict.get(self.VOXEL_CACHE_DIR_KEY, None)
+        if cache_dir is None:
+            return None
+        return Path(cache_dir)
+
+    @voxel_cache_dir.setter
+    def voxel_cache_dir(self, new_dir: Optional[Path]):
+        if new_dir is not None:
+            new_dir = str(new_dir)
+        self.backing_dict[self.VOXEL_CACHE_DIR_KEY] = new_dir
+        self.has_changed = True
+
+    VOXEL_CACHE_BUDGET_KEY = "voxel_cache_budget"
+    DEFAULT_VOXEL_CACHE_BUDGET = 20 * 1024 ** 3
+
+    @property
+    def voxel_cache_budget(self) -> int:
+        """
+        The amount of disk space (in bytes) the decoded volume cache can use
+        before the least recently used entries are deleted.
+        """
+        return self.get_or_default(
+            self.VOXEL_CACHE_BUDGET_KEY, self.DEFAULT_VOXEL_CACHE_BUDGET
+        )
+
+    @voxel_cache_budget.setter
+    def voxel_cache_budget(self, new_val: int):
+        if type(new_val) != int or new_val < 0:
+            raise ValueError("Voxel cache budget must be a positive integer!")
+        self.backing_dict[self.VOXEL_CACHE_BUDGET_KEY] = new_val
+        self.has_changed = True
+
     ## Utilities ##
     def save_without_parent(self) -> None:
         """
@@ -1,9 +1,14 @@
 import itertools
 from datetime import datetime
 import json
-from functools import singledispatch
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial, singledispatch
 from pathlib import Path
-from typing import Any, Optional, Protocol, TYPE_CHECKING
+from threading import Lock
+from typing import Any, Callable, NamedTuple, Optional, Protocol, TYPE_CHECKING
 
 import numpy as np
 
@@ -18,10 +23,15 @@ from CARTLib.utils.config import (
     MasterProfileConfig,
     ResourceSpecificConfig,
 )
+from CARTLib.utils.node_pool import MRMLNodePool
+from CARTLib.utils.spill import SpilledState, SpillStore
+from CARTLib.utils.timing import traced
+from CARTLib.utils.voxel_cache import VoxelDiskCache
 
 # These become available when Slicer initializes
 # noinspection PyUnresolvedReferences
 import vtk
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 if TYPE_CHECKING:
     # NOTE: this isn't perfect (this only exposes Widgets, and Slicer's QT impl
@@ -33,8 +43,206 @@ if TYPE_CHECKING:
 NIFTI_SIDECAR_LABELS_KEY = "Labels"
 GENERATED_BY_KEY = "GeneratedBy"
 
+# File suffixes Slicer strips when naming a node after the file it came from
+VOLUME_FILE_SUFFIXES = (".seg.nrrd", ".nii.gz", ".nii", ".nrrd", ".mha", ".mhd")
+
+
+## DECODING ##
+class DecodedVolume(NamedTuple):
+    """
+    The voxel data and geometry of a volume file, decoded without touching the
+    MRML scene. Can be built on any thread, and then turned into a node on the
+    main thread via `load_volume` or `load_label`.
+    """
+    source: Path
+    image_data: vtk.vtkImageData
+    ijk_to_ras: vtk.vtkMatrix4x4
+
+
+@traced()
+def decode_volume(path: Path) -> DecodedVolume:
+    """
+    Read and decode a volume file into memory.
+
+    This does NOT interact with the MRML scene in any way, and is therefore
+    safe to run from a background thread. This is where the bulk of the time
+    spent loading a (compressed) volume goes, so doing it ahead of time lets
+    the main thread only handle building the corresponding node.
+
+    If the persistent voxel cache (`VOXEL_CACHE`) is enabled, the file's
+    decoded contents are pulled from (or, failing that, added to) it.
+
+    :param path: Path to the file
+    """
+    # If we've decoded this file before, just use that
+    cached = VOXEL_CACHE.get(path)
+    if cached is not None:
+        return DecodedVolume(path, *cached)
+
+    # These become available when Slicer initializes
+    # noinspection PyUnresolvedReferences
+    import vtkITK
+
+    # Read the file using the same reader Slicer's volume storage node uses
+    reader = vtkITK.vtkITKArchetypeImageSeriesScalarReader()
+    reader.SetArchetype(str(path))
+    reader.SetOutputScalarTypeToNative()
+    reader.SetDesiredCoordinateOrientationToNative()
+    reader.SetUseNativeOriginOn()
+    reader.Update()
+    if reader.GetErrorCode() != 0:
+        raise ValueError(f"Failed to decode volume file '{path}'.")
+
+    # Detach the image from the reader, normalizing its geometry; like Slicer,
+    # we track this via the IJK -> RAS matrix instead
+    image_data = vtk.vtkImageData()
+    image_data.DeepCopy(reader.GetOutput())
+    image_data.SetOrigin(0, 0, 0)
+    image_data.SetSpacing(1, 1, 1)
+
+    # Slicer's reader provides the RAS -> IJK matrix; invert it for our purposes
+    ijk_to_ras = vtk.vtkMatrix4x4()
+    vtk.vtkMatrix4x4.Invert(reader.GetRasToIjkMatrix(), ijk_to_ras)
+
+    # Keep the decoded contents around for next time
+    VOXEL_CACHE.put(path, image_data, ijk_to_ras)
+
+    return DecodedVolume(path, image_data, ijk_to_ras)
+
+
+# Persistent cache of decoded volume files; disabled until CART configures it
+VOXEL_CACHE = VoxelDiskCache()
+
+# Idle MRML nodes, kept around so new data units can re-use them
+NODE_POOL = MRMLNodePool()
+
+# Unsaved edits of data units which were unloaded; cleared whenever a job closes
+SPILLED_EDITS = SpillStore()
+
+
+class _DecodedVolumeStore:
+    """
+    Thread-safe hand-off point for volumes decoded ahead of time.
+
+    Background workers `stage` decoded volumes here; the next `load_volume`
+    (or `load_label`) call for the same file then `take`s it, skipping the
+    decoding step entirely. Anything which will not be used should be
+    `discard`ed, to avoid holding onto the voxel data indefinitely.
+    """
+
+    def __init__(self):
+        self._staged: dict[str, DecodedVolume] = dict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key_for(path: Path) -> str:
+        return str(Path(path).absolute())
+
+    def stage(self, decoded: DecodedVolume):
+        with self._lock:
+            self._staged[self._key_for(decoded.source)] = decoded
+
+    def take(self, path: Path) -> Optional[DecodedVolume]:
+        with self._lock:
+            return self._staged.pop(self._key_for(path), None)
+
+    def is_staged(self, path: Path) -> bool:
+        with self._lock:
+            return self._key_for(path) in self._staged
+
+    def discard(self, *paths: Path):
+        with self._lock:
+            for p in paths:
+                self._staged.pop(self._key_for(p), None)
+
+    def clear(self):
+        with self._lock:
+            self._staged.clear()
+
+
+DECODED_VOLUMES = _DecodedVolumeStore()
+
+# Workers used to decode a data unit's files in parallel
+_RESOURCE_DECODER = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="CARTResourceDecode"
+)
+
+
+def decode_in_background(paths: list[Path]) -> dict[Path, Future]:
+    """
+    Start decoding a set of volume files on background threads, staging each
+    in `DECODED_VOLUMES` once it's done.
+
+    Files which are already staged are skipped. Files which fail to decode are
+    skipped as well; loading them normally will report the error instead.
+
+    Returns a future for each file this call started decoding, which resolves
+    to whether it was staged; be sure to `discard` any which end up not being
+    used (once they're done)!
+    """
+    def _decode(p: Path) -> bool:
+        try:
+            DECODED_VOLUMES.stage(decode_volume(p))
+        except Exception:
+            return False
+        return True
+
+    return {
+        p: _RESOURCE_DECODER.submit(_decode, p)
+        for p in dict.fromkeys(paths)
+        if not DECODED_VOLUMES.is_staged(p)
+    }
+
+
+@traced()
+def decode_in_parallel(paths: list[Path]) -> list[Path]:
+    """
+    Decode a set of volume files simultaneously, staging each in
+    `DECODED_VOLUMES` so the next `load_volume` (or `load_label`) call for it
+    only needs to build its node. Blocks until every file is done.
+
+    Returns the list of files which were staged by this call; be sure to
+    `discard` any which end up not being used!
+    """
+    jobs = decode_in_background(paths)
+    return [p for p, f in jobs.items() if f.result()]
+
+
+def _node_name_for(path: Path) -> str:
+    # Mimic Slicer's naming scheme; the file name with its suffixes stripped
+    name = path.name
+    for suffix in VOLUME_FILE_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return path.stem
+
+
+def _node_from_decoded(decoded: DecodedVolume, node_class: str):
+    """
+    Build a (hidden) volume node from a decoded volume, re-using an idle node
+    from `NODE_POOL` if one is available. MUST be run on the main thread, as it
+    modifies the MRML scene.
+    """
+    node = NODE_POOL.acquire(node_class, _node_name_for(decoded.source))
+    node.SetIJKToRASMatrix(decoded.ijk_to_ras)
+    node.SetAndObserveImageData(decoded.image_data)
+    # Track the source file, so saving/reloading behaves like a normal load
+    _set_storage_file(node, decoded.source)
+    node.CreateDefaultDisplayNodes()
+    return node
+
+
+def _set_storage_file(node, path: Path):
+    # Point the node's storage node at the file, creating one if needed
+    storage_node = node.GetStorageNode()
+    if storage_node is None:
+        node.AddDefaultStorageNode(str(path))
+    else:
+        storage_node.SetFileName(str(path))
+
 
 ## LOADING ##
+@traced()
 def load_volume(path: Path):
     """
     Load a file into Slicer as a Volume.
@@ -42,12 +250,24 @@ def load_volume(path: Path):
     Unlike slicer's default utility function, it will hide the volume from view
     by default to better work with CART's iterative DataUnit loading.
 
+    If the file was already decoded (and staged in `DECODED_VOLUMES`), that
+    data is used instead of reading the file again. Otherwise, if the
+    persistent voxel cache is enabled, the file is loaded through it.
+
     :param path: Path to the file
     """
+    # If the volume was decoded ahead of time, just build the node from it
+    decoded = DECODED_VOLUMES.take(path)
+    if decoded is not None:
+        return _node_from_decoded(decoded, "vtkMRMLScalarVolumeNode")
+    # If we're caching decoded volumes, route the load through the cache
+    if VOXEL_CACHE.enabled:
+        return _node_from_decoded(decode_volume(path), "vtkMRMLScalarVolumeNode")
     # Load the file into a volume node, hidden from view
     return slicer.util.loadVolume(path, {"show": False})
 
 
+@traced()
 def load_label(path: Path):
     """
     Load a file into Slicer as a LabelVolume.
@@ -55,12 +275,24 @@ def load_label(path: Path):
     Unlike slicer's default utility function, it will hide the label from view
     by default to better work with CART's iterative DataUnit loading.
 
+    If the file was already decoded (and staged in `DECODED_VOLUMES`), that
+    data is used instead of reading the file again. Otherwise, if the
+    persistent voxel cache is enabled, the file is loaded through it.
+
     :param path: Path to the file
     """
+    # If the label was decoded ahead of time, just build the node from it
+    decoded = DECODED_VOLUMES.take(path)
+    if decoded is not None:
+        return _node_from_decoded(decoded, "vtkMRMLLabelMapVolumeNode")
+    # If we're caching decoded volumes, route the load through the cache
+    if VOXEL_CACHE.enabled:
+        return _node_from_decoded(decode_volume(path), "vtkMRMLLabelMapVolumeNode")
     # Load the file into a label node, hidden from view
     return slicer.util.loadLabelVolume(path, {"show": False})
 
 
+@traced()
 def load_segmentation(path: Path):
     """
     Load a file into Slicer as a Segmentation.
@@ -68,35 +300,113 @@ def load_segmentation(path: Path):
     Unlike slicer's default utility function, it will hide the segmentation from
     view by default to better work with CART's iterative DataUnit loading.
 
+    The file's labels are read once (re-using a copy staged in
+    `DECODED_VOLUMES`, if there is one) and placed directly into the
+    segmentation's binary labelmap, skipping the intermediate label volume node
+    Slicer would otherwise need. Segments are named, colored, and valued the
+    same way importing a label volume node would.
+
     :param path: Path to the file
     """
-    # We first have to load it as a label volume
-    label_node = load_label(path)
+    # Get the file's decoded labels, reading it only if it wasn't done ahead of time
+    decoded = DECODED_VOLUMES.take(path)
+    if decoded is None:
+        decoded = decode_volume(path)
 
-    # Then pass its contents to a segmentation node
-    scene = slicer.mrmlScene
-    segment_node = scene.AddNewNodeByClass("vtkMRMLSegmentationNode")
-    slicer.modules.segmentations.logic().ImportLabelmapToSegmentationNode(
-        label_node, segment_node
-    )
+    # Build the segmentation from the labels directly
+    segment_node = _segmentation_from_decoded(decoded)
 
-    # Copy the source filename from the label node to the segmentation node
-    segment_node.AddDefaultStorageNode()
-    storage_node = segment_node.GetStorageNode()
-    print("IGNORE THE FOLLOWING ERROR, VTK IS DRUNK!")
-    storage_node.Copy(label_node.GetStorageNode())
+    # Track the source file, so saving/reloading behaves like a normal load
+    _set_storage_file(segment_node, path)
 
     # Hide it from view by default
     segment_node.SetDisplayVisibility(False)
 
-    # Remove the (now redundant) label node from the scene
-    scene.RemoveNode(label_node)
-    del label_node
-
     # Return the result
     return segment_node
 
 
+def _segmentation_from_decoded(decoded: DecodedVolume):
+    """
+    Build a segmentation node from a decoded label volume, with one segment
+    per (non-zero) label; all segments share the decoded voxels as their
+    labelmap layer. MUST be run on the main thread, as it modifies the MRML
+    scene.
+    """
+    image_data = decoded.image_data
+    voxels = vtk_to_numpy(image_data.GetPointData().GetScalars())
+
+    # Segment label values must be integers; round any floating point labels
+    if voxels.dtype.kind == "f":
+        voxels = np.rint(voxels)
+        if voxels.size > 0:
+            int_type = np.result_type(
+                np.min_scalar_type(int(voxels.min())),
+                np.min_scalar_type(int(voxels.max())),
+            )
+        else:
+            int_type = np.uint8
+        voxels = voxels.astype(int_type)
+        image_data = _image_data_from_array(
+            voxels.reshape(image_data.GetDimensions()[::-1])
+        )
+
+    # Wrap the labels in an oriented image, which segmentations use as their layers
+    labelmap = slicer.vtkOrientedImageData()
+    labelmap.ShallowCopy(image_data)
+    labelmap.SetImageToWorldMatrix(decoded.ijk_to_ras)
+
+    # Prepare the (empty) segmentation, matching the geometry of the labels
+    scene = slicer.mrmlScene
+    segment_node = NODE_POOL.acquire("vtkMRMLSegmentationNode", _node_name_for(decoded.source))
+    segment_node.CreateDefaultDisplayNodes()
+    segmentation = segment_node.GetSegmentation()
+    converter = slicer.vtkSegmentationConverter
+    segmentation.SetConversionParameter(
+        converter.GetReferenceImageGeometryParameterName(),
+        converter.SerializeImageGeometry(labelmap),
+    )
+
+    # Name and color segments after the color table label volumes use by default
+    color_node = scene.GetNodeByID(
+        slicer.modules.colors.logic().GetDefaultLabelMapColorNodeID()
+    )
+    base_name = _node_name_for(decoded.source)
+    representation_name = converter.GetSegmentationBinaryLabelmapRepresentationName()
+
+    # Add a segment for each label, all sharing the same labelmap
+    was_modified = segment_node.StartModify()
+    for label in _label_values(voxels):
+        label = int(label)
+        segment = slicer.vtkSegment()
+        segment_name = color_node.GetColorName(label) if color_node else ""
+        segment.SetName(segment_name or f"{base_name}_{label}")
+        if color_node:
+            rgba = [0.0, 0.0, 0.0, 0.0]
+            color_node.GetColor(label, rgba)
+            segment.SetColor(*rgba[:3])
+        segment.SetLabelValue(label)
+        segment.AddRepresentation(representation_name, labelmap)
+        segmentation.AddSegment(segment)
+    segment_node.EndModify(was_modified)
+
+    return segment_node
+
+
+def _label_values(voxels: np.ndarray) -> np.ndarray:
+    # The distinct non-zero values in a label array, in ascending order
+    if voxels.size == 0:
+        return np.empty(0, dtype=voxels.dtype)
+    flat = voxels.ravel()
+    # Counting is much faster than sorting for the small, positive labels typically used
+    if flat.dtype != np.uint64 and flat.min() >= 0 and flat.max() < 2 ** 16:
+        values = np.flatnonzero(np.bincount(flat))
+        return values[values != 0]
+    values = np.unique(flat)
+    return values[values != 0]
+
+
+@traced()
 def load_markups(path: Path) -> list[slicer.vtkMRMLMarkupsFiducialNode]:
     # If the path points to a NIfTI file, load it using our custom loader
     if ".nii" in path.suffixes:
@@ -195,49 +505,23 @@ def load_nifti_markups(path: Path) -> slicer.vtkMRMLMarkupsFiducialNode:
         # Get the set of indices for non-zero values in the "volume"
         nonzero_map = np.nonzero(volume_array)
 
-        # It is exceedingly unlikely that a NIfTI-style markup has more than
-        # 100 markups in it; if this is the case, warn the user!
-        if nonzero_map[0].shape[0] > 100:
+        # It is exceedingly unlikely that a NIfTI-style markup has this many
+        # markups in it; if this is the case, warn the user!
+        if nonzero_map[0].shape[0] > 100000:
             print(
                 f"WARNING: The number of markups in the NIfTI file '{path}' "
-                "is abnormally large (more than 100), and will likely cause lag.\n"
+                "is abnormally large (more than 100,000).\n"
                 "Are you sure this is a markup-style NIfTI file?"
             )
 
         # Generate an empty markup node
-        markup_node = slicer.mrmlScene.AddNewNodeByClass(
+        markup_node = NODE_POOL.acquire(
             'vtkMRMLMarkupsFiducialNode',
             'new_cart_nifti_markup'
         )
 
-        # Generate our IJK -> RAS transformation function
-        ijk_to_ras_transform = vtk.vtkMatrix4x4()
-        volume_rep_node.GetIJKToRASMatrix(ijk_to_ras_transform)
-        def _ijk_to_ras(ijk_pos):
-            # Extend the IJK position to 4 dimensions to allow quaternion transforms
-            ijk_pos_4d = np.array([
-                # KO: No clue why the IJK needs to be flipped here...
-                ijk_pos[2], ijk_pos[1], ijk_pos[0], 1
-            ])
-
-            # Apply the quaternion IJK -> RAS transform
-            vol_pos_4d = [0, 0, 0, 1]
-            ijk_to_ras_transform.MultiplyPoint(ijk_pos_4d, vol_pos_4d)
-
-            # Trim the 4th value, as it isn't relevant
-            vol_pos = np.array(vol_pos_4d[0:3])
-
-            # Apply any (implicit) transforms the reference volume may have as well
-            volume_to_ras_transform = vtk.vtkGeneralTransform()
-            slicer.vtkMRMLTransformNode.GetTransformBetweenNodes(
-                volume_rep_node.GetParentTransformNode(),
-                None,
-                volume_to_ras_transform
-            )
-            ras_pos = volume_to_ras_transform.TransformPoint(vol_pos)
-
-            # Return the result
-            return ras_pos
+        # Convert every voxel position into RAS co-ordinates at once
+        ras_positions = _ijk_to_ras_positions(volume_rep_node, nonzero_map)
 
         # Load the label map from a JSON sidecar, if it exists
         sidecar_data = load_json_sidecar(path)
@@ -248,24 +532,24 @@ def load_nifti_markups(path: Path) -> slicer.vtkMRMLMarkupsFiducialNode:
                 in sidecar_data.get(NIFTI_SIDECAR_LABELS_KEY, {}).items()
             }
 
-        # For each position in the nonzero map, add a new markup label
-        for ijk_pos in np.transpose(nonzero_map):
-            # Get the value at this point; it will determine our label
-            val = volume_array[ijk_pos[0], ijk_pos[1], ijk_pos[2]]
+        # Determine the label for each distinct value, then map them to each markup
+        unique_vals, val_idx = np.unique(volume_array[nonzero_map], return_inverse=True)
+        unique_labels = [str(val) for val in unique_vals]
+        if label_map is not None:
+            unique_labels = [
+                label_map.get(val, label) for val, label in zip(unique_vals, unique_labels)
+            ]
 
-            # Calculate the Voxel position into RAS co-ordinates
-            ras_pos = _ijk_to_ras(ijk_pos)
-
-            # Determine the label for this markup
-            label = str(val)
-            if label_map is not None:
-                label = label_map.get(val, label)
-
-            # Add a new markup label at this position
-            markup_node.AddControlPointWorld(
-                (ras_pos[0], ras_pos[1], ras_pos[2]),
-                label
+        # Add all markups in one go, batching the events this would otherwise fire
+        was_modifying = markup_node.StartModify()
+        try:
+            slicer.util.updateMarkupsControlPointsFromArray(
+                markup_node, ras_positions, world=True
             )
+            for i, label_i in enumerate(val_idx):
+                markup_node.SetNthControlPointLabel(i, unique_labels[label_i])
+        finally:
+            markup_node.EndModify(was_modifying)
 
         # Finally, copy the volume node's other attributes over
         markup_node.AddDefaultStorageNode()
@@ -275,18 +559,242 @@ def load_nifti_markups(path: Path) -> slicer.vtkMRMLMarkupsFiducialNode:
     except Exception as e:
         # If an error occurs, delete the markup node from the scene (if it exists)
         if markup_node:
-            slicer.mrmlScene.RemoveNode(markup_node)
+            NODE_POOL.release(markup_node)
         # THEN raise the error
         raise e
     finally:
         # No matter what happens, try to delete the volume node as well
         if volume_rep_node:
-            slicer.mrmlScene.RemoveNode(volume_rep_node)
+            NODE_POOL.release(volume_rep_node)
 
     # Return the resulting markup node
     return markup_node
 
 
+def _ijk_to_ras_positions(volume_node, kji_indices: tuple[np.ndarray, ...]) -> np.ndarray:
+    """
+    Convert a set of voxel indices (in KJI order, as produced by `np.nonzero` on
+    `slicer.util.arrayFromVolume`'s output) into world (RAS) positions.
+
+    The transforms are resolved once and applied to every point at once,
+    rather than point-by-point.
+
+    :return: An (N, 3) array of RAS positions.
+    """
+    # Build homogenous IJK co-ordinates; the array's axes are in KJI order
+    k, j, i = kji_indices
+    ijk_4d = np.stack([i, j, k, np.ones_like(i)]).astype(float)
+
+    # Apply the IJK -> (volume) RAS transform to all points at once
+    ijk_to_ras_transform = vtk.vtkMatrix4x4()
+    volume_node.GetIJKToRASMatrix(ijk_to_ras_transform)
+    vol_positions = (slicer.util.arrayFromVTKMatrix(ijk_to_ras_transform) @ ijk_4d)[:3].T
+
+    # Apply any (implicit) transforms the volume may have as well
+    return _transform_between_nodes(
+        volume_node.GetParentTransformNode(), None, vol_positions
+    )
+
+
+def _transform_between_nodes(source_node, target_node, positions: np.ndarray) -> np.ndarray:
+    """
+    Transform an (N, 3) array of positions from one transform node's co-ordinate
+    space to another's (with None being the world space), resolving the
+    transform between them only once.
+    """
+    # If both spaces are the same, there's nothing to do
+    if source_node is target_node:
+        return positions
+    # Linear transforms can just be applied as a matrix
+    transform_matrix = vtk.vtkMatrix4x4()
+    if slicer.vtkMRMLTransformNode.GetMatrixTransformBetweenNodes(
+        source_node, target_node, transform_matrix
+    ):
+        positions_4d = np.hstack([positions, np.ones((positions.shape[0], 1))])
+        return (slicer.util.arrayFromVTKMatrix(transform_matrix) @ positions_4d.T)[:3].T
+    # Otherwise, let VTK transform all the points in bulk
+    general_transform = vtk.vtkGeneralTransform()
+    slicer.vtkMRMLTransformNode.GetTransformBetweenNodes(
+        source_node, target_node, general_transform
+    )
+    return _transform_positions(general_transform, positions)
+
+
+def _transform_positions(transform: "vtk.vtkAbstractTransform", positions: np.ndarray) -> np.ndarray:
+    # Apply a (potentially non-linear) VTK transform to an (N, 3) array of positions
+    in_points = vtk.vtkPoints()
+    in_points.SetData(numpy_to_vtk(np.ascontiguousarray(positions, dtype=float), deep=True))
+    out_points = vtk.vtkPoints()
+    transform.TransformPoints(in_points, out_points)
+    return vtk_to_numpy(out_points.GetData()).copy()
+
+
+## SPILLING ##
+def segmentation_edit_stamp(segment_node) -> tuple:
+    """
+    A stamp which changes whenever a segmentation's voxels (or segments) do;
+    compare it against an earlier one to check whether it was edited since.
+    """
+    segmentation = segment_node.GetSegmentation()
+    layer_times = [
+        segmentation.GetLayerObject(i).GetMTime()
+        for i in range(segmentation.GetNumberOfLayers())
+    ]
+    return segmentation.GetNumberOfSegments(), *layer_times
+
+
+def markups_edit_stamp(markups_node) -> tuple:
+    """
+    A stamp which changes whenever a markup's control points do; compare it
+    against an earlier one to check whether it was edited since.
+    """
+    positions = slicer.util.arrayFromMarkupsControlPoints(markups_node)
+    labels = tuple(
+        markups_node.GetNthControlPointLabel(i)
+        for i in range(markups_node.GetNumberOfControlPoints())
+    )
+    return positions.tobytes(), labels
+
+
+def spill_segmentation(segment_node, prefix: str) -> tuple[dict[str, np.ndarray], dict]:
+    """
+    Copy a segmentation's labelmap layers (and the segments within them) out of
+    the MRML scene, such that `restore_segmentation` can rebuild it exactly.
+
+    :param segment_node: The segmentation node to copy.
+    :param prefix: Prefix for the names of the returned arrays.
+    :return: The voxels of each layer, alongside the metadata needed to rebuild them.
+    """
+    segmentation = segment_node.GetSegmentation()
+    converter = slicer.vtkSegmentationConverter
+    representation_name = converter.GetSegmentationBinaryLabelmapRepresentationName()
+    if segmentation.GetSourceRepresentationName() != representation_name:
+        raise ValueError(
+            f"Segmentation '{segment_node.GetName()}' is not stored as a labelmap, "
+            "and cannot be spilled."
+        )
+
+    # Copy each layer's voxels and geometry
+    arrays = dict()
+    layers = []
+    for i in range(segmentation.GetNumberOfLayers()):
+        layer = segmentation.GetLayerObject(i)
+        scalars = layer.GetPointData().GetScalars()
+        if scalars is not None:
+            arrays[f"{prefix}_layer_{i}"] = vtk_to_numpy(scalars).copy()
+        image_to_world = vtk.vtkMatrix4x4()
+        layer.GetImageToWorldMatrix(image_to_world)
+        layers.append({
+            "extent": list(layer.GetExtent()),
+            "image_to_world": [image_to_world.GetElement(r, c) for r in range(4) for c in range(4)],
+        })
+
+    # Track the segments within them, in order
+    segments = []
+    for segment_id in segmentation.GetSegmentIDs():
+        segment = segmentation.GetSegment(segment_id)
+        segments.append({
+            "id": segment_id,
+            "name": segment.GetName(),
+            "color": list(segment.GetColor()),
+            "label_value": segment.GetLabelValue(),
+            "layer": segmentation.GetLayerIndex(segment_id),
+        })
+
+    meta = {
+        "name": segment_node.GetName(),
+        "prefix": prefix,
+        "reference_geometry": segmentation.GetConversionParameter(
+            converter.GetReferenceImageGeometryParameterName()
+        ),
+        "layers": layers,
+        "segments": segments,
+    }
+    return arrays, meta
+
+
+def restore_segmentation(arrays: dict[str, np.ndarray], meta: dict):
+    """
+    Rebuild a segmentation node copied by `spill_segmentation`. MUST be run on
+    the main thread, as it modifies the MRML scene.
+    """
+    prefix = meta["prefix"]
+
+    # Rebuild each of its layers
+    layers = []
+    for i, layer_meta in enumerate(meta["layers"]):
+        layer = slicer.vtkOrientedImageData()
+        layer.SetExtent(*layer_meta["extent"])
+        voxels = arrays.get(f"{prefix}_layer_{i}")
+        if voxels is not None:
+            layer.GetPointData().SetScalars(numpy_to_vtk(voxels, deep=True))
+        image_to_world = vtk.vtkMatrix4x4()
+        image_to_world.DeepCopy(layer_meta["image_to_world"])
+        layer.SetImageToWorldMatrix(image_to_world)
+        layers.append(layer)
+
+    # Prepare the (empty) segmentation, matching the geometry it had before
+    segment_node = NODE_POOL.acquire("vtkMRMLSegmentationNode", meta["name"])
+    segment_node.CreateDefaultDisplayNodes()
+    segmentation = segment_node.GetSegmentation()
+    converter = slicer.vtkSegmentationConverter
+    segmentation.SetConversionParameter(
+        converter.GetReferenceImageGeometryParameterName(), meta["reference_geometry"]
+    )
+    representation_name = converter.GetSegmentationBinaryLabelmapRepresentationName()
+
+    # Place each segment back into the layer it came from
+    was_modified = segment_node.StartModify()
+    for segment_meta in meta["segments"]:
+        segment = slicer.vtkSegment()
+        segment.SetName(segment_meta["name"])
+        segment.SetColor(*segment_meta["color"])
+        segment.SetLabelValue(segment_meta["label_value"])
+        segment.AddRepresentation(representation_name, layers[segment_meta["layer"]])
+        segmentation.AddSegment(segment, segment_meta["id"])
+    segment_node.EndModify(was_modified)
+
+    # Hide it from view by default, like a freshly loaded segmentation
+    segment_node.SetDisplayVisibility(False)
+    return segment_node
+
+
+def spill_markups(markups_node, prefix: str) -> tuple[dict[str, np.ndarray], dict]:
+    """
+    Copy a markup's control points out of the MRML scene, such that
+    `restore_markups` can rebuild it.
+
+    :param markups_node: The markups node to copy.
+    :param prefix: Prefix for the names of the returned arrays.
+    :return: The control points' positions, alongside the metadata needed to rebuild them.
+    """
+    positions = slicer.util.arrayFromMarkupsControlPoints(markups_node)
+    meta = {
+        "name": markups_node.GetName(),
+        "prefix": prefix,
+        "labels": [
+            markups_node.GetNthControlPointLabel(i)
+            for i in range(markups_node.GetNumberOfControlPoints())
+        ],
+    }
+    return {f"{prefix}_positions": positions}, meta
+
+
+def restore_markups(arrays: dict[str, np.ndarray], meta: dict):
+    """
+    Rebuild a markups node copied by `spill_markups`. MUST be run on the main
+    thread, as it modifies the MRML scene.
+    """
+    markups_node = NODE_POOL.acquire("vtkMRMLMarkupsFiducialNode", meta["name"])
+    markups_node.CreateDefaultDisplayNodes()
+    positions = arrays[f"{meta['prefix']}_positions"]
+    slicer.util.updateMarkupsControlPointsFromArray(markups_node, positions)
+    for i, label in enumerate(meta["labels"]):
+        markups_node.SetNthControlPointLabel(i, label)
+    markups_node.SetDisplayVisibility(False)
+    return markups_node
+
+
 ## SAVING ##
 def save_volume_to_nifti(volume_node, path: Path):
     """
@@ -318,7 +826,7 @@ def save_segmentation_to_nifti(segment_node, volume_node, path: Path):
         )
 
     # Convert the Segmentation back to a Label (for Nifti export)
-    label_node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLLabelMapVolumeNode")
+    label_node = NODE_POOL.acquire("vtkMRMLLabelMapVolumeNode")
     try:
         slicer.modules.segmentations.logic().ExportVisibleSegmentsToLabelmapNode(
             segment_node, label_node, volume_node
@@ -328,7 +836,80 @@ def save_segmentation_to_nifti(segment_node, volume_node, path: Path):
         slicer.util.saveNode(label_node, str(path))
     finally:
         # Clean up the label node after so it doesn't pollute the scene
-        slicer.mrmlScene.RemoveNode(label_node)
+        NODE_POOL.release(label_node)
+
+
+class LabelSnapshot(NamedTuple):
+    """
+    A copy of a segmentation's voxels (as a label map) and geometry, detached
+    from the MRML scene. Can be written to file on any thread via
+    `write_label_snapshot_to_nifti`.
+    """
+    image_data: vtk.vtkImageData
+    ras_to_ijk: vtk.vtkMatrix4x4
+
+
+def snapshot_segmentation_as_label(segment_node, volume_node) -> LabelSnapshot:
+    """
+    Export a segmentation node's visible segments into a label map, copying
+    its contents out of the MRML scene.
+
+    Must be run on the main thread; what it returns, however, can then be
+    saved from any thread (see `write_label_snapshot_to_nifti`).
+    """
+    label_node = NODE_POOL.acquire("vtkMRMLLabelMapVolumeNode")
+    try:
+        slicer.modules.segmentations.logic().ExportVisibleSegmentsToLabelmapNode(
+            segment_node, label_node, volume_node
+        )
+
+        # Copy the voxels and geometry, so later edits can't change them
+        image_data = vtk.vtkImageData()
+        image_data.DeepCopy(label_node.GetImageData())
+        ras_to_ijk = vtk.vtkMatrix4x4()
+        label_node.GetRASToIJKMatrix(ras_to_ijk)
+    finally:
+        # Clean up the label node after so it doesn't pollute the scene
+        NODE_POOL.release(label_node)
+
+    return LabelSnapshot(image_data, ras_to_ijk)
+
+
+@traced()
+def write_label_snapshot_to_nifti(snapshot: LabelSnapshot, path: Path):
+    """
+    Write a label map snapshot to a (compressed) `.nii` file.
+
+    This does NOT interact with the MRML scene in any way, and is therefore
+    safe to run from a background thread. The file is written to a temporary
+    path first, then moved into place, so an interrupted save never leaves a
+    partially written file behind.
+    """
+    # Confirm this is a NIfTI file
+    if ".nii" not in path.suffixes:
+        raise ValueError(
+            f"Refusing to save file '{path.name}' into NIfTI format; "
+            "ensure the file is a '.nii' file!"
+        )
+
+    # These become available when Slicer initializes
+    # noinspection PyUnresolvedReferences
+    import vtkITK
+
+    # Write the file using the same writer Slicer's volume storage node uses;
+    #  the temporary file keeps the extension, so ITK picks the right format
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".partial_{path.name}")
+    writer = vtkITK.vtkITKImageWriter()
+    writer.SetInputData(snapshot.image_data)
+    writer.SetFileName(str(tmp_path))
+    writer.SetRasToIJKMatrix(snapshot.ras_to_ijk)
+    writer.SetUseCompression(1)
+    writer.Write()
+    if writer.GetErrorCode() != 0 or not tmp_path.exists():
+        tmp_path.unlink(missing_ok=True)
+        raise ValueError(f"Failed to write label map to '{path}'.")
+    os.replace(tmp_path, path)
 
 
 def save_markups_to_json(markups_node, path: Path):
@@ -373,115 +954,90 @@ def save_markups_to_nifti(
             "ensure the file is a '.nii' file!"
         )
 
-    # Build the RAS (world) -> IJK (voxel) transform function
-    ras_to_kji_transform = vtk.vtkMatrix4x4()
-    reference_volume.GetRASToIJKMatrix(ras_to_kji_transform)
-
-    def _ras_to_ijk(ras_pos):
-        # Convert the RAS position to volume position
-        ras_to_volume_transform = vtk.vtkGeneralTransform()
-        slicer.vtkMRMLTransformNode.GetTransformBetweenNodes(
-            None,
-            reference_volume.GetParentTransformNode(),
-            ras_to_volume_transform
-        )
-        vol_pos = ras_to_volume_transform.TransformPoint(ras_pos)
+    # Group markup points of identical labels, in the order they first appear
+    n_points = markup_node.GetNumberOfControlPoints()
+    label_values: dict[str, int] = dict()
+    point_values = np.empty(n_points, dtype=int)
+    for i in range(n_points):
+        markup_label = markup_node.GetNthControlPointLabel(i)
+        point_values[i] = label_values.setdefault(markup_label, len(label_values) + 1)
 
-        # Extend the RAS position to 4 dimensions to allow quaternion transforms
-        vol_pos_4d = np.append(vol_pos, 1)
+    # Convert every markup's RAS position into a voxel index at once
+    ras_positions = slicer.util.arrayFromMarkupsControlPoints(markup_node, world=True)
+    kji_indices = _ras_to_kji_indices(reference_volume, ras_positions)
 
-        # Apply the quaternion RAS -> KJI transform
-        # KO: I don't know why it's not IJK by default; it just is
-        kji_pos_4d = [0, 0, 0, 1]
-        ras_to_kji_transform.MultiplyPoint(vol_pos_4d, kji_pos_4d)
+    # Fill a single label array (in KJI order, like Slicer's) with each markup's value
+    dims_kji = reference_volume.GetImageData().GetDimensions()[::-1]
+    if np.any(kji_indices < 0) or np.any(kji_indices >= dims_kji):
+        raise ValueError(
+            f"Refusing to save markups to '{path.name}'; "
+            "some lie outside the bounds of the reference volume!"
+        )
+    label_array = np.zeros(dims_kji, dtype=np.min_scalar_type(len(label_values)))
+    # Place higher values last, so they take priority where markups overlap
+    order = np.argsort(point_values, kind="stable")
+    k, j, i = kji_indices[order].T
+    label_array[k, j, i] = point_values[order]
+
+    # Initialize the JSON sidecar's contents
+    sidecar_data = {}
+    creation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # If we have a user profile, add its contents to the GeneratedBy entry
+    if master_profile:
+        sidecar_data[GENERATED_BY_KEY] = [{
+            "Name": "CART",
+            "Author": master_profile.author,
+            "Position": master_profile.position,
+            "Date": creation_time
+        }]
+    # Otherwise, just note that this was created by CART
+    else:
+        sidecar_data[GENERATED_BY_KEY] = [{
+            "Name": "CART",
+            "Date": creation_time
+        }]
 
-        # Trim the 4th value, as it isn't relevant
-        kji_pos = np.array([int(round(v)) for v in kji_pos_4d[0:3]])
+    # Add a map (dict) to track the label value -> label names in the sidecar
+    sidecar_data[NIFTI_SIDECAR_LABELS_KEY] = {v: label for label, v in label_values.items()}
 
-        # Flip the values from KJI into IJK
-        ijk_pos = np.array([
-            kji_pos[2], kji_pos[1], kji_pos[0]
-        ])
-        return ijk_pos
+    # Save the label array to the designated path, using the reference volume's geometry
+    ras_to_ijk = vtk.vtkMatrix4x4()
+    reference_volume.GetRASToIJKMatrix(ras_to_ijk)
+    snapshot = LabelSnapshot(_image_data_from_array(label_array), ras_to_ijk)
+    write_label_snapshot_to_nifti(snapshot, path)
 
-    # Group markup points of identical labels, and track their (voxel) positions
-    label_map = dict()
-    for i in range(markup_node.GetNumberOfControlPoints()):
-        # Pull the markups position and label
-        markup_label = markup_node.GetNthControlPointLabel(i)
-        markup_pos = markup_node.GetNthControlPointPositionWorld(i)
-        # Track it in the map
-        map_entry = label_map.get(markup_label, None)
-        if map_entry is None:
-            # If no entry for this label exists yet, assign one
-            map_entry = []
-            label_map[markup_label] = map_entry
-        # Convert the markup's RAS position to IJK voxel position
-        markup_ijk_pos = _ras_to_ijk(markup_pos)
-        # Track the result
-        map_entry.append(markup_ijk_pos)
-
-    markup_segment_node = None
-    try:
-        # Initialize the JSON sidecar's contents
-        sidecar_data = {}
-        creation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        # If we have a user profile, add its contents to the GeneratedBy entry
-        if master_profile:
-            sidecar_data[GENERATED_BY_KEY] = [{
-                "Name": "CART",
-                "Author": master_profile.author,
-                "Position": master_profile.position,
-                "Date": creation_time
-            }]
-        # Otherwise, just note that this was created by CART
-        else:
-            sidecar_data[GENERATED_BY_KEY] = [{
-                "Name": "CART",
-                "Date": creation_time
-            }]
+    # Save the sidecar alongside it
+    save_json_sidecar(path, sidecar_data)
 
-        # Add a map (dict) to track the label value -> label names in the sidecar
-        sidecar_labelmap = dict()
-        sidecar_data[NIFTI_SIDECAR_LABELS_KEY] = sidecar_labelmap
 
-        # Initiate a segmentation node to place the markup labels into
-        markup_segment_node = create_empty_segmentation_node(
-            name="CART_OUTPUT_TMP",
-            reference_volume=reference_volume
-        )
+def _ras_to_kji_indices(volume_node, ras_positions: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 3) array of world (RAS) positions into the (N, 3) array of
+    (rounded) voxel indices in a volume's array; these are in KJI order, to
+    match `slicer.util.arrayFromVolume`.
+    """
+    # Undo any (implicit) transforms the volume may have
+    vol_positions = _transform_between_nodes(
+        None, volume_node.GetParentTransformNode(), ras_positions
+    )
 
-        # Place segments into it, one per label
-        for idx, (label, pos_list) in enumerate(label_map.items()):
-            # Build the blank segment
-            segment_id = markup_segment_node.GetSegmentation().AddEmptySegment("", label)
-            segment_array = slicer.util.arrayFromSegmentBinaryLabelmap(
-                markup_segment_node,
-                segment_id,
-                reference_volume
-            )
-            # Mark the corresponding positions in the segment
-            for (i, j, k) in pos_list:
-                segment_array[i, j, k] = 1
-            # Update the segmentation using the updated segment array
-            slicer.util.updateSegmentBinaryLabelmapFromArray(
-                segment_array,
-                markup_segment_node,
-                segment_id,
-                reference_volume
-            )
-            # Add the corresponding label to the sidecar's label map
-            sidecar_labelmap[int(idx+1)] = label
+    # Apply the (volume) RAS -> IJK transform to all points at once
+    ras_to_ijk_transform = vtk.vtkMatrix4x4()
+    volume_node.GetRASToIJKMatrix(ras_to_ijk_transform)
+    vol_4d = np.hstack([vol_positions, np.ones((vol_positions.shape[0], 1))])
+    ijk_positions = (slicer.util.arrayFromVTKMatrix(ras_to_ijk_transform) @ vol_4d.T)[:3].T
 
-        # Save the segmentation to the designated path
-        save_segmentation_to_nifti(markup_segment_node, reference_volume, path)
+    # Round to the nearest voxel, flipping from IJK into KJI
+    return np.rint(ijk_positions[:, ::-1]).astype(int)
 
-        # Save the sidecar alongside it
-        save_json_sidecar(path, sidecar_data)
-    finally:
-        # Ensure that, no matter what, the segmentation node is removed
-        if markup_segment_node:
-            slicer.mrmlScene.RemoveNode(markup_segment_node)
+
+def _image_data_from_array(array: np.ndarray) -> vtk.vtkImageData:
+    # Wrap a (KJI ordered) voxel array into a new image
+    image_data = vtk.vtkImageData()
+    image_data.SetDimensions(*array.shape[::-1])
+    scalars = numpy_to_vtk(np.ascontiguousarray(array).ravel(), deep=True)
+    image_data.GetPointData().SetScalars(scalars)
+    return image_data
 
 
 ## SIDECAR FILES ##
@@ -528,9 +1084,11 @@ def save_json_sidecar(main_file_path: Path, sidecar_data: dict):
     # Get the path to where the sidecar should be
     sidecar_path = find_json_sidecar_path(main_file_path)
 
-    # Otherwise, try to load the contents of the file and return it
-    with open(sidecar_path, 'w') as fp:
+    # Write to a temporary file first, so an interrupted save can't corrupt it
+    tmp_path = sidecar_path.with_name(f".partial_{sidecar_path.name}")
+    with open(tmp_path, 'w') as fp:
         json.dump(sidecar_data, fp, indent=2)
+    os.replace(tmp_path, sidecar_path)
 
 
 # noinspection PyUnusedLocal
@@ -719,7 +1277,19 @@ def stack_json_dicts(source: dict, dest: dict):
             dest[k] = v
 
 
+## MEMORY ##
+def _voxel_array_size(image_data: Optional[vtk.vtkImageData]) -> int:
+    # The size, in bytes, of an image's voxel array (if it has one)
+    if image_data is None:
+        return 0
+    scalars = image_data.GetPointData().GetScalars()
+    if scalars is None:
+        return 0
+    return scalars.GetNumberOfValues() * scalars.GetDataTypeSize()
+
+
 ## ORGANIZATION ##
+@traced()
 def create_subject(label: str, *child_nodes):
     # Get Slicer's hierarchy node
     shNode = slicer.mrmlScene.GetSubjectHierarchyNode()
@@ -728,14 +1298,22 @@ def create_subject(label: str, *child_nodes):
     subject_id = shNode.CreateSubjectItem(shNode.GetSceneItemID(), label)
 
     # Have the new subject "adopt" all provided child nodes
-    for n in child_nodes:
-        n_id = shNode.GetItemByDataNode(n)
-        shNode.SetItemParent(n_id, subject_id)
+    add_to_subject(subject_id, *child_nodes)
 
     # Return the ID for the newly created subject
     return subject_id
 
 
+def add_to_subject(subject_id: int, *child_nodes):
+    # Get Slicer's hierarchy node
+    shNode = slicer.mrmlScene.GetSubjectHierarchyNode()
+
+    # Have the subject "adopt" all provided child nodes
+    for n in child_nodes:
+        n_id = shNode.GetItemByDataNode(n)
+        shNode.SetItemParent(n_id, subject_id)
+
+
 def create_empty_segmentation_node(
     name: str,
     reference_volume: slicer.vtkMRMLScalarVolumeNode,
@@ -757,15 +1335,19 @@ def create_empty_segmentation_node(
     if scene is None:
         scene = slicer.mrmlScene
 
-    # Create segmentation node
-    seg_node = slicer.vtkMRMLSegmentationNode()
-    scene.AddNode(seg_node)
-    seg_node.SetName(name)
+    # Create segmentation node, re-using an idle one if we can
+    if scene is slicer.mrmlScene:
+        seg_node = NODE_POOL.acquire("vtkMRMLSegmentationNode", name)
+    else:
+        seg_node = slicer.vtkMRMLSegmentationNode()
+        scene.AddNode(seg_node)
+        seg_node.SetName(name)
 
-    # Create and set up display node
-    display_node = slicer.vtkMRMLSegmentationDisplayNode()
-    scene.AddNode(display_node)
-    seg_node.SetAndObserveDisplayNodeID(display_node.GetID())
+    # Create and set up display node (re-used nodes already have one)
+    if seg_node.GetDisplayNode() is None:
+        display_node = slicer.vtkMRMLSegmentationDisplayNode()
+        scene.AddNode(display_node)
+        seg_node.SetAndObserveDisplayNodeID(display_node.GetID())
 
     # Set reference geometry
     seg_node.SetReferenceImageGeometryParameterFromVolumeNode(reference_volume)
@@ -933,6 +1515,18 @@ class CARTStandardUnit(DataUnitBase):
         MarkupResource.id: MarkupResource
     }
 
+    # If True, units only load their reference volume up front, streaming
+    # everything else in afterward (see `when_fully_loaded`)
+    progressive_loading: bool = False
+
+    # Whether units of this type may load progressively at all; only opt in
+    # if the tasks using them wait on `when_fully_loaded` before syncing or
+    # saving, as the unit's resources will otherwise be incomplete.
+    SUPPORTS_PROGRESSIVE_LOADING: bool = False
+
+    # How long (in ms) to wait before checking if a streamed resource has been decoded
+    STREAM_POLL_INTERVAL = 20
+
     def __init__(
         self,
         case_data: dict[str, str],
@@ -942,6 +1536,22 @@ class CARTStandardUnit(DataUnitBase):
     ) -> None:
         super().__init__(case_data, data_path, scene)
 
+        # Whether this unit is currently in focus; resources streamed in later should match
+        self._in_focus: bool = False
+
+        # Load steps yet to be run, alongside the files each needs decoded beforehand
+        self._load_queue: list[tuple[list[Path], Callable[[], None]]] = list()
+        # Files being decoded in the background for those load steps
+        self._decoding: dict[Path, Future] = dict()
+
+        # The error which stopped resources from being streamed in, if any
+        self.load_error: Optional[Exception] = None
+
+        # Edit stamps of each segmentation and markup once loaded; see `spill`
+        self._edit_baseline: dict[str, tuple] = dict()
+        # Resources restored from spilled edits, which differ from their files by definition
+        self._restored_keys: set[str] = set()
+
         # Start by finding volumes, as CART cannot proceed w/o at least one
         reference_volume_key, volume_paths = self._find_volumes(case_data)
 
@@ -949,29 +1559,43 @@ class CARTStandardUnit(DataUnitBase):
         segmentation_paths = self._find_segmentations(case_data)
         markup_paths = self._find_markups(case_data)
 
+        # If this case was unloaded w/ unsaved edits, restore those instead of reading the files
+        #  (the entry is kept until they are, so they aren't lost if loading fails first)
+        spilled = SPILLED_EDITS.peek(self.uid) if self.uid is not None else None
+        if spilled is not None:
+            spilled_keys = {*spilled.meta["segmentations"], *spilled.meta["markups"]}
+            restored_paths = {
+                k: segmentation_paths.get(k) or markup_paths.get(k) for k in spilled_keys
+            }
+            segmentation_paths = {
+                k: None if k in spilled_keys else v for k, v in segmentation_paths.items()
+            }
+            markup_paths = {
+                k: None if k in spilled_keys else v for k, v in markup_paths.items()
+            }
+            restore_step = partial(self._restore_spilled, spilled, restored_paths)
+        else:
+            restore_step = None
+
         # Define the public attributes we will be filling in later
         self.reference_volume_key = reference_volume_key
         self.volume_nodes: dict[str, slicer.vtkMRMLScalarVolumeNode] = dict()
         self.segmentation_nodes: dict[str, slicer.vtkMRMLSegmentationNode] = dict()
         self.markup_nodes: dict[str, slicer.vtkMRMLMarkupsFiducialNode] = dict()
 
-        # Load the primary volume into memory first
-        self._load_primary_volume(volume_paths)
+        decodable_paths = self._decodable_paths(
+            volume_paths, segmentation_paths, markup_paths
+        )
 
-        # Load everything else
-        try:
-            self._load_volume_nodes(volume_paths)
-            self._load_segmentation_nodes(segmentation_paths)
-            self._load_markups_nodes(markup_paths)
-        except Exception as e:
-            # If something fails, clean up everything before raising the error
-            for n in [
-                *self.volume_nodes.values(),
-                *self.segmentation_nodes.values(),
-                *self.markup_nodes.values(),
-            ]:
-                slicer.mrmlScene.RemoveNode(n)
-            raise e
+        # If requested (and supported), only load the primary volume now, streaming in the rest later
+        if self.progressive_loading and self.SUPPORTS_PROGRESSIVE_LOADING:
+            self._start_progressive_load(
+                volume_paths, segmentation_paths, markup_paths, decodable_paths, restore_step
+            )
+        else:
+            self._load_all(
+                volume_paths, segmentation_paths, markup_paths, decodable_paths, restore_step
+            )
 
         # Create a subject associated with this data unit
         self.hierarchy_node = scene.GetSubjectHierarchyNode()
@@ -982,6 +1606,184 @@ class CARTStandardUnit(DataUnitBase):
             *self.markup_nodes.values(),
         )
 
+        # Anything edited from here on needs to be spilled if we're unloaded
+        if self._fully_loaded:
+            self._record_edit_baseline()
+
+    def _load_all(
+        self,
+        volume_paths: dict[str, Path],
+        segmentation_paths: dict[str, Path],
+        markup_paths: dict[str, Path],
+        decodable_paths: list[Path],
+        restore_step: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Load every resource for this unit immediately.
+        """
+        # Read and decode all of our files at once; only building their nodes remains after
+        staged = decode_in_parallel(decodable_paths)
+
+        try:
+            # Load the primary volume into memory first
+            self._load_primary_volume(volume_paths)
+
+            # Load everything else
+            try:
+                self._load_volume_nodes(volume_paths)
+                self._load_segmentation_nodes(segmentation_paths)
+                self._load_markups_nodes(markup_paths)
+                if restore_step is not None:
+                    restore_step()
+            except Exception as e:
+                # If something fails, clean up everything before raising the error
+                for n in [
+                    *self.volume_nodes.values(),
+                    *self.segmentation_nodes.values(),
+                    *self.markup_nodes.values(),
+                ]:
+                    NODE_POOL.release(n)
+                raise e
+        finally:
+            # Drop anything we decoded, but did not end up using
+            DECODED_VOLUMES.discard(*staged)
+
+    ## Progressive Loading ##
+    def _start_progressive_load(
+        self,
+        volume_paths: dict[str, Path],
+        segmentation_paths: dict[str, Path],
+        markup_paths: dict[str, Path],
+        decodable_paths: list[Path],
+        restore_step: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Load the primary volume immediately, queueing everything else to be
+        loaded one step at a time through Qt's event loop. This lets the case
+        be displayed (and navigated) while the rest of it is still loading.
+        """
+        self._fully_loaded = False
+
+        # Decode everything but the primary volume in the background
+        primary_path = volume_paths.get(self.reference_volume_key)
+        self._decoding = decode_in_background(
+            [p for p in decodable_paths if p != primary_path]
+        )
+
+        # Load the primary volume now, as we can't display anything without it
+        try:
+            self._load_primary_volume(volume_paths)
+        except Exception as e:
+            self._discard_decoding()
+            raise e
+
+        # Queue up each remaining volume, so each can be displayed as soon as its ready
+        decodable = set(decodable_paths)
+        for key, path in volume_paths.items():
+            if path is None or key == self.reference_volume_key:
+                continue
+            self._load_queue.append(
+                ([path], partial(self._load_volume_nodes, {key: path}))
+            )
+
+        # Segmentations and markups are loaded as a group, like they would be otherwise
+        self._load_queue.append((
+            [p for p in segmentation_paths.values() if p in decodable],
+            partial(self._load_segmentation_nodes, segmentation_paths),
+        ))
+        self._load_queue.append((
+            [p for p in markup_paths.values() if p in decodable],
+            partial(self._load_markups_nodes, markup_paths),
+        ))
+
+        # Restore any spilled edits once everything they replace has been loaded
+        if restore_step is not None:
+            self._load_queue.append(([], restore_step))
+
+        # Start streaming once control returns to the event loop
+        qt.QTimer.singleShot(0, self._stream_next_step)
+
+    def _stream_next_step(self):
+        """
+        Run the next queued load step, attaching the resulting nodes to this
+        unit. Re-schedules itself until the queue is empty.
+        """
+        # If the unit was cleaned up in the meantime, stop here
+        if not self._load_queue:
+            return
+
+        # If the files this step needs are still being decoded, check back shortly
+        required, load_step = self._load_queue[0]
+        if any(p in self._decoding and not self._decoding[p].done() for p in required):
+            qt.QTimer.singleShot(self.STREAM_POLL_INTERVAL, self._stream_next_step)
+            return
+        self._load_queue.pop(0)
+
+        # Run the step, tracking which nodes it added
+        prior_nodes = list(self._all_nodes())
+        try:
+            load_step()
+        except Exception as e:
+            # The case is already on display; report the error, but keep what we have
+            logging.error(f"Failed to finish loading case '{self.uid}': {e}")
+            self.load_error = e
+            self._load_queue.clear()
+        self._attach_streamed_nodes(
+            [n for n in self._all_nodes() if n not in prior_nodes]
+        )
+
+        # Continue with the next step (if any) once the event loop has had its turn
+        if self._load_queue:
+            qt.QTimer.singleShot(0, self._stream_next_step)
+        else:
+            self._discard_decoding()
+            self._finish_streaming()
+
+    def _finish_streaming(self):
+        """
+        Check the fully streamed unit, then notify everything waiting on it.
+
+        A unit which failed to stream in (or which fails validation afterward)
+         is still marked as fully loaded, so nothing waits on it forever; those
+         waiting on it should check `load_error` before relying on its contents.
+        """
+        # Validation was skipped at construction, as most resources were yet to arrive
+        if self.load_error is None:
+            try:
+                self.validate()
+            except Exception as e:
+                logging.error(f"Case '{self.uid}' failed validation once loaded: {e}")
+                self.load_error = e
+
+        self._record_edit_baseline()
+        self._mark_fully_loaded()
+
+    def _attach_streamed_nodes(self, new_nodes: list):
+        """
+        Integrate nodes which were loaded after this unit was constructed.
+        """
+        if not new_nodes:
+            return
+
+        # Have them join the rest of this unit's resources
+        add_to_subject(self.subject_id, *new_nodes)
+        for node in new_nodes:
+            self._set_node_shown(node, self._in_focus)
+
+        # If we added volumes, give them views in our layout
+        if self._layout_handler and any(
+            n in self.volume_nodes.values() for n in new_nodes
+        ):
+            self._layout_handler.tracked_volumes = list(self.volume_nodes.values())
+            if self._in_focus:
+                self._layout_handler.apply_layout()
+
+    def _discard_decoding(self):
+        # Drop anything we decoded, but did not end up using (once its done decoding)
+        for p, f in self._decoding.items():
+            f.add_done_callback(lambda __, p=p: DECODED_VOLUMES.discard(p))
+        self._decoding = dict()
+
     def _find_volumes(self, case_data: dict[str, str]) -> tuple[str, dict[str, Path]]:
         """
         Find all volumes within a set of case data; will also identify
@@ -1071,6 +1873,25 @@ class CARTStandardUnit(DataUnitBase):
 
         return markups
 
+    @staticmethod
+    def _decodable_paths(
+        volume_paths: dict[str, Path],
+        segmentation_paths: dict[str, Path],
+        markup_paths: dict[str, Path],
+    ) -> list[Path]:
+        """
+        The files for this unit which are voxel-based, and can therefore be
+        decoded ahead of building their nodes.
+        """
+        paths = [p for p in volume_paths.values() if p is not None]
+        paths.extend(p for p in segmentation_paths.values() if p is not None)
+        # Markups stored in NIfTI files are loaded as a volume first as well
+        paths.extend(
+            p for p in markup_paths.values() if p is not None and ".nii" in p.suffixes
+        )
+        return [p for p in paths if p.is_file()]
+
+    @traced()
     def _load_primary_volume(self, volume_paths: dict[str, Path]):
         node = None
         try:
@@ -1083,9 +1904,10 @@ class CARTStandardUnit(DataUnitBase):
         except Exception as e:
             # Clean up the node if it was loaded already
             if node is not None:
-                slicer.mrmlScene.RemoveNode(node)
+                NODE_POOL.release(node)
             raise e
 
+    @traced()
     def _load_volume_nodes(self, volume_paths: dict[str, Path]) -> None:
         """
         Load each segmentation path into a Slicer node, name it, store in resources,
@@ -1105,6 +1927,7 @@ class CARTStandardUnit(DataUnitBase):
             node.SetName(f"{VolumeResource.format_for_gui(key)} [{self.uid}]")
             self.volume_nodes[key] = node
 
+    @traced()
     def _load_segmentation_nodes(self, segmentation_paths: dict[str, Path]) -> None:
         """
         For each segmentation key, load if file exists.
@@ -1146,6 +1969,7 @@ class CARTStandardUnit(DataUnitBase):
             # Track the node for later
             self.segmentation_nodes[key] = node
 
+    @traced()
     def _load_markups_nodes(self, markup_paths: dict[str, Path]) -> None:
         """
         Load each markup path into a Slicer node, name it, store in resources,
@@ -1208,14 +2032,9 @@ class CARTStandardUnit(DataUnitBase):
         super().focus_gained()
 
         # Reveal all the data nodes again
-        for node in itertools.chain(
-            self.volume_nodes.values(),
-            self.segmentation_nodes.values(),
-            self.markup_nodes.values(),
-        ):
-            node.SetDisplayVisibility(True)
-            node.SetSelectable(True)
-            node.SetHideFromEditors(False)
+        self._in_focus = True
+        for node in self._all_nodes():
+            self._set_node_shown(node, True)
 
         self._set_subject_shown(True)
 
@@ -1225,24 +2044,52 @@ class CARTStandardUnit(DataUnitBase):
         super().focus_lost()
 
         # Hide all data nodes again
-        for node in itertools.chain(
-            self.volume_nodes.values(),
-            self.segmentation_nodes.values(),
-            self.markup_nodes.values(),
-        ):
-            node.SetDisplayVisibility(False)
-            node.SetSelectable(False)
-            node.SetHideFromEditors(True)
+        self._in_focus = False
+        for node in self._all_nodes():
+            self._set_node_shown(node, False)
 
         self._set_subject_shown(False)
 
     def clean(self) -> None:
         """Clean up the hierarchy node and its children."""
+        # Stop streaming in anything which has yet to load
+        self._load_queue.clear()
+        self._discard_decoding()
+
         super().clean()
 
-        # If we are bound to a subject, remove it from the scene
+        # Return our nodes to the pool, so later units can re-use them
+        for node in list(self._all_nodes()):
+            NODE_POOL.release(node)
+        self.volume_nodes.clear()
+        self.segmentation_nodes.clear()
+        self.markup_nodes.clear()
+
+        # If we are bound to a subject, remove it (now empty) from the scene
         if self.subject_id is not None:
             self.hierarchy_node.RemoveItem(self.subject_id)
+            self.subject_id = None
+
+    def memory_footprint(self) -> int:
+        """
+        The summed size of the voxel arrays for all volumes and segmentations
+        managed by this unit.
+        """
+        total = 0
+        for node in self.volume_nodes.values():
+            total += _voxel_array_size(node.GetImageData())
+        for node in self.segmentation_nodes.values():
+            # Segments can share a labelmap layer; count each layer only once
+            segmentation = node.GetSegmentation()
+            for i in range(segmentation.GetNumberOfLayers()):
+                total += _voxel_array_size(segmentation.GetLayerObject(i))
+        return total
+
+    def node_count(self) -> int:
+        """
+        The number of volume, segmentation, and markup nodes managed by this unit.
+        """
+        return len(self.volume_nodes) + len(self.segmentation_nodes) + len(self.markup_nodes)
 
     def validate(self) -> None:
         """
@@ -1253,11 +2100,192 @@ class CARTStandardUnit(DataUnitBase):
         """
         pass
 
+    ## Pre-Fetching ##
+    @classmethod
+    def prefetch(
+        cls, case_data: dict[str, str], data_path: Path, prior_data: dict = None
+    ) -> list[Path]:
+        """
+        Decode every volume and segmentation file for this case, staging them
+        so the constructor only needs to build their nodes.
+
+        Returns the list of files which were staged.
+        """
+        # Resources with spilled edits are restored from those, rather than their files
+        uid = case_data.get("uid")
+        spilled_keys = SPILLED_EDITS.spilled_keys(uid) if uid is not None else frozenset()
+        staged = []
+        try:
+            for k, v in case_data.items():
+                # Skip blanks and anything which isn't voxel-based
+                if not v:
+                    continue
+                if not (VolumeResource.is_type(k) or SegmentationResource.is_type(k)):
+                    continue
+                # Spilled edits replace these segmentations, so there's no need to read them
+                if k in spilled_keys:
+                    continue
+                # Resolve the full path, skipping files which don't exist
+                p = Path(v)
+                if not p.is_absolute():
+                    p = data_path / p
+                if not p.exists():
+                    continue
+                # Decode the file and stage it for later
+                DECODED_VOLUMES.stage(decode_volume(p))
+                staged.append(p)
+        except Exception as e:
+            # Don't hold onto anything if we failed partway through
+            DECODED_VOLUMES.discard(*staged)
+            raise e
+        return staged
+
+    @classmethod
+    def discard_prefetched(cls, handle: list[Path]):
+        # Drop any staged files the constructor did not consume
+        if handle:
+            DECODED_VOLUMES.discard(*handle)
+
+    ## Spilling ##
+    def spill(self):
+        """
+        Copy every segmentation and markup edited since it was loaded into
+        `SPILLED_EDITS`, so the edits are restored the next time this case is
+        loaded (rather than being lost).
+        """
+        if not SPILLED_EDITS.enabled or self.uid is None:
+            return
+        edited_keys = self._edited_keys()
+        if not edited_keys:
+            return
+
+        arrays = dict()
+        meta = {"segmentations": dict(), "markups": dict()}
+        for i, key in enumerate(edited_keys):
+            if key in self.segmentation_nodes:
+                node_arrays, node_meta = spill_segmentation(
+                    self.segmentation_nodes[key], f"segmentation_{i}"
+                )
+                meta["segmentations"][key] = node_meta
+            else:
+                node_arrays, node_meta = spill_markups(self.markup_nodes[key], f"markups_{i}")
+                meta["markups"][key] = node_meta
+            arrays.update(node_arrays)
+
+        if SPILLED_EDITS.put(self.uid, SpilledState(arrays, meta), edited_keys):
+            logging.info(f"Kept the unsaved edits for case '{self.uid}' for later.")
+
+    def edit_stamps(self) -> dict[str, tuple]:
+        """
+        Stamp each segmentation and markup in their current state; pass these
+        to `mark_saved` once that state has been saved.
+        """
+        stamps = {
+            k: segmentation_edit_stamp(n) for k, n in self.segmentation_nodes.items()
+        }
+        stamps.update({k: markups_edit_stamp(n) for k, n in self.markup_nodes.items()})
+        return stamps
+
+    def mark_saved(self, stamps: dict[str, tuple]):
+        """
+        Treat the given resources as saved as of when `stamps` (from
+        `edit_stamps`) were taken, such that only edits made after that point
+        need to be spilled.
+        """
+        if self._released or not self._fully_loaded:
+            return
+        self._edit_baseline.update(stamps)
+        self._restored_keys.difference_update(stamps.keys())
+
+    @contextmanager
+    def untracked_changes(self):
+        """
+        Changes made within this context (i.e. a task adding the segments it
+        expects) are not treated as edits; resources which had already been
+        edited beforehand remain so.
+        """
+        if not self._fully_loaded:
+            yield
+            return
+        edited_keys = set(self._edited_keys())
+        try:
+            yield
+        finally:
+            self._edit_baseline.update(
+                {k: v for k, v in self.edit_stamps().items() if k not in edited_keys}
+            )
+
+    def _record_edit_baseline(self):
+        # Stamp each segmentation and markup, so later edits can be detected
+        self._edit_baseline = self.edit_stamps()
+
+    def _edited_keys(self) -> list[str]:
+        """
+        The keys of the segmentations and markups which were edited since they
+        were loaded (or were restored from edits spilled beforehand).
+        """
+        # If we never finished loading, nothing could have been edited
+        if not self._fully_loaded:
+            return []
+        edited = []
+        for key, node in self.segmentation_nodes.items():
+            if key in self._restored_keys or self._edit_baseline.get(key) != segmentation_edit_stamp(node):
+                edited.append(key)
+        for key, node in self.markup_nodes.items():
+            if key in self._restored_keys or self._edit_baseline.get(key) != markups_edit_stamp(node):
+                edited.append(key)
+        return edited
+
+    def _restore_spilled(self, spilled: SpilledState, source_paths: dict[str, Optional[Path]]):
+        """
+        Rebuild the segmentations and markups spilled when this case was last
+        unloaded, replacing whatever was loaded for them in the meantime.
+        """
+        for key, node_meta in spilled.meta["segmentations"].items():
+            node = restore_segmentation(spilled.arrays, node_meta)
+            NODE_POOL.release(self.segmentation_nodes.get(key))
+            self.segmentation_nodes[key] = node
+        for key, node_meta in spilled.meta["markups"].items():
+            node = restore_markups(spilled.arrays, node_meta)
+            NODE_POOL.release(self.markup_nodes.get(key))
+            self.markup_nodes[key] = node
+
+        # Keep tracking the files they came from, as if they had been loaded normally
+        for key, path in source_paths.items():
+            if path is not None:
+                node = self.segmentation_nodes.get(key) or self.markup_nodes.get(key)
+                _set_storage_file(node, path)
+
+        self._restored_keys.update(source_paths.keys())
+
+        # The edits are back in the scene, and will be spilled again if they're unloaded unsaved
+        SPILLED_EDITS.discard(self.uid)
+
     ## Utilities ##
     @classmethod
     def resource_types(cls) -> dict[str, ResourceType]:
         return cls.RESOURCE_TYPES
 
+    def _all_nodes(self):
+        # Every node managed by this unit
+        return itertools.chain(
+            self.volume_nodes.values(),
+            self.segmentation_nodes.values(),
+            self.markup_nodes.values(),
+        )
+
+    @staticmethod
+    def _set_node_shown(node, new_state: bool) -> None:
+        """
+        Show or hide one of our nodes, including within editor GUIs.
+        """
+        # Group the changes, so observers are only notified once
+        was_modifying = node.StartModify()
+        node.SetDisplayVisibility(new_state)
+        node.SetSelectable(new_state)
+        node.SetHideFromEditors(not new_state)
+        node.EndModify(was_modifying)
+
     def _set_subject_shown(self, new_state: bool) -> None:
         """
         Expand or collapse the subject hierarchy group.
@@ -0,0 +1,450 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+from pathlib import Path
+from threading import Event, Lock
+from typing import Callable, Iterable, Iterator, Optional
+
+
+# Directory (as parts relative to the crawl's root) -> (files, sub-directories)
+DirectoryTree = dict[tuple[str, ...], tuple[list[str], list[str]]]
+
+
+class DirectoryCrawler:
+    """
+    Lists the contents of a directory tree using a bounded pool of threads,
+    one directory per listing.
+
+    On network filesystems (SMB, NFS, etc.) every listing is a round trip to
+    the server, so crawling a tree serially spends most of its time waiting;
+    listing many directories at once hides most of that latency. Each
+    directory's contents are kept in the order they were listed in, so the
+    resulting tree is identical to one built serially, regardless of which
+    listings finish first.
+    """
+
+    # The default number of directories which may be listed at once
+    DEFAULT_WORKERS = 8
+
+    # How often (in seconds) a cancellable crawl checks whether it was cancelled
+    CANCEL_CHECK_INTERVAL = 0.05
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.workers: int = workers
+
+        # Guards against the worker count changing mid-crawl
+        self._lock = Lock()
+
+        self.configure(workers)
+
+    def configure(self, workers: int):
+        """
+        Change how many directories may be listed at once; 1 crawls serially.
+        """
+        if type(workers) != int or workers < 1:
+            raise ValueError("Directory crawler worker count must be a positive integer!")
+        with self._lock:
+            self.workers = workers
+
+    def crawl(
+        self,
+        root: Path,
+        scopes: Optional[Iterable[Path]] = None,
+        descend: Optional[Callable[[tuple[str, ...]], bool]] = None,
+        follow_links: bool = False,
+        cancelled: Optional[Event] = None,
+    ) -> DirectoryTree:
+        """
+        List the contents of every directory within the root (recursively).
+
+        :param root: The directory to crawl.
+        :param scopes: Directories within the root to crawl instead of the
+            root itself; those outside of the root are ignored.
+        :param descend: Called with each sub-directory found (as parts relative
+            to the root); it is only listed if this returns True.
+        :param follow_links: Whether to list symlinked directories; unless
+            set, they are skipped entirely (appearing in neither the files
+            nor the sub-directories of the directory containing them).
+        :param cancelled: If provided, the crawl stops (dropping any listings
+            which have yet to start) once this is set; the directories listed
+            up to that point are still returned.
+        :return: The contents of each directory listed. Directories which
+            couldn't be read are treated as empty, mirroring `os.walk`.
+        """
+        return dict(self.iter_crawl(root, scopes, descend, follow_links, cancelled))
+
+    def iter_crawl(
+        self,
+        root: Path,
+        scopes: Optional[Iterable[Path]] = None,
+        descend: Optional[Callable[[tuple[str, ...]], bool]] = None,
+        follow_links: bool = False,
+        cancelled: Optional[Event] = None,
+    ) -> Iterator[tuple[tuple[str, ...], tuple[list[str], list[str]]]]:
+        """
+        Like `crawl`, but yields each directory (as parts relative to the
+        root) alongside its contents as soon as it has been listed; as
+        listings run concurrently, they may finish in any order.
+
+        Closing the iterator early drops any listings which have yet to start.
+        """
+        with self._lock:
+            workers = self.workers
+
+        # Determine where to start; nested scopes are covered by their parents
+        if scopes is None:
+            start_keys = [()]
+        else:
+            start_keys = set()
+            for key in sorted(_scope_keys(root, scopes), key=len):
+                if not any(key[:i] in start_keys for i in range(len(key))):
+                    start_keys.add(key)
+
+        # Only wake up periodically if there's a cancellation to check for
+        timeout = None if cancelled is None else self.CANCEL_CHECK_INTERVAL
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="CARTCrawl")
+        try:
+            pending: dict[Future, tuple[str, ...]] = {
+                pool.submit(_list_dir, os.path.join(root, *key), follow_links): key
+                for key in start_keys
+            }
+            # List each directory's children as soon as the directory itself is listed
+            while pending:
+                done, __ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                # Check between every listing, as the caller may cancel while we're yielding them
+                for future in done:
+                    if cancelled is not None and cancelled.is_set():
+                        return
+                    key = pending.pop(future)
+                    listing = future.result()
+                    for d in listing[1]:
+                        child_key = key + (d,)
+                        if descend is None or descend(child_key):
+                            child_path = os.path.join(root, *child_key)
+                            pending[pool.submit(_list_dir, child_path, follow_links)] = child_key
+                    yield key, listing
+                if cancelled is not None and cancelled.is_set():
+                    return
+        finally:
+            # Don't wait on listings in progress if we stopped early; nothing will use them
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# The crawler CART uses to scan data directories; configured by the user's profile
+DIRECTORY_CRAWLER = DirectoryCrawler()
+
+
+class DataTreeIndex:
+    """
+    In-memory snapshot of a directory tree, built with a single sweep of the
+    filesystem.
+
+    Allows for many file searches (i.e. finding each resource for every case
+    in a cohort) to be resolved without walking the disk for each of them.
+    The sweep itself is run concurrently by a `DirectoryCrawler`, and can be
+    limited to a set of directories within the root (i.e. only those a
+    cohort's cases actually search).
+    Files are produced in the same order `os.walk` (top-down) would produce
+    them, so "first match" searches give identical results.
+
+    As this is a snapshot, changes made to the filesystem after it was built
+    are NOT reflected; call `rebuild` if that matters.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        scopes: Optional[Iterable[Path]] = None,
+        crawler: Optional[DirectoryCrawler] = None,
+        cancelled: Optional[Event] = None,
+    ):
+        """
+        :param root: The directory to index.
+        :param scopes: Directories within the root to index, rather than all of
+            it; searches outside of them fall back to walking the disk.
+        :param crawler: The crawler to sweep the tree with; defaults to
+            `DIRECTORY_CRAWLER`.
+        :param cancelled: If provided, the initial sweep stops once this is
+            set, leaving the index incomplete.
+        """
+        self.root: Path = root
+        self.scopes: Optional[list[Path]] = None if scopes is None else list(scopes)
+        self.crawler: DirectoryCrawler = crawler if crawler is not None else DIRECTORY_CRAWLER
+
+        # Directory (as parts relative to the root) -> (files, walked sub-directories)
+        self._tree: DirectoryTree = dict()
+
+        self.rebuild(cancelled)
+
+    def rebuild(self, cancelled: Optional[Event] = None):
+        """
+        (Re-)build the index by sweeping the root directory (or our scopes
+        within it).
+
+        :param cancelled: If provided, the sweep stops once this is set,
+            leaving the index incomplete.
+        """
+        self._tree = self.crawler.crawl(self.root, self.scopes, cancelled=cancelled)
+
+    def extend(self, scopes: Iterable[Path]):
+        """
+        Index the given directories as well, if they aren't already.
+        """
+        # If we cover the whole root already, there is nothing to add
+        if self.scopes is None:
+            return
+        # Paths outside of our root are never indexed; they're walked on demand instead
+        new_scopes = [
+            p for p in scopes if not self.covers(p) and _scope_keys(self.root, [p])
+        ]
+        if not new_scopes:
+            return
+        self._tree.update(self.crawler.crawl(self.root, new_scopes))
+        self.scopes.extend(new_scopes)
+
+    def _key_for(self, path: Path) -> Optional[tuple[str, ...]]:
+        # Find where the path lies within our tree; None if it isn't in there
+        try:
+            parts = path.relative_to(self.root).parts
+        except ValueError:
+            return None
+        # Parent references could lead anywhere; don't try to resolve them
+        if ".." in parts:
+            return None
+        if parts not in self._tree:
+            return None
+        return parts
+
+    def covers(self, path: Path) -> bool:
+        """
+        Whether this index can list the contents of the given directory.
+        """
+        return self._key_for(path) is not None
+
+    def iter_files(self, path: Path) -> Iterator[str]:
+        """
+        Iterate through every file within the given directory (recursively),
+        in `os.walk` order. Each is provided as a full path string, formatted
+        as `str(Path(dir_path) / file_name)` would be.
+
+        If the directory isn't covered by this index, falls back to `os.walk`.
+        """
+        key = self._key_for(path)
+        if key is None:
+            yield from _walk_files(path)
+            return
+        yield from self._iter_files(str(path), key)
+
+    def _iter_files(self, dir_path: str, key: tuple[str, ...]) -> Iterator[str]:
+        files, dirs = self._tree[key]
+        for f in files:
+            yield os.path.join(dir_path, f)
+        for d in dirs:
+            yield from self._iter_files(os.path.join(dir_path, d), key + (d,))
+
+
+class BIDSIndex:
+    """
+    Groups the subject and session directories of a BIDS dataset (both raw
+    and derived) by their entities, using a single crawl of the dataset.
+
+    Every subject and session (along with the derivative directories for
+    each) can then be looked up directly, rather than re-scanning the
+    `derivatives` tree once for each of them.
+    """
+
+    # The directory which holds each pipeline's derived data
+    DERIVATIVES_DIR = "derivatives"
+
+    def __init__(
+        self,
+        root: Path,
+        crawler: Optional[DirectoryCrawler] = None,
+        build: bool = True,
+    ):
+        """
+        :param root: The root of the BIDS dataset.
+        :param crawler: The crawler to list the dataset with; defaults to
+            `DIRECTORY_CRAWLER`.
+        :param build: Whether to build the index immediately; if not, use
+            `iter_build` to build it (incrementally) yourself.
+        """
+        self.root: Path = root
+        self.crawler: DirectoryCrawler = crawler if crawler is not None else DIRECTORY_CRAWLER
+
+        # Subject (in sorted order) -> its sessions, in the order they were listed
+        self.subjects: dict[str, list[str]] = dict()
+        # (Subject,) or (subject, session) -> derivative directories, relative to the root
+        self.derivatives: dict[tuple[str, ...], list[Path]] = dict()
+        # Whether the dataset has a derivatives directory at all
+        self.has_derivatives: bool = False
+
+        if build:
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        (Re-)build the index by crawling the dataset.
+        """
+        for __ in self.iter_build():
+            pass
+
+    def iter_build(self, cancelled: Optional[Event] = None) -> Iterator[str]:
+        """
+        (Re-)build the index by crawling the dataset, yielding each subject
+        (in sorted order) as soon as it, its sessions, and its derivatives
+        have all been indexed.
+
+        :param cancelled: If provided, the crawl stops once this is set,
+            leaving the index incomplete.
+        """
+        self.subjects = dict()
+        self.derivatives = dict()
+        self.has_derivatives = False
+
+        tree: DirectoryTree = dict()
+        # Raw subjects, sorted; only known once the root has been listed
+        ordered_subjects: Optional[list[str]] = None
+        # Each pipeline's directory; only known once the derivatives directory has been listed
+        pipelines: Optional[list[str]] = None
+        next_subject = 0
+
+        # Like `Path.glob`, follow symlinked subject and session directories
+        for key, listing in self.crawler.iter_crawl(
+            self.root, descend=self._descend, follow_links=True, cancelled=cancelled
+        ):
+            tree[key] = listing
+            if ordered_subjects is None and key == ():
+                ordered_subjects = sorted([d for d in listing[1] if self.is_subject(d)])
+                self.has_derivatives = self.DERIVATIVES_DIR in listing[1]
+                if not self.has_derivatives:
+                    pipelines = []
+            if pipelines is None and key == (self.DERIVATIVES_DIR,):
+                pipelines = listing[1]
+
+            # Until every pipeline has been listed, no subject's derivatives are known
+            if ordered_subjects is None or pipelines is None:
+                continue
+            if not all((self.DERIVATIVES_DIR, p) in tree for p in pipelines):
+                continue
+
+            # Index (and report) each subject in turn, stopping at the first still being listed
+            while next_subject < len(ordered_subjects):
+                if cancelled is not None and cancelled.is_set():
+                    return
+                subject = ordered_subjects[next_subject]
+                if not self._is_listed(tree, pipelines, subject):
+                    break
+                self._index_subject(tree, pipelines, subject)
+                next_subject += 1
+                yield subject
+
+        if cancelled is not None and cancelled.is_set():
+            return
+
+        # Group the derived data of subjects without any raw data as well; each
+        #  only once, as its derived data is grouped across all pipelines at once
+        derived_only = dict()
+        for pipeline in pipelines or []:
+            for subject in tree[(self.DERIVATIVES_DIR, pipeline)][1]:
+                if subject not in self.subjects:
+                    derived_only.setdefault(subject, None)
+        for subject in derived_only:
+            self._index_derivatives(tree, pipelines, subject)
+
+    def _is_listed(self, tree: DirectoryTree, pipelines: list[str], subject: str) -> bool:
+        # Whether the subject's directory (and its directory in each pipeline) have been listed
+        if (subject,) not in tree:
+            return False
+        for pipeline in pipelines:
+            pipeline_key = (self.DERIVATIVES_DIR, pipeline)
+            if subject in tree[pipeline_key][1] and pipeline_key + (subject,) not in tree:
+                return False
+        return True
+
+    def _index_subject(self, tree: DirectoryTree, pipelines: list[str], subject: str):
+        # Track the subject's sessions within the raw data, then its derived data
+        self.subjects[subject] = [d for d in tree[(subject,)][1] if self.is_session(d)]
+        self._index_derivatives(tree, pipelines, subject)
+
+    def _index_derivatives(self, tree: DirectoryTree, pipelines: list[str], subject: str):
+        # Group each pipeline's derived data for the subject (and its sessions);
+        # as pipelines are visited in order, so is each group's contents
+        for pipeline in pipelines:
+            if subject not in tree[(self.DERIVATIVES_DIR, pipeline)][1]:
+                continue
+            subject_path = Path(self.DERIVATIVES_DIR, pipeline, subject)
+            self.derivatives.setdefault((subject,), []).append(subject_path)
+            sessions = tree.get((self.DERIVATIVES_DIR, pipeline, subject), ([], []))[1]
+            for session in sessions:
+                self.derivatives.setdefault((subject, session), []).append(
+                    subject_path / session
+                )
+
+    def derivatives_for(self, subject: str, session: Optional[str] = None) -> list[Path]:
+        """
+        The derivative directories for the given subject (or one of its sessions).
+        """
+        key = (subject,) if session is None else (subject, session)
+        return list(self.derivatives.get(key, []))
+
+    @staticmethod
+    def is_subject(name: str) -> bool:
+        return fnmatch(name, "sub*")
+
+    @staticmethod
+    def is_session(name: str) -> bool:
+        return fnmatch(name, "ses*")
+
+    def _descend(self, key: tuple[str, ...]) -> bool:
+        # Only list directories which can hold subjects or sessions;
+        # derivatives are nested an extra level, under each pipeline's directory
+        if key[0] == self.DERIVATIVES_DIR:
+            return len(key) <= 3
+        return len(key) == 1 and self.is_subject(key[0])
+
+
+def _list_dir(dir_path: str, follow_links: bool) -> tuple[list[str], list[str]]:
+    # List the files and sub-directories within a directory, as `os.walk` would
+    files = list()
+    dirs = list()
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        # Mirror `os.walk`, which silently skips directories it can't read
+        entries = list()
+    for entry in entries:
+        # Like `os.walk`, treat anything we can't classify as a file
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry.name)
+        # `os.walk` doesn't follow symlinks by default, so neither do we (unless asked to)
+        elif follow_links or not entry.is_symlink():
+            dirs.append(entry.name)
+    return files, dirs
+
+
+def _scope_keys(root: Path, scopes: Iterable[Path]) -> set[tuple[str, ...]]:
+    # Find where each scope lies within the root, skipping those which don't
+    keys = set()
+    for p in scopes:
+        try:
+            parts = p.relative_to(root).parts
+        except ValueError:
+            continue
+        if ".." not in parts:
+            keys.add(parts)
+    return keys
+
+
+def _walk_files(path: Path) -> Iterator[str]:
+    # Fallback for paths which are not covered by an index
+    for r, __, fs in os.walk(path, topdown=True):
+        r = Path(r)
+        for f in fs:
+            yield str(r / f)
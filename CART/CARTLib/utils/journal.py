@@ -0,0 +1,139 @@
+import csv
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Iterator
+
+
+class CSVJournal:
+    """
+    Append-only companion to a CSV/TSV log file.
+
+    Rather than re-writing the entire log every time a single entry changes
+    (which grows more expensive the more entries the log has), each updated
+    entry is appended to a "journal" file sitting next to the log. When the
+    log is read back, the log's rows are produced first, followed by those in
+    the journal in the order they were written; by inserting them into a
+    dictionary in this order, the most recent entry for each key "wins".
+
+    Every so often (see `compact_interval`) the journal is "compacted";
+    the full log is re-written in its usual (human-readable) layout, and the
+    now redundant journal is deleted.
+    """
+
+    # The number of journal entries to accumulate before compacting them
+    DEFAULT_COMPACT_INTERVAL = 50
+
+    def __init__(
+        self,
+        log_path: Path,
+        fieldnames: list[str],
+        delimiter: str = ",",
+        compact_interval: int = DEFAULT_COMPACT_INTERVAL,
+    ):
+        self.log_path: Path = log_path
+        self.fieldnames: list[str] = fieldnames
+        self.delimiter: str = delimiter
+        self.compact_interval: int = compact_interval
+
+        # The number of entries in the journal which have yet to be compacted
+        self._pending: int = 0
+
+        # Whether we've confirmed the journal doesn't end in a torn write
+        self._tail_checked: bool = False
+
+    @property
+    def journal_path(self) -> Path:
+        """
+        Where journal entries are appended to; sits alongside the log itself.
+        """
+        return self.log_path.with_name(f"{self.log_path.name}.journal")
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def rows(self) -> Iterator[dict[str, str]]:
+        """
+        Iterate through every row in the log, followed by every entry
+        in the journal (in the order they were appended).
+
+        Journal entries which were only partially written (i.e. because
+        Slicer crashed mid-save) are skipped.
+        """
+        # Rows in the "compacted" log
+        if self.log_path.exists():
+            with open(self.log_path, newline="") as fp:
+                yield from csv.DictReader(fp, delimiter=self.delimiter)
+
+        # Rows in the journal
+        self._pending = 0
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, newline="") as fp:
+            reader = csv.DictReader(
+                fp, fieldnames=self.fieldnames, delimiter=self.delimiter
+            )
+            for i, row in enumerate(reader):
+                # Torn writes leave missing (None) or overflowing (list) values behind
+                if any([v is None or isinstance(v, list) for v in row.values()]):
+                    logging.warning(
+                        f"Skipping entry #{i} in {self.journal_path}, as it was incomplete."
+                    )
+                    continue
+                self._pending += 1
+                yield row
+
+    def append(self, row: dict[str, str], all_rows: Iterable[dict[str, str]]):
+        """
+        Append a new row to the journal.
+
+        `all_rows` should provide every (deduplicated) row in the log, including
+        the new one; it is only iterated through if the journal is compacted.
+        """
+        # Make sure a torn write from a prior session can't corrupt our new entry
+        if not self._tail_checked:
+            self._terminate_torn_write()
+            self._tail_checked = True
+
+        with open(self.journal_path, mode="a", newline="") as fp:
+            writer = csv.DictWriter(
+                fp, fieldnames=self.fieldnames, delimiter=self.delimiter
+            )
+            writer.writerow(row)
+        self._pending += 1
+
+        # If the journal has grown too long, compact it
+        if self._pending >= self.compact_interval:
+            self.compact(all_rows)
+
+    def _terminate_torn_write(self):
+        # If the journal doesn't end with a line break, add one
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, mode="rb+") as fp:
+            if fp.seek(0, os.SEEK_END) == 0:
+                return
+            fp.seek(-1, os.SEEK_END)
+            if fp.read(1) not in (b"\n", b"\r"):
+                fp.write(b"\r\n")
+
+    def compact(self, all_rows: Iterable[dict[str, str]]):
+        """
+        Re-write the log in full with the provided rows, deleting the journal.
+
+        The log is written to a temporary file first and swapped into place,
+        so an interrupted compaction can never lose entries.
+        """
+        tmp_path = self.log_path.with_name(f"{self.log_path.name}.tmp")
+        with open(tmp_path, mode="w", newline="") as fp:
+            writer = csv.DictWriter(
+                fp, fieldnames=self.fieldnames, delimiter=self.delimiter
+            )
+            writer.writeheader()
+            writer.writerows(all_rows)
+        os.replace(tmp_path, self.log_path)
+
+        # The journal's contents are now part of the log itself
+        self.journal_path.unlink(missing_ok=True)
+        self._pending = 0
@@ -0,0 +1,73 @@
+from typing import Callable, Optional
+
+import qt
+
+
+class NavigationScheduler:
+    """
+    Coalesces rapid navigation requests (i.e. holding down PageDown, or
+    scrolling through the case selector) into a single case switch.
+
+    Each request replaces the previous target and restarts a short timer; the
+    switch itself only runs once no further requests arrive before it expires,
+    and only for the most recent target. Loading (and saving, laying out, etc.)
+    every case skipped over along the way is avoided entirely.
+    """
+
+    # How long (in ms) to wait for further requests before switching cases;
+    # should exceed the key auto-repeat interval, so held keys are coalesced
+    DEFAULT_DELAY = 75
+
+    def __init__(self, navigate: Callable[[int], None], delay: int = DEFAULT_DELAY):
+        """
+        :param navigate: Function which switches to the case at the given index.
+        :param delay: How long (in ms) to wait for further requests.
+        """
+        self._navigate = navigate
+
+        # The index of the case we will switch to next, if any
+        self.pending_index: Optional[int] = None
+
+        # Timer which runs the switch once requests stop coming in
+        self._timer = qt.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._run)
+
+    @property
+    def is_pending(self) -> bool:
+        return self.pending_index is not None
+
+    def request(self, idx: int):
+        """
+        Schedule a switch to the case at the given index, superseding any
+        which was scheduled before it.
+        """
+        self.pending_index = idx
+        # Restarting the timer pushes the switch back until requests stop
+        self._timer.start()
+
+    def cancel(self):
+        """
+        Drop the scheduled switch, if any.
+        """
+        self.pending_index = None
+        self._timer.stop()
+
+    def flush(self):
+        """
+        Run the scheduled switch (if any) immediately.
+        """
+        self._timer.stop()
+        self._run()
+
+    def clean(self):
+        # Make sure nothing runs after we're gone
+        self.cancel()
+        self._timer.timeout.disconnect(self._run)
+
+    def _run(self):
+        if self.pending_index is None:
+            return
+        idx, self.pending_index = self.pending_index, None
+        self._navigate(idx)
@@ -0,0 +1,162 @@
+from typing import Optional
+
+import slicer
+
+
+class MRMLNodePool:
+    """
+    Recycles MRML nodes between data units.
+
+    Adding a node to (or removing one from) the MRML scene notifies every
+    observer of the scene, which gets expensive when done for every volume,
+    segmentation, and markup of every case a user cycles through. Instead,
+    nodes which are no longer needed can be `release`d into this pool, where
+    they are scrubbed of their contents and hidden. The next `acquire` for the
+    same node class then re-uses one of them, rather than creating a new one.
+
+    At most `max_idle` idle nodes are kept for each node class; anything
+    released beyond that "high-water mark" is removed from the scene as usual.
+    """
+
+    # The default number of idle nodes to keep around for each node class
+    DEFAULT_MAX_IDLE = 8
+
+    # The name given to nodes while they are idle within the pool
+    IDLE_NODE_NAME = "CART Pooled Node"
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        self.max_idle: int = max_idle
+
+        # Node class name -> idle nodes of that class
+        self._idle: dict[str, list] = dict()
+
+        self.configure(max_idle)
+
+    def configure(self, max_idle: int):
+        """
+        Change how many idle nodes (per node class) the pool can hold,
+        removing any which no longer fit.
+        """
+        if type(max_idle) != int or max_idle < 0:
+            raise ValueError("Node pool limit must be a positive integer!")
+        self.max_idle = max_idle
+        for nodes in self._idle.values():
+            while len(nodes) > max_idle:
+                self._remove(nodes.pop(0))
+
+    def idle_count(self, node_class: Optional[str] = None) -> int:
+        """
+        The number of idle nodes in the pool; of the given class, if provided.
+        """
+        if node_class is not None:
+            return len(self._idle.get(node_class, []))
+        return sum([len(v) for v in self._idle.values()])
+
+    def acquire(self, node_class: str, name: str = ""):
+        """
+        Get a node of the given class, re-using an idle one if possible.
+        Otherwise, a new node is added to the scene.
+
+        Re-used nodes keep their storage and display nodes (the latter reset
+        to their defaults), but are otherwise empty; their contents (image
+        data, segments, control points) need to be filled in again, just like
+        a new node's would. If no name is given, they are named the same way
+        the scene would name a new node.
+        """
+        scene = slicer.mrmlScene
+        idle = self._idle.get(node_class, [])
+        while idle:
+            node = idle.pop()
+            # Skip nodes which left the scene while idle (i.e. it was closed)
+            if node.GetScene() is not scene:
+                continue
+            node.SetName(name if name else scene.GenerateUniqueName(node.GetNodeTagName()))
+            return node
+        return scene.AddNewNodeByClass(node_class, name)
+
+    def release(self, node):
+        """
+        Return a node to the pool once it is no longer needed. If the pool is
+        already full for nodes of this class, it is removed from the scene.
+        """
+        if node is None:
+            return
+        idle = self._idle.setdefault(node.GetClassName(), [])
+        # Releasing a node more than once should not let it be acquired twice
+        if any(n is node for n in idle):
+            return
+        if len(idle) >= self.max_idle or node.GetScene() is None:
+            self._remove(node)
+            return
+        self._scrub(node)
+        idle.append(node)
+
+    def clear(self):
+        """
+        Remove every idle node from the scene.
+        """
+        for nodes in self._idle.values():
+            for n in nodes:
+                self._remove(n)
+        self._idle = dict()
+
+    ## Utilities ##
+    def _scrub(self, node):
+        # Reset its display nodes in place, so the next case doesn't inherit its
+        # display settings (i.e. a manually adjusted window/level, colors, glyphs)
+        for i in range(node.GetNumberOfDisplayNodes()):
+            display_node = node.GetNthDisplayNode(i)
+            if display_node is not None:
+                self._reset_display_node(display_node)
+
+        # Hide the node, including from editor GUIs and the data tree
+        node.SetName(self.IDLE_NODE_NAME)
+        node.SetDisplayVisibility(False)
+        node.SetSelectable(False)
+        node.SetHideFromEditors(True)
+        node.SetAndObserveTransformNodeID(None)
+
+        # Detach it from whatever subject it belonged to
+        sh_node = slicer.mrmlScene.GetSubjectHierarchyNode()
+        item_id = sh_node.GetItemByDataNode(node)
+        if item_id:
+            sh_node.SetItemParent(item_id, sh_node.GetSceneItemID())
+
+        # Drop everything tasks may have attached to it, save for its storage and display nodes
+        for attribute_name in node.GetAttributeNames():
+            node.RemoveAttribute(attribute_name)
+        roles = [
+            node.GetNthNodeReferenceRole(i) for i in range(node.GetNumberOfNodeReferenceRoles())
+        ]
+        kept_roles = {node.GetStorageNodeReferenceRole(), node.GetDisplayNodeReferenceRole()}
+        for role in roles:
+            if role not in kept_roles:
+                node.RemoveNodeReferenceIDs(role)
+
+        # Release its contents, so they can be freed from memory
+        if isinstance(node, slicer.vtkMRMLVolumeNode):
+            node.SetAndObserveImageData(None)
+        elif isinstance(node, slicer.vtkMRMLSegmentationNode):
+            node.GetSegmentation().RemoveAllSegments()
+        elif isinstance(node, slicer.vtkMRMLMarkupsNode):
+            node.RemoveAllControlPoints()
+            node.SetLocked(False)
+
+    @staticmethod
+    def _reset_display_node(display_node):
+        # Start from the scene's defaults for this class if it has any, like a new display node would
+        default = display_node.GetScene().GetDefaultNodeByClass(display_node.GetClassName())
+        if default is None:
+            default = display_node.__class__()
+        was_modifying = display_node.StartModify()
+        display_node.CopyContent(default)
+        # Volumes also need their default color table back, as it's a reference rather than content
+        if isinstance(display_node, slicer.vtkMRMLVolumeDisplayNode):
+            display_node.SetDefaultColorMap()
+        display_node.EndModify(was_modifying)
+
+    @staticmethod
+    def _remove(node):
+        scene = node.GetScene()
+        if scene is not None:
+            scene.RemoveNode(node)
@@ -0,0 +1,29 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import slicer
+
+# Whether `batch_scene_updates` should batch anything; disable it to compare
+# timings (see `CARTLib.utils.timing`) with and without batching
+BATCH_SCENE_UPDATES = True
+
+
+@contextmanager
+def batch_scene_updates(scene: Optional[slicer.vtkMRMLScene] = None) -> Iterator[None]:
+    """
+    Group every change made to the MRML scene within the enclosed block into a
+    single batch. Observers (views, node selectors, the segment editor, etc.)
+    then update once when the block ends, rather than after every change.
+
+    Blocks can be nested; observers update once the outermost one ends.
+    """
+    if scene is None:
+        scene = slicer.mrmlScene
+    if not BATCH_SCENE_UPDATES:
+        yield
+        return
+    scene.StartState(slicer.vtkMRMLScene.BatchProcessState)
+    try:
+        yield
+    finally:
+        scene.EndState(slicer.vtkMRMLScene.BatchProcessState)
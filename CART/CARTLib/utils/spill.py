@@ -0,0 +1,198 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, NamedTuple, Optional
+
+import numpy as np
+
+
+class SpilledState(NamedTuple):
+    """
+    The unsaved contents of a data unit, detached from the MRML scene.
+    """
+    # The (voxel, point, etc.) arrays to preserve, by name
+    arrays: dict[str, np.ndarray]
+    # Everything else needed to rebuild the unit's contents; must be JSON serializable
+    meta: dict
+
+
+class SpillStore:
+    """
+    Second cache tier for data units which fell out of memory while holding
+    unsaved edits (i.e. segmentations modified w/ autosave disabled).
+
+    Each unit's edits are "spilled" into a compressed scratch file, keyed by
+    the unit's UID; the next time the case is loaded, they are read back out
+    (via `peek`) and restored in place of the source files' contents, only
+    being `discard`ed once that succeeds. Entries only live as long as the job
+    they came from, and should be `clear`ed once it closes.
+
+    The oldest entries are discarded (w/ a warning, as their edits are lost)
+    whenever the store grows beyond its size budget. A budget of 0 disables
+    spilling entirely.
+    """
+
+    # The default amount of disk space (in bytes) spilled edits may use
+    DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+    # The name under which each entry's metadata is stored within its file
+    META_KEY = "__meta__"
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes: int = max_bytes
+
+        # Scratch directory for our entries; created the first time it's needed
+        self._root: Optional[Path] = None
+
+        # UID -> (file, size in bytes, resource keys) for each entry, oldest first
+        self._entries: OrderedDict[str, tuple[Path, int, frozenset[str]]] = OrderedDict()
+        # Used to give each entry a unique file name
+        self._next_id: int = 0
+
+        # Guards against concurrent writes/evictions
+        self._lock = Lock()
+
+        self.configure(max_bytes)
+
+    ## Properties ##
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def configure(self, max_bytes: int):
+        """
+        Change how much disk space the store may use, discarding the oldest
+        entries if they no longer fit.
+        """
+        if type(max_bytes) != int or max_bytes < 0:
+            raise ValueError("Spill budget must be a positive integer!")
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._trim()
+
+    def size(self) -> int:
+        """
+        The total size (in bytes) of everything currently spilled.
+        """
+        with self._lock:
+            return sum([s for __, s, __ in self._entries.values()])
+
+    ## Entry Management ##
+    def __contains__(self, uid: str) -> bool:
+        with self._lock:
+            return uid in self._entries
+
+    def spilled_keys(self, uid: str) -> frozenset[str]:
+        """
+        The keys of the resources spilled for the given unit (see `put`);
+        empty if nothing was spilled for it.
+        """
+        with self._lock:
+            entry = self._entries.get(uid)
+        return entry[2] if entry is not None else frozenset()
+
+    def put(self, uid: str, state: SpilledState, keys: Iterable[str] = ()) -> bool:
+        """
+        Spill a unit's state to disk, replacing any prior entry for it.
+        `keys` lists the resources the state covers, so they can be checked
+        (w/o reading the entry back) through `spilled_keys`.
+        Returns whether it was stored.
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            self._remove(uid)
+            try:
+                path = self._scratch_dir() / f"{self._next_id}.npz"
+                self._next_id += 1
+                # Write to a temporary file first, so partial entries are never read
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as fp:
+                    np.savez_compressed(
+                        fp,
+                        **{self.META_KEY: np.array(json.dumps(state.meta))},
+                        **state.arrays,
+                    )
+                os.replace(tmp_path, path)
+                size = path.stat().st_size
+            except OSError as e:
+                logging.warning(f"Failed to spill the unsaved edits for case '{uid}': {e}")
+                return False
+            # Entries which could never fit are dropped immediately
+            if size > self.max_bytes:
+                path.unlink(missing_ok=True)
+                logging.warning(
+                    f"The unsaved edits for case '{uid}' were too large to keep, and were discarded."
+                )
+                return False
+            self._entries[uid] = (path, size, frozenset(keys))
+            self._trim()
+        return True
+
+    def peek(self, uid: str) -> Optional[SpilledState]:
+        """
+        Read a unit's state from the store, leaving the entry in place until
+        it is `discard`ed; None if there was no entry for it (or it could no
+        longer be read, in which case the entry is dropped).
+        """
+        with self._lock:
+            entry = self._entries.get(uid)
+        if entry is None:
+            return None
+        path = entry[0]
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data[self.META_KEY]))
+                arrays = {k: data[k] for k in data.files if k != self.META_KEY}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Failed to restore the unsaved edits for case '{uid}': {e}")
+            self.discard(uid)
+            return None
+        return SpilledState(arrays, meta)
+
+    def discard(self, uid: str):
+        """
+        Drop the entry for the given unit, if there is one.
+        """
+        with self._lock:
+            self._remove(uid)
+
+    def clear(self):
+        """
+        Delete everything in the store, including its scratch directory.
+        """
+        with self._lock:
+            self._entries.clear()
+            if self._root is not None:
+                shutil.rmtree(self._root, ignore_errors=True)
+                self._root = None
+
+    ## Utilities ##
+    def _scratch_dir(self) -> Path:
+        # MUST be called with the lock held
+        if self._root is None or not self._root.is_dir():
+            self._root = Path(tempfile.mkdtemp(prefix="cart_spill_"))
+        return self._root
+
+    def _remove(self, uid: str):
+        # MUST be called with the lock held
+        entry = self._entries.pop(uid, None)
+        if entry is not None:
+            entry[0].unlink(missing_ok=True)
+
+    def _trim(self):
+        # Discard the oldest entries until we're within budget; MUST be called with the lock held
+        total = sum([s for __, s, __ in self._entries.values()])
+        while self._entries and total > self.max_bytes:
+            uid, (path, size, __) = self._entries.popitem(last=False)
+            path.unlink(missing_ok=True)
+            total -= size
+            logging.warning(
+                f"Discarded the unsaved edits for case '{uid}', as too many edited cases "
+                "were unloaded without being saved."
+            )
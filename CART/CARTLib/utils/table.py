@@ -0,0 +1,152 @@
+from typing import Iterable
+
+import numpy as np
+from numpy import typing as npt
+
+
+class GrowableTable:
+    """
+    2D object array which reserves spare rows and columns, so cells can be
+    inserted (and removed) without copying the entire table each time.
+
+    `data` is a view onto the filled portion of the backing buffer; it (and
+    any views taken from it) write through to the table, but should not be
+    held onto across insertions or deletions, as these may replace the buffer.
+
+    Appending is amortized O(1) per row/column, as the buffer grows
+    geometrically once it runs out of space; inserting or deleting in the
+    middle only shifts the rows/columns after the affected position(s).
+
+    `row_version` and `column_version` change whenever rows (or columns,
+    respectively) are inserted or deleted, so anything derived from the
+    table's layout (i.e. lookups of where each row lies) can tell when it
+    needs to be re-built.
+    """
+
+    # How much the buffer grows by whenever it runs out of space
+    GROWTH_FACTOR = 2
+
+    # The smallest number of rows/columns to reserve space for
+    MIN_CAPACITY = 8
+
+    # The value given to new (and vacated) cells
+    FILL_VALUE = ""
+
+    def __init__(self, data: "npt.NDArray"):
+        """
+        :param data: The table's initial contents; must be 2D.
+        """
+        data = np.asarray(data, dtype="object")
+        if data.ndim != 2:
+            raise ValueError(f"Table contents must be 2D, got {data.ndim} dimension(s) instead!")
+        self._rows, self._cols = data.shape
+        self._buffer = self._allocate(
+            self._grown(0, self._rows), self._grown(0, self._cols)
+        )
+        self._buffer[:self._rows, :self._cols] = data
+
+        # Bumped by every insertion/deletion along the corresponding axis
+        self.row_version: int = 0
+        self.column_version: int = 0
+
+    ## Properties ##
+    @property
+    def data(self) -> "npt.NDArray":
+        return self._buffer[:self._rows, :self._cols]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._rows, self._cols
+
+    @property
+    def capacity(self) -> tuple[int, int]:
+        return self._buffer.shape
+
+    ## Insertion ##
+    def insert_rows(self, at: int, count: int):
+        """
+        Insert `count` blank rows before row `at`.
+        """
+        if not 0 <= at <= self._rows:
+            raise ValueError(f"Cannot insert rows at {at}, index is out of range.")
+        if count < 1:
+            return
+        self._reserve(self._rows + count, self._cols)
+        # Shift everything after the insertion point down to make room
+        buf = self._buffer
+        buf[at + count:self._rows + count, :self._cols] = buf[at:self._rows, :self._cols]
+        buf[at:at + count, :self._cols] = self.FILL_VALUE
+        self._rows += count
+        self.row_version += 1
+
+    def insert_columns(self, at: int, count: int):
+        """
+        Insert `count` blank columns before column `at`.
+        """
+        if not 0 <= at <= self._cols:
+            raise ValueError(f"Cannot insert columns at {at}, index is out of range.")
+        if count < 1:
+            return
+        self._reserve(self._rows, self._cols + count)
+        # Shift everything after the insertion point right to make room
+        buf = self._buffer
+        buf[:self._rows, at + count:self._cols + count] = buf[:self._rows, at:self._cols]
+        buf[:self._rows, at:at + count] = self.FILL_VALUE
+        self._cols += count
+        self.column_version += 1
+
+    ## Deletion ##
+    def delete_rows(self, indices: Iterable[int]):
+        """
+        Delete the rows at the given positions, all at once.
+        """
+        keep = self._keep_mask(indices, self._rows)
+        n_kept = int(keep.sum())
+        # Compact the surviving rows to the front, clearing the vacated ones
+        self._buffer[:n_kept, :self._cols] = self.data[keep]
+        self._buffer[n_kept:self._rows, :self._cols] = self.FILL_VALUE
+        self._rows = n_kept
+        self.row_version += 1
+
+    def delete_columns(self, indices: Iterable[int]):
+        """
+        Delete the columns at the given positions, all at once.
+        """
+        keep = self._keep_mask(indices, self._cols)
+        n_kept = int(keep.sum())
+        # Compact the surviving columns to the front, clearing the vacated ones
+        self._buffer[:self._rows, :n_kept] = self.data[:, keep]
+        self._buffer[:self._rows, n_kept:self._cols] = self.FILL_VALUE
+        self._cols = n_kept
+        self.column_version += 1
+
+    ## Utilities ##
+    def _reserve(self, rows: int, cols: int):
+        # Grow the buffer (if needed) to hold the requested number of rows and columns
+        row_cap, col_cap = self._buffer.shape
+        if rows <= row_cap and cols <= col_cap:
+            return
+        new_buffer = self._allocate(self._grown(row_cap, rows), self._grown(col_cap, cols))
+        new_buffer[:self._rows, :self._cols] = self.data
+        self._buffer = new_buffer
+
+    def _grown(self, capacity: int, required: int) -> int:
+        # The capacity needed to hold the required size, growing geometrically
+        if required <= capacity:
+            return capacity
+        return max(required, capacity * self.GROWTH_FACTOR, self.MIN_CAPACITY)
+
+    def _allocate(self, rows: int, cols: int) -> "npt.NDArray":
+        buffer = np.empty((rows, cols), dtype="object")
+        buffer[:] = self.FILL_VALUE
+        return buffer
+
+    @staticmethod
+    def _keep_mask(indices: Iterable[int], size: int) -> "npt.NDArray[bool]":
+        keep = np.ones(size, dtype=bool)
+        indices = list(indices)
+        if indices:
+            if min(indices) < -size or max(indices) >= size:
+                raise ValueError("Cannot delete entries, an index is out of range.")
+            keep[indices] = False
+        return keep
@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Optional
+
+# Signature of a timing hook; receives the timed step's label and duration (in seconds)
+TimingHook = Callable[[str, float], None]
+
+# Hooks which are notified whenever a `timed` step finishes
+_TIMING_HOOKS: list[TimingHook] = list()
+
+
+def add_timing_hook(hook: TimingHook):
+    """
+    Register a hook to be notified of how long each `timed` step took.
+    """
+    if hook not in _TIMING_HOOKS:
+        _TIMING_HOOKS.append(hook)
+
+
+def remove_timing_hook(hook: TimingHook):
+    """
+    Stop notifying a previously registered hook.
+    """
+    if hook in _TIMING_HOOKS:
+        _TIMING_HOOKS.remove(hook)
+
+
+def log_timing(label: str, seconds: float):
+    """
+    Timing hook which logs each step's duration; register it with
+    `add_timing_hook` to see where time is being spent.
+    """
+    logging.getLogger("CART Timing").info(f"{label}: {seconds * 1000:.1f} ms")
+
+
+## Span Tracing ##
+class Span(NamedTuple):
+    """
+    A single timed step, as recorded by a `SpanTracer`.
+    """
+    label: str
+    # When the step started and how long it took, in seconds (from `time.perf_counter`)
+    start: float
+    duration: float
+    # The thread the step ran on
+    thread_id: int
+
+
+class SpanTracer:
+    """
+    Records the `timed` steps CART runs through (i.e. each part of a case
+    switch) into a fixed-size ring buffer, so they can be inspected after the
+    fact. Steps which ran within one another become nested spans.
+
+    Spans can be exported as a Chrome trace (JSON), which can be opened in
+    Perfetto (https://ui.perfetto.dev) or Chrome's `about:tracing`. For example,
+    from Slicer's Python console:
+
+        from CARTLib.utils.timing import TRACER
+        TRACER.enable()
+        # ... switch through some cases ...
+        TRACER.export(Path("~/cart_trace.json").expanduser())
+
+    Disabled (recording nothing) by default.
+    """
+
+    # The default number of spans to keep; older spans are dropped beyond this
+    DEFAULT_CAPACITY = 20000
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.enabled: bool = False
+        self._spans: deque[Span] = deque(maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._spans.maxlen
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        self._spans.clear()
+
+    def record(self, label: str, start: float, duration: float):
+        # `deque.append` is atomic, so this is safe to call from any thread
+        self._spans.append(Span(label, start, duration, threading.get_ident()))
+
+    def spans(self) -> list[Span]:
+        """
+        The spans currently in the buffer, oldest first.
+        """
+        return list(self._spans)
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Format the recorded spans as a Chrome trace ("complete" events, with
+        times in microseconds).
+        """
+        pid = os.getpid()
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        events = []
+        thread_ids = set()
+        for span in self.spans():
+            thread_ids.add(span.thread_id)
+            events.append({
+                "name": span.label,
+                "cat": "CART",
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.thread_id,
+            })
+        # Label each thread, so the main thread and workers are easy to tell apart
+        for tid in thread_ids:
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread_names.get(tid, str(tid))},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: Path):
+        """
+        Write the recorded spans to a Chrome trace (JSON) file.
+        """
+        with open(path, "w") as fp:
+            json.dump(self.to_chrome_trace(), fp)
+
+
+# The tracer `timed` steps are recorded into
+TRACER = SpanTracer()
+
+
+@contextmanager
+def timed(label: str) -> Iterator[None]:
+    """
+    Time the enclosed block, reporting the result to every registered hook and
+    recording it as a span (if `TRACER` is enabled).
+
+    Does nothing (beyond running the block) if neither is the case.
+    """
+    if not (TRACER.enabled or _TIMING_HOOKS):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if TRACER.enabled:
+            TRACER.record(label, start, elapsed)
+        for hook in list(_TIMING_HOOKS):
+            hook(label, elapsed)
+
+
+def traced(label: Optional[str] = None):
+    """
+    Decorator which runs the function within a `timed` block; labelled with
+    the function's qualified name, unless a label is provided.
+    """
+    def decorator(func):
+        span_label = label or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Skip the context manager entirely when there's nothing to report to
+            if not (TRACER.enabled or _TIMING_HOOKS):
+                return func(*args, **kwargs)
+            with timed(span_label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
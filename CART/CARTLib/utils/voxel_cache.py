@@ -0,0 +1,226 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO, Callable, Optional
+
+import numpy as np
+
+# These become available when Slicer initializes
+# noinspection PyUnresolvedReferences
+import vtk
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+
+class VoxelDiskCache:
+    """
+    Persistent, on-disk cache of decoded voxel data (and its geometry).
+
+    Decompressing (i.e. `.nii.gz`) files is where most of the time spent
+    loading a volume goes. As the same files tend to be loaded again and again
+    (across sessions and annotators), we store their decoded contents in an
+    uncompressed format that can be memory-mapped back in almost instantly.
+
+    Each file's entry is keyed by its path, size, and modification time, so
+    any change to the source file invalidates it. The least recently used
+    entries are deleted whenever the cache grows beyond its size budget.
+
+    Disabled (caching nothing) until a cache directory has been configured.
+    """
+
+    # The default amount of disk space (in bytes) the cache may use
+    DEFAULT_MAX_BYTES = 20 * 1024 ** 3
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._root: Optional[Path] = None
+        self.max_bytes: int = max_bytes
+
+        # Guards against concurrent writes/evictions (i.e. from pre-fetching)
+        self._lock = Lock()
+
+        self.configure(root, max_bytes)
+
+    ## Properties ##
+    @property
+    def root(self) -> Optional[Path]:
+        return self._root
+
+    @property
+    def enabled(self) -> bool:
+        return self._root is not None
+
+    def configure(self, root: Optional[Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        (Re-)configure where the cache lives, and how large it may grow.
+        Providing no root directory disables the cache.
+        """
+        if max_bytes < 0:
+            raise ValueError("Voxel cache budget cannot be negative!")
+        with self._lock:
+            self._root = Path(root) if root else None
+            self.max_bytes = max_bytes
+
+    ## Entry Management ##
+    def _key_for(self, path: Path) -> Optional[str]:
+        # Key each entry by the file's path, size, and modification time
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key_str = f"{Path(path).absolute()}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(key_str.encode("utf-8")).hexdigest()
+
+    def get(self, path: Path) -> Optional[tuple[vtk.vtkImageData, vtk.vtkMatrix4x4]]:
+        """
+        Get the cached image data and IJK -> RAS matrix for the given file, if
+        they are in the cache. The voxels are memory-mapped (copy-on-write),
+        so they are only read from disk as they are needed.
+        """
+        root = self._root
+        if root is None:
+            return None
+        key = self._key_for(path)
+        if key is None:
+            return None
+        meta_path = root / f"{key}.json"
+        voxel_path = root / f"{key}.npy"
+
+        # The metadata is written last, so an entry w/o it is incomplete
+        try:
+            with open(meta_path, "r") as fp:
+                meta = json.load(fp)
+            voxels = np.load(voxel_path, mmap_mode="c")
+        except (OSError, ValueError):
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+        # Rebuild the image around the memory-mapped voxels
+        image_data = vtk.vtkImageData()
+        image_data.SetDimensions(*meta["dimensions"])
+        image_data.GetPointData().SetScalars(numpy_to_vtk(voxels, deep=False))
+
+        ijk_to_ras = vtk.vtkMatrix4x4()
+        ijk_to_ras.DeepCopy(meta["ijk_to_ras"])
+
+        return image_data, ijk_to_ras
+
+    def put(self, path: Path, image_data: vtk.vtkImageData, ijk_to_ras: vtk.vtkMatrix4x4):
+        """
+        Store the decoded contents of the given file in the cache, evicting
+        older entries if this pushes the cache over its budget.
+        """
+        root = self._root
+        if root is None:
+            return
+        key = self._key_for(path)
+        if key is None:
+            return
+
+        # Skip images which couldn't fit in the cache regardless
+        voxels = vtk_to_numpy(image_data.GetPointData().GetScalars())
+        if voxels.nbytes > self.max_bytes:
+            return
+
+        meta = {
+            "source": str(Path(path).absolute()),
+            "dimensions": list(image_data.GetDimensions()),
+            "ijk_to_ras": [ijk_to_ras.GetElement(i, j) for i in range(4) for j in range(4)],
+        }
+
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+            # Write everything to temporary files first, so partial entries are never read
+            _write_replacing(root, root / f"{key}.npy", lambda fp: np.save(fp, voxels))
+            _write_replacing(
+                root, root / f"{key}.json", lambda fp: fp.write(json.dumps(meta).encode("utf-8"))
+            )
+        except OSError as e:
+            logging.warning(f"Failed to cache decoded voxels for '{path}': {e}")
+            return
+
+        self.evict()
+
+    def size(self) -> int:
+        """
+        The total size (in bytes) of everything currently in the cache.
+        """
+        return sum([s for __, s, __ in self._entries()])
+
+    def _entries(self) -> list[tuple[str, int, float]]:
+        # (key, size in bytes, last used time) for each entry in the cache
+        root = self._root
+        if root is None or not root.is_dir():
+            return []
+        entries = []
+        for voxel_path in root.glob("*.npy"):
+            # Skip the temporary files of entries still being written (or left behind)
+            if voxel_path.name.endswith(".tmp"):
+                continue
+            meta_path = voxel_path.with_suffix(".json")
+            try:
+                size = voxel_path.stat().st_size
+                if meta_path.exists():
+                    size += meta_path.stat().st_size
+                    last_used = meta_path.stat().st_mtime
+                else:
+                    last_used = voxel_path.stat().st_mtime
+            except OSError:
+                continue
+            entries.append((voxel_path.stem, size, last_used))
+        return entries
+
+    def evict(self):
+        """
+        Delete the least recently used entries until the cache is within
+        its size budget.
+        """
+        with self._lock:
+            entries = self._entries()
+            total = sum([s for __, s, __ in entries])
+            for key, size, __ in sorted(entries, key=lambda e: e[2]):
+                if total <= self.max_bytes:
+                    break
+                if self._remove(key):
+                    total -= size
+
+    def clear(self):
+        """
+        Delete everything in the cache.
+        """
+        with self._lock:
+            for key, __, __ in self._entries():
+                self._remove(key)
+
+    def _remove(self, key: str) -> bool:
+        # Delete the metadata first, so the entry can't be read half-deleted
+        try:
+            (self._root / f"{key}.json").unlink(missing_ok=True)
+            (self._root / f"{key}.npy").unlink(missing_ok=True)
+        except OSError:
+            # Can happen on Windows while the voxels are still memory-mapped
+            return False
+        return True
+
+
+def _write_replacing(root: Path, dest: Path, write: Callable[[BinaryIO], object]):
+    # Write to a uniquely named temporary file, then move it into place; any
+    #  number of writers (threads or Slicer sessions) can then race on one entry
+    fd, tmp_path = tempfile.mkstemp(dir=root, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            write(fp)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -14,6 +14,8 @@ from slicer.i18n import tr as _
 # noinspection PyUnresolvedReferences
 import qSlicerSegmentationsModuleWidgetsPythonQt
 
+from .table import GrowableTable
+
 if TYPE_CHECKING:
     import numpy.typing as npt
     # Try to use a reference PyQT5 install if it's available
@@ -145,8 +147,8 @@ class CSVBackedTableModel(qt.QAbstractTableModel):
         # The CSV path that should be referenced
         self._csv_path = csv_path
 
-        # The backing contents of the CSV data
-        self._csv_data: "Optional[npt.NDArray[str]]" = None
+        # The backing contents of the CSV data; reserves spare space, so rows/columns can be added cheaply
+        self._table: Optional[GrowableTable] = None
 
         # Cells should, by default, be enabled and select-able
         self._flags = qt.Qt.ItemIsEnabled | qt.Qt.ItemIsSelectable
@@ -163,6 +165,17 @@ class CSVBackedTableModel(qt.QAbstractTableModel):
         else:
             self._csv_data = np.empty((0, 0), dtype="object")
 
+    @property
+    def _csv_data(self) -> "Optional[npt.NDArray[str]]":
+        # The full contents of the CSV (header included), as a view onto our table
+        if self._table is None:
+            return None
+        return self._table.data
+
+    @_csv_data.setter
+    def _csv_data(self, new_data: "Optional[npt.NDArray[str]]"):
+        self._table = None if new_data is None else GrowableTable(new_data)
+
     @property
     def csv_path(self):
         return self._csv_path
@@ -244,31 +257,25 @@ class CSVBackedTableModel(qt.QAbstractTableModel):
 
     def insertRows(self, row: int, count: int, parent = ...):
         self.beginInsertRows(parent, row, row + count - 1)
-        # Numpy inserts iteratively, hence the "replicated" index
-        idx = [row] * count
-        self._csv_data = np.insert(self._csv_data, idx, "", axis=0)
+        self._table.insert_rows(row, count)
         self.endInsertRows()
 
     def insertColumns(self, column: int, count: int, parent = ...):
         self.beginInsertColumns(parent, column, column + count - 1)
-        # Numpy inserts iteratively, hence the "replicated" index
-        idx = [column] * count
-        self._csv_data = np.insert(self._csv_data, idx, "", axis=1)
+        self._table.insert_columns(column, count)
         self.endInsertColumns()
 
     def removeRows(self, row, count, parent = ...):
         self.beginRemoveRows(parent, row, row + count - 1)
-        # Unlike insertion, numpy does this simultaneously
         # Offset by 1 to account for the header row
         idx = [row + i + 1 for i in range(count)]
-        self._csv_data = np.delete(self._csv_data, idx, axis=0)
+        self._table.delete_rows(idx)
         self.endRemoveRows()
 
     def removeColumns(self, column, count, parent = ...):
         self.beginRemoveColumns(parent, column, column + count - 1)
-        # Unlike insertion, numpy does this simultaneously
         idx = [column + i for i in range(count)]
-        self._csv_data = np.delete(self._csv_data, idx, axis=1)
+        self._table.delete_columns(idx)
         self.endRemoveColumns()
 
     def setRow(self, row_idx, contents: "npt.NDArray[str]"):
@@ -317,6 +324,73 @@ class CSVBackedTableModel(qt.QAbstractTableModel):
             raise ValueError(f"Cannot drop column {col_idx}, index is out of range.")
         self.removeColumn(col_idx)
 
+    def addRows(self, row_idx: int, contents: "npt.NDArray[str]"):
+        """
+        Insert several rows before the given row at once, notifying any views
+        only once (rather than once per row).
+        """
+        n_rows = contents.shape[0]
+        if n_rows < 1:
+            return
+        self.beginInsertRows(qt.QModelIndex(), row_idx, row_idx + n_rows - 1)
+        # Offset by 1 to account for the header row
+        self._table.insert_rows(row_idx + 1, n_rows)
+        self._fill_rows(row_idx, contents)
+        self.endInsertRows()
+
+    def dropRows(self, row_indices: list[int]):
+        """
+        Remove several rows at once, notifying any views only once (rather
+        than once per row).
+        """
+        row_indices = sorted(set(row_indices))
+        if not row_indices:
+            return
+        if row_indices[0] < 0 or row_indices[-1] >= self.rowCount():
+            raise ValueError("Cannot drop rows, an index is out of range.")
+        # Contiguous rows can be removed as a block; anything else resets the views outright
+        is_contiguous = row_indices[-1] - row_indices[0] == len(row_indices) - 1
+        if is_contiguous:
+            self.beginRemoveRows(qt.QModelIndex(), row_indices[0], row_indices[-1])
+        else:
+            self.beginResetModel()
+        # Offset by 1 to account for the header row
+        self._table.delete_rows([r + 1 for r in row_indices])
+        if is_contiguous:
+            self.endRemoveRows()
+        else:
+            self.endResetModel()
+
+    def dropColumns(self, col_indices: list[int]):
+        """
+        Remove several columns at once, notifying any views only once (rather
+        than once per column).
+        """
+        col_indices = sorted(set(col_indices))
+        if not col_indices:
+            return
+        if col_indices[0] < 0 or col_indices[-1] >= self.columnCount():
+            raise ValueError("Cannot drop columns, an index is out of range.")
+        # Contiguous columns can be removed as a block; anything else resets the views outright
+        is_contiguous = col_indices[-1] - col_indices[0] == len(col_indices) - 1
+        if is_contiguous:
+            self.beginRemoveColumns(qt.QModelIndex(), col_indices[0], col_indices[-1])
+        else:
+            self.beginResetModel()
+        self._table.delete_columns(col_indices)
+        if is_contiguous:
+            self.endRemoveColumns()
+        else:
+            self.endResetModel()
+
+    def _fill_rows(self, row_idx: int, contents: "npt.NDArray[str]"):
+        # Copy the contents into the (blank) rows starting at the given index,
+        #  trimming or padding each row to our width
+        n_rows = contents.shape[0]
+        n_cols = min(contents.shape[1] if contents.ndim == 2 else 0, self.columnCount())
+        if n_cols > 0:
+            self.csv_data[row_idx:row_idx + n_rows, :n_cols] = contents[:, :n_cols]
+
     def flags(self, __: qt.QModelIndex) -> "qt.Qt.ItemFlags":
         # Return the current set of flags for the model
         return self._flags
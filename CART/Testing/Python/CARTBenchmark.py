@@ -0,0 +1,391 @@
+"""
+Benchmark suite for CART's case management, run against a synthetic
+BIDS-like cohort (see `SyntheticCohort.py`). Times:
+
+    * Cohort generation; finding cases (`_bids_cases`) and the files for
+      each resource (`CohortModel.find_column_files`), both directly and
+      through a background `CohortGenerationJob`; bulk `add_cases` and
+      `drop_cases` as well
+    * `DataManager` construction
+    * Navigating through every case, w/ completion checks
+    * Each task's `save_unit`
+
+Can be run w/ plain Python, in which case lightweight stand-ins replace
+Slicer (see `SlicerStandIns.py`); data units are then "headless" (they load
+no files), so only the pure-Python parts of each step are measured:
+
+    python CARTBenchmark.py [--cases 200] [--volumes 2] [--shape 64 64 32] \
+        [--labels 3] [--repeats 5] [--json results.json]
+
+Or run through Slicer, to benchmark everything w/ real data units:
+
+    Slicer --no-main-window --python-script CARTBenchmark.py [...]
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+import SlicerStandIns
+
+# Whether we're benchmarking w/ Slicer itself, or w/ our stand-ins
+SLICER_AVAILABLE = SlicerStandIns.is_slicer_available()
+
+from SyntheticCohort import CohortSpec, SyntheticCohort, generate_cohort, read_cohort_rows  # noqa: E402
+
+# Make the example tasks importable, as CART does when registering them
+EXAMPLES_PATH = Path(__file__).parents[2] / "CARTLib/examples"
+for task_dir in ["Segmentation", "Markup", "GenericClassification"]:
+    sys.path.insert(0, str(EXAMPLES_PATH / task_dir))
+
+from CARTLib.core.DataManager import DataManager  # noqa: E402
+from CARTLib.core.DataUnitBase import DataUnitBase  # noqa: E402
+from CARTLib.utils.cohort import CohortGenerationJob, CohortModel, _bids_cases  # noqa: E402
+from CARTLib.utils.config import JobProfileConfig, MasterProfileConfig  # noqa: E402
+from CARTLib.utils.indexing import DIRECTORY_CRAWLER  # noqa: E402
+
+from GenericClassificationOutputManager import GenericClassificationOutputManager  # noqa: E402
+from Markup import MarkupOutput  # noqa: E402
+from SegmentationTask import SegmentationTask  # noqa: E402
+
+
+## Timing ##
+class Results:
+    """
+    Collects the timings of each benchmarked step.
+    """
+
+    def __init__(self):
+        self.timings: dict[str, list[float]] = dict()
+        self.failures: list[str] = list()
+
+    def record(self, label: str, seconds: float):
+        self.timings.setdefault(label, []).append(seconds)
+
+    def measure(self, label: str, func: Callable, repeats: int = 1):
+        """
+        Time the function `repeats` times, returning its last result.
+        """
+        result = None
+        for __ in range(repeats):
+            start = time.perf_counter()
+            result = func()
+            self.record(label, time.perf_counter() - start)
+        return result
+
+    def check(self, label: str, passed: bool):
+        # Track sanity checks which failed, so they can be reported
+        if not passed:
+            self.failures.append(label)
+            print(f"  CHECK FAILED: {label}")
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            label: {
+                "n": len(times),
+                "best_ms": min(times) * 1000,
+                "mean_ms": statistics.mean(times) * 1000,
+                "max_ms": max(times) * 1000,
+                "total_ms": sum(times) * 1000,
+            }
+            for label, times in self.timings.items()
+        }
+
+    def print_table(self):
+        print(f"{'Step':<42} {'n':>6} {'best ms':>10} {'mean ms':>10} {'max ms':>10}")
+        for label, s in self.summary().items():
+            print(
+                f"{label:<42} {s['n']:>6} {s['best_ms']:>10.2f} "
+                f"{s['mean_ms']:>10.2f} {s['max_ms']:>10.2f}"
+            )
+
+
+## Headless Units ##
+class HeadlessUnit(DataUnitBase):
+    """
+    Data unit which loads nothing, for benchmarking outside of Slicer.
+    Provides everything the Segmentation and Markup tasks' `save_unit`
+    functions expect.
+    """
+
+    def __init__(self, case_data: dict[str, str], data_path: Path, prior_data: dict = None, **__):
+        super().__init__(case_data, data_path, prior_data)
+        self.volume_nodes = dict()
+        self.segmentation_nodes = dict()
+        self.markup_nodes = dict()
+        self.reference_volume_node = None
+
+    def to_dict(self) -> dict:
+        return dict(self.case_data)
+
+    def validate(self):
+        if self.uid is None:
+            raise ValueError("Case has no UID!")
+
+    @property
+    def layout_handler(self):
+        return None
+
+    def edit_stamps(self) -> dict[str, tuple]:
+        # Nothing is loaded, so nothing can be edited
+        return dict()
+
+    def mark_saved(self, stamps: dict[str, tuple]):
+        pass
+
+
+## Benchmarks ##
+def benchmark_cohort_generation(results: Results, cohort: SyntheticCohort, work_dir: Path, repeats: int):
+    data_path = cohort.data_path
+
+    # Finding each case's search paths
+    case_map = results.measure("_bids_cases", lambda: dict(_bids_cases(data_path)), repeats)
+    expected = json.loads(cohort.cohort_path.with_suffix(".json").read_text())
+    results.check(
+        "_bids_cases found every case",
+        {k: sorted(map(str, v)) for k, v in case_map.items()}
+        == {k: sorted(v) for k, v in expected[CohortModel.CASE_PATH_KEY].items()},
+    )
+
+    # The same, crawling one directory at a time; results should not change
+    workers = DIRECTORY_CRAWLER.workers
+    DIRECTORY_CRAWLER.configure(1)
+    serial_case_map = results.measure("_bids_cases (serial crawl)", lambda: dict(_bids_cases(data_path)), repeats)
+    DIRECTORY_CRAWLER.configure(workers)
+    results.check("Serial and concurrent crawls agree", serial_case_map == case_map)
+
+    # Finding each resource's files; the first search also indexes the data tree
+    for i in range(repeats):
+        cohort_model = CohortModel.from_case_map(
+            work_dir / f"generated_cohort_{i}.csv", data_path, case_map, use_sidecar=False
+        )
+        for label, resource_filter in cohort.resource_filters.items():
+            results.measure(
+                "find_column_files",
+                lambda: cohort_model.find_column_files(resource_filter),
+            )
+
+    # Build the full cohort, and confirm it matches the one we generated
+    cohort_model = CohortModel.from_case_map(
+        work_dir / "generated_cohort.csv", data_path, case_map, use_sidecar=False
+    )
+    for label, resource_filter in cohort.resource_filters.items():
+        cohort_model.set_resource_data(label, resource_filter)
+    found = {
+        uid: dict(zip(cohort_model.header, row))
+        for uid, row in zip(cohort_model.indices, cohort_model.csv_data)
+    }
+    expected_rows = {r["uid"]: {k: v for k, v in r.items() if k != "uid"} for r in read_cohort_rows(cohort.cohort_path)}
+    results.check("find_column_files found every file", found == expected_rows)
+
+    # The same, w/ the resources defined first and every case then added at once
+    def _add_cases_in_bulk():
+        model = CohortModel.from_case_map(work_dir / "bulk_cohort.csv", data_path, {}, use_sidecar=False)
+        for label, resource_filter in cohort.resource_filters.items():
+            model.set_resource_data(label, resource_filter)
+        model.add_cases(case_map)
+        return model
+    cohort_model = results.measure("CohortModel.add_cases", _add_cases_in_bulk, repeats)
+    found = {
+        uid: dict(zip(cohort_model.header, row))
+        for uid, row in zip(cohort_model.indices, cohort_model.csv_data)
+    }
+    results.check("add_cases found every file", found == expected_rows)
+    results.measure("CohortModel.drop_cases", lambda: cohort_model.drop_cases(list(case_map.keys())))
+    results.check("drop_cases removed every case", cohort_model.rowCount() == 0 and not cohort_model.case_map)
+
+    # The same, done in the background as the setup wizard does
+    def _generate_in_background():
+        job = CohortGenerationJob(
+            work_dir / "background_cohort.csv", data_path, _bids_cases, cohort.resource_filters
+        )
+        job.start()
+        return job.wait(), job.cohort
+    error, cohort_model = results.measure("CohortGenerationJob", _generate_in_background, repeats)
+    found = {
+        uid: dict(zip(cohort_model.header, row))
+        for uid, row in zip(cohort_model.indices, cohort_model.csv_data)
+    }
+    results.check("CohortGenerationJob found every file", error is None and found == expected_rows)
+
+    # Cancelling partway through should stop the search, leaving nothing behind
+    cancelled_path = work_dir / "cancelled_cohort.csv"
+    job = CohortGenerationJob(cancelled_path, data_path, _bids_cases, cohort.resource_filters)
+    job.start()
+    job.cancel()
+    job.wait()
+    results.check(
+        "Cancelled CohortGenerationJob stopped early",
+        job.is_cancelled and job.progress.cases_found < len(case_map) and not cancelled_path.exists(),
+    )
+
+
+def build_profiles(cohort: SyntheticCohort, work_dir: Path) -> tuple[MasterProfileConfig, JobProfileConfig]:
+    master_profile = MasterProfileConfig()
+    master_profile.author = "benchmark"
+    master_profile.position = "benchmark"
+
+    job_profile = JobProfileConfig(file_path=work_dir / "benchmark_job.json")
+    job_profile.name = "benchmark"
+    job_profile.data_path = cohort.data_path
+    job_profile.output_path = work_dir / "output"
+    # CART's job setup creates the output directory for us
+    job_profile.output_path.mkdir()
+    job_profile.cohort_path = cohort.cohort_path
+    job_profile.task = "Segmentation"
+    return master_profile, job_profile
+
+
+def benchmark_data_manager(results: Results, cohort: SyntheticCohort, task: SegmentationTask, repeats: int) -> DataManager:
+    factory = task.getDataUnitFactory() if SLICER_AVAILABLE else HeadlessUnit
+    # W/o an event loop, pre-fetched units would never finish building
+    prefetch_next = 1 if SLICER_AVAILABLE else 0
+
+    def _build():
+        return DataManager(
+            cohort_file=cohort.cohort_path,
+            data_source=cohort.data_path,
+            data_unit_factory=factory,
+            reference_task=task,
+            prefetch_next=prefetch_next,
+        )
+
+    manager = results.measure("DataManager construction", _build, repeats)
+    results.check("DataManager loaded every case", manager.valid_uids == cohort.uids)
+    return manager
+
+
+def benchmark_navigation(results: Results, manager: DataManager, task: SegmentationTask):
+    results.measure("Completion index", lambda: manager.build_completion_index(task))
+
+    # Walk forward through every case, skipping to incomplete ones where possible
+    results.measure("Select first incomplete", lambda: manager.first_incomplete(task))
+    while manager.has_next_case():
+        results.measure("Next case (w/ completion check)", lambda: (
+            manager.next(), manager.is_case_completed(manager.current_case_index, task)
+        ))
+        _process_events()
+
+    # Then walk back through them, which should mostly hit the cache
+    while manager.has_previous_case():
+        results.measure("Previous case (w/ completion check)", lambda: (
+            manager.previous(), manager.is_case_completed(manager.current_case_index, task)
+        ))
+        _process_events()
+
+
+def benchmark_saves(
+    results: Results,
+    manager: DataManager,
+    task: SegmentationTask,
+    master_profile: MasterProfileConfig,
+    job_profile: JobProfileConfig,
+):
+    # Every task saves every case
+    classification_output = GenericClassificationOutputManager(job_profile)
+    markup_output = MarkupOutput()
+    markup_output.output_dir = job_profile.output_path / "markups"
+    segmentation_io = task.io
+
+    for idx in range(len(manager.case_data)):
+        unit = manager.select_unit_at(idx)
+        _process_events()
+        # Classifications only need the case's UID (and the classes themselves)
+        classified = SimpleNamespace(uid=unit.uid, classes={"benchmarked"}, remarks="")
+        results.measure(
+            "GenericClassification save_unit",
+            lambda: classification_output.save_unit(classified),
+        )
+        results.measure(
+            "Markup save_unit",
+            lambda: markup_output.save_unit(unit, master_profile),
+        )
+        # Segmentations are written in the background; time until they're on disk, too
+        results.measure("Segmentation save_unit", lambda: segmentation_io.save_unit(unit))
+        results.measure("Segmentation save_unit (until written)", segmentation_io.flush)
+        manager.update_completion(idx)
+
+    # Every case should now be complete
+    results.measure("Completion index (after saves)", lambda: manager.build_completion_index(task))
+    results.check(
+        "Saved cases were marked complete",
+        all(manager.is_case_completed(i, task) for i in range(len(manager.case_data))),
+    )
+
+    # Fold the journals back into their logs, as tasks do on exit
+    results.measure("Compact output logs", lambda: (
+        classification_output.compact_log(),
+        markup_output.compact_log(),
+        segmentation_io.compact_log(),
+    ))
+
+
+def _process_events():
+    # Let anything waiting on the event loop (i.e. pre-fetching) run
+    if SLICER_AVAILABLE:
+        import slicer
+        slicer.app.processEvents()
+
+
+## Entrypoint ##
+def main(argv: list[str]) -> int:
+    defaults = CohortSpec()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", type=int, default=200)
+    parser.add_argument("--volumes", type=int, default=defaults.volumes_per_case)
+    parser.add_argument("--shape", type=int, nargs=3, default=defaults.shape)
+    parser.add_argument("--labels", type=int, default=defaults.n_labels)
+    parser.add_argument("--sessions", type=int, default=defaults.sessions_per_subject)
+    parser.add_argument("--markups", type=int, default=defaults.markups_per_case)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", type=Path, default=None, help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    spec = CohortSpec(
+        args.cases, args.volumes, tuple(args.shape), args.labels,
+        args.sessions, args.markups, args.seed,
+    )
+    mode = "slicer" if SLICER_AVAILABLE else "stand-in"
+    print(f"Benchmarking CART ({mode} mode) w/ {spec}")
+
+    results = Results()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        work_dir = Path(tmp_dir)
+        cohort = results.measure("Generate synthetic cohort", lambda: generate_cohort(work_dir, spec))
+
+        benchmark_cohort_generation(results, cohort, work_dir, args.repeats)
+
+        master_profile, job_profile = build_profiles(cohort, work_dir)
+        task = SegmentationTask(master_profile, job_profile, list(cohort.resource_filters.keys()))
+
+        manager = benchmark_data_manager(results, cohort, task, args.repeats)
+        benchmark_navigation(results, manager, task)
+        benchmark_saves(results, manager, task, master_profile, job_profile)
+
+        task.cleanup()
+
+    results.print_table()
+    if args.json is not None:
+        with open(args.json, "w") as fp:
+            json.dump({
+                "mode": mode,
+                "spec": spec._asdict(),
+                "timings": results.summary(),
+                "failures": results.failures,
+            }, fp, indent=2)
+
+    return 1 if results.failures else 0
+
+
+if __name__ == "__main__":
+    exit_code = main(sys.argv[1:])
+    if SLICER_AVAILABLE:
+        import slicer
+        slicer.util.exit(exit_code)
+    sys.exit(exit_code)
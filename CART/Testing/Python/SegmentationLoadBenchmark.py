@@ -0,0 +1,140 @@
+"""
+Benchmark comparing CART's direct segmentation loader against the original
+(label volume node based) implementation, on synthetic multi-label files.
+
+Both loaders are also checked for parity; the segment IDs, label values, and
+storage file name they produce should be identical.
+
+Must be run through Slicer, i.e.:
+
+    Slicer --no-main-window --python-script SegmentationLoadBenchmark.py \
+        [--size 256] [--labels 2 8 32] [--repeats 5]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import slicer
+
+# Make CARTLib importable when run as a standalone script
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from CARTLib.utils.data import (  # noqa: E402
+    DECODED_VOLUMES,
+    load_segmentation,
+)
+
+
+def load_segmentation_via_label_node(path: Path):
+    """
+    The original implementation of `load_segmentation`, which loads the file
+    as a label volume node before importing it into a segmentation node.
+    """
+    # We first have to load it as a label volume
+    label_node = slicer.util.loadLabelVolume(str(path), {"show": False})
+
+    # Then pass its contents to a segmentation node
+    scene = slicer.mrmlScene
+    segment_node = scene.AddNewNodeByClass("vtkMRMLSegmentationNode")
+    slicer.modules.segmentations.logic().ImportLabelmapToSegmentationNode(
+        label_node, segment_node
+    )
+
+    # Copy the source filename from the label node to the segmentation node
+    segment_node.AddDefaultStorageNode()
+    segment_node.GetStorageNode().SetFileName(label_node.GetStorageNode().GetFileName())
+
+    # Hide it from view by default
+    segment_node.SetDisplayVisibility(False)
+
+    # Remove the (now redundant) label node from the scene
+    scene.RemoveNode(label_node)
+    return segment_node
+
+
+def write_label_file(path: Path, size: int, n_labels: int, seed: int = 0):
+    """
+    Write a synthetic label volume to disk; a stack of slabs, each with a
+    randomly placed block for every label.
+    """
+    rng = np.random.default_rng(seed)
+    labels = np.zeros((size, size, size), dtype=np.uint16)
+    block = max(size // 4, 1)
+    for label in range(1, n_labels + 1):
+        k, j, i = rng.integers(0, size - block + 1, size=3)
+        labels[k:k + block, j:j + block, i:i + block] = label
+    node = slicer.util.addVolumeFromArray(
+        labels, nodeClassName="vtkMRMLLabelMapVolumeNode"
+    )
+    slicer.util.saveNode(node, str(path))
+    slicer.mrmlScene.RemoveNode(node)
+
+
+def describe(segment_node) -> tuple:
+    # Everything both loaders should agree on
+    segmentation = segment_node.GetSegmentation()
+    segments = [
+        (segment_id, segmentation.GetSegment(segment_id).GetLabelValue())
+        for segment_id in segmentation.GetSegmentIDs()
+    ]
+    return segments, segment_node.GetStorageNode().GetFileName()
+
+
+def time_loader(loader, path: Path, repeats: int) -> tuple[float, tuple]:
+    """
+    Time how long the loader takes to load the file (best of `repeats`),
+    returning the result alongside a description of what it loaded.
+    """
+    best = float("inf")
+    description = None
+    for __ in range(repeats):
+        # Make sure neither loader gets to skip reading the file
+        DECODED_VOLUMES.clear()
+        start = time.perf_counter()
+        node = loader(path)
+        best = min(best, time.perf_counter() - start)
+        description = describe(node)
+        slicer.mrmlScene.RemoveNode(node)
+    return best, description
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--labels", type=int, nargs="+", default=[2, 8, 32])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_labels in args.labels:
+            path = Path(tmp_dir) / f"labels_{n_labels}.nii.gz"
+            write_label_file(path, args.size, n_labels)
+
+            legacy_time, legacy_desc = time_loader(
+                load_segmentation_via_label_node, path, args.repeats
+            )
+            direct_time, direct_desc = time_loader(
+                load_segmentation, path, args.repeats
+            )
+
+            print(
+                f"{n_labels:>3} labels, {args.size}^3 voxels: "
+                f"label node {legacy_time * 1000:8.1f} ms, "
+                f"direct {direct_time * 1000:8.1f} ms "
+                f"({legacy_time / direct_time:.2f}x)"
+            )
+            if legacy_desc != direct_desc:
+                mismatches += 1
+                print(f"  MISMATCH!\n  label node: {legacy_desc}\n  direct: {direct_desc}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    exit_code = main(sys.argv[1:])
+    slicer.util.exit(exit_code)
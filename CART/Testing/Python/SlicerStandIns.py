@@ -0,0 +1,183 @@
+"""
+Lightweight stand-ins for the modules Slicer provides (`slicer`, `qt`, `ctk`,
+`vtk`, etc.), allowing CART's pure-Python components (cohort generation,
+the data manager, task I/O logs, ...) to be imported and exercised outside
+of Slicer, i.e. by benchmarks run on plain Linux boxes.
+
+These do NOT emulate Slicer in any meaningful way; every attribute of a
+stand-in module is a stand-in class, every call of which does nothing and
+returns another stand-in. Anything which actually touches the MRML scene
+(or needs the Qt event loop, such as timers) will silently do nothing.
+
+Usage:
+
+    import SlicerStandIns
+    SlicerStandIns.install()  # Does nothing if Slicer is available
+
+    from CARTLib.utils.cohort import CohortModel
+"""
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import types
+
+# The top-level modules which are only available within Slicer
+STAND_IN_ROOTS = (
+    "slicer",
+    "qt",
+    "ctk",
+    "vtk",
+    "vtkITK",
+    "qSlicerSegmentationsModuleWidgetsPythonQt",
+)
+
+
+class _StandInMeta(type):
+    """
+    Metaclass for stand-in classes; any (non-dunder) attribute accessed on
+    the class itself becomes another stand-in class, so enum-like access
+    (i.e. `qt.Qt.DisplayRole`) and static methods (`qt.QTimer.singleShot`)
+    are both "supported".
+    """
+
+    def __getattr__(cls, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _stand_in_class(name)
+        setattr(cls, name, value)
+        return value
+
+    # Flags are combined (i.e. `qt.Qt.ItemIsEnabled | qt.Qt.ItemIsEditable`)
+    def __or__(cls, other):
+        return cls
+
+    __ror__ = __or__
+    __and__ = __or__
+    __rand__ = __or__
+
+
+class StandIn(metaclass=_StandInMeta):
+    """
+    Base for all stand-in classes. Accepts any arguments, and treats any
+    attribute it doesn't have as a method which does nothing.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _stand_in_class(name)()
+
+    def __call__(self, *args, **kwargs):
+        # Act as a pass-through decorator (i.e. `@qt.Slot()`)
+        if len(args) == 1 and not kwargs and isinstance(args[0], types.FunctionType):
+            return args[0]
+        return StandIn()
+
+    def __iter__(self):
+        return iter(())
+
+    def __or__(self, other):
+        return self
+
+    __ror__ = __or__
+    __and__ = __or__
+    __rand__ = __or__
+
+
+def _stand_in_class(name: str) -> type:
+    return _StandInMeta(name, (StandIn,), {})
+
+
+def _tr(text: str) -> str:
+    # Translation is a no-op outside of Slicer
+    return text
+
+
+class _ItemModel(StandIn):
+    """
+    Stand-in for Qt's item models; forwards the single row/column helpers to
+    the bulk versions (which CART's models override), as Qt itself does.
+    """
+
+    def insertRow(self, row: int, parent=None):
+        return self.insertRows(row, 1, parent)
+
+    def insertColumn(self, column: int, parent=None):
+        return self.insertColumns(column, 1, parent)
+
+    def removeRow(self, row: int, parent=None):
+        return self.removeRows(row, 1, parent)
+
+    def removeColumn(self, column: int, parent=None):
+        return self.removeColumns(column, 1, parent)
+
+
+# Attributes which need to be something more specific than a stand-in
+_OVERRIDES: dict[str, dict] = {
+    "qt": {"QAbstractItemModel": _ItemModel, "QAbstractTableModel": _ItemModel},
+    "slicer.i18n": {"tr": _tr, "translate": lambda __, text: text},
+}
+
+
+class _StandInModule(types.ModuleType):
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _stand_in_class(name)
+        setattr(self, name, value)
+        return value
+
+
+class _StandInFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """
+    Import hook which provides a stand-in module for any module within one of
+    the `STAND_IN_ROOTS` (including sub-modules, such as `vtk.util`).
+    """
+
+    def __init__(self, roots: tuple[str, ...]):
+        self.roots = roots
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] not in self.roots:
+            return None
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        return _StandInModule(spec.name)
+
+    def exec_module(self, module):
+        module.__path__ = []
+        for k, v in _OVERRIDES.get(module.__name__, {}).items():
+            setattr(module, k, v)
+        # Bind sub-modules to their parent, as a normal import would
+        parent_name, __, child_name = module.__name__.rpartition(".")
+        if parent_name:
+            setattr(sys.modules[parent_name], child_name, module)
+
+
+_FINDER = None
+
+
+def is_slicer_available() -> bool:
+    """
+    Whether we are running within Slicer (and thus have the real modules).
+    """
+    if _FINDER is not None:
+        return False
+    return importlib.util.find_spec("slicer") is not None
+
+
+def install():
+    """
+    Install the stand-in modules, if the real ones aren't available. Must be
+    called before anything from CARTLib is imported.
+    """
+    global _FINDER
+    if _FINDER is not None or is_slicer_available():
+        return
+    _FINDER = _StandInFinder(STAND_IN_ROOTS)
+    sys.meta_path.insert(0, _FINDER)
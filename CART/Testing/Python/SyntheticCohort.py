@@ -0,0 +1,342 @@
+"""
+Generates synthetic, BIDS-like datasets (and the cohort files CART would
+build for them), for use in benchmarks and tests.
+
+Each case gets `volumes_per_case` anatomical volumes, a multi-label
+segmentation, and (optionally) a set of markups, each with a JSON sidecar:
+
+    <root>/
+        rawdata/
+            sub-001/[ses-01/]anat/sub-001[_ses-01]_T1w.nii.gz (+ .json)
+            ...
+            derivatives/
+                labels/sub-001/[ses-01/]anat/..._T1w_label-lesion_seg.nii.gz (+ .json)
+                landmarks/sub-001/[ses-01/]anat/..._T1w_desc-landmarks.mrk.json
+        cohort.csv (+ cohort.json)
+
+Only requires numpy; files are written without Slicer (or nibabel).
+"""
+import csv
+import gzip
+import json
+import struct
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+import SlicerStandIns
+
+# Make CARTLib importable when used outside of Slicer
+sys.path.insert(0, str(Path(__file__).parents[2]))
+SlicerStandIns.install()
+
+from CARTLib.utils.cohort import COHORT_VERSION, CohortModel, ResourceFilter  # noqa: E402
+from CARTLib.utils.data import (  # noqa: E402
+    MarkupResource,
+    NIFTI_SIDECAR_LABELS_KEY,
+    ReferenceVolumeResource,
+    SegmentationResource,
+    VolumeResource,
+    find_json_sidecar_path,
+)
+
+# Modality suffixes given to each case's volumes, in order
+MODALITIES = ("T1w", "T2w", "FLAIR", "PD", "T2starw")
+
+# Name of the (generated) label and markup resources
+LABEL_NAME = "lesion"
+MARKUP_NAME = "landmarks"
+
+# Segmentation resource type used in the cohort; editable by the Segmentation task
+SEGMENTATION_RESOURCE_ID = f"{SegmentationResource.id}_editable"
+
+
+class CohortSpec(NamedTuple):
+    """
+    Describes the synthetic dataset to generate.
+    """
+    # Number of cases (subject/session pairs) in the cohort
+    n_cases: int = 20
+    # Number of anatomical volumes per case; the first is the reference volume
+    volumes_per_case: int = 2
+    # Shape of each volume (in voxels; i, j, k)
+    shape: tuple[int, int, int] = (64, 64, 32)
+    # Number of distinct labels (excluding background) in each segmentation
+    n_labels: int = 3
+    # Number of sessions per subject; if 1, cases are subjects w/o sessions
+    sessions_per_subject: int = 1
+    # Number of control points in each case's markups; 0 to skip them
+    markups_per_case: int = 0
+    # Seed for all random contents
+    seed: int = 0
+
+
+class SyntheticCohort(NamedTuple):
+    """
+    The result of `generate_cohort`.
+    """
+    spec: CohortSpec
+    # Where the dataset itself lives
+    data_path: Path
+    # The cohort file (and sidecar) matching the dataset
+    cohort_path: Path
+    # The UID of each case, in cohort order
+    uids: list[str]
+    # CSV label -> filter which finds that resource for each case
+    resource_filters: dict[str, ResourceFilter]
+
+
+## NIfTI Writing ##
+# NIfTI-1 datatype codes for the numpy types we write
+_NIFTI_DATATYPES = {
+    np.dtype(np.uint8): 2,
+    np.dtype(np.int16): 4,
+    np.dtype(np.int32): 8,
+    np.dtype(np.float32): 16,
+    np.dtype(np.uint16): 512,
+}
+
+
+def write_nifti(path: Path, voxels: np.ndarray, spacing: tuple[float, float, float] = (1.0, 1.0, 1.0)):
+    """
+    Write a (gzipped) NIfTI-1 file, w/ an axis-aligned geometry.
+
+    :param path: Where to write the file to.
+    :param voxels: The voxel data, indexed (k, j, i) like Slicer's arrays.
+    :param spacing: The voxel spacing along (i, j, k), in millimeters.
+    """
+    datatype = _NIFTI_DATATYPES.get(voxels.dtype)
+    if datatype is None:
+        raise ValueError(f"Cannot write voxels of type '{voxels.dtype}' to NIfTI!")
+    size_k, size_j, size_i = voxels.shape
+
+    header = bytearray(348)
+    struct.pack_into("<i", header, 0, 348)
+    struct.pack_into("<8h", header, 40, 3, size_i, size_j, size_k, 1, 1, 1, 1)
+    struct.pack_into("<2h", header, 70, datatype, voxels.dtype.itemsize * 8)
+    struct.pack_into("<8f", header, 76, 1.0, *spacing, 0.0, 0.0, 0.0, 0.0)
+    # Voxels start right after the header (and its empty extension block)
+    struct.pack_into("<3f", header, 108, 352.0, 1.0, 0.0)
+    # Millimeters, w/ the geometry defined by the (scanner-based) sform
+    struct.pack_into("<B", header, 123, 2)
+    struct.pack_into("<2h", header, 252, 0, 1)
+    struct.pack_into("<4f", header, 280, spacing[0], 0.0, 0.0, 0.0)
+    struct.pack_into("<4f", header, 296, 0.0, spacing[1], 0.0, 0.0)
+    struct.pack_into("<4f", header, 312, 0.0, 0.0, spacing[2], 0.0)
+    header[344:348] = b"n+1\0"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Favor speed over size; these are only used for benchmarking
+    with gzip.open(path, "wb", compresslevel=1) as fp:
+        fp.write(bytes(header))
+        fp.write(bytes(4))
+        fp.write(np.ascontiguousarray(voxels).tobytes())
+
+
+def _write_sidecar(path: Path, contents: dict):
+    with open(path, "w") as fp:
+        json.dump(contents, fp, indent=2)
+
+
+## Contents ##
+def _volume_array(rng: np.random.Generator, shape: tuple[int, int, int]) -> np.ndarray:
+    # A smooth-ish intensity gradient w/ noise, so files compress like real scans
+    size_i, size_j, size_k = shape
+    k, j, i = np.ogrid[:size_k, :size_j, :size_i]
+    gradient = (i * 3 + j * 2 + k) % 1024
+    noise = rng.integers(0, 64, size=(size_k, size_j, size_i))
+    return (gradient + noise).astype(np.int16)
+
+
+def _label_array(rng: np.random.Generator, shape: tuple[int, int, int], n_labels: int) -> np.ndarray:
+    # A randomly placed block for every label
+    size_i, size_j, size_k = shape
+    dtype = np.uint8 if n_labels < 256 else np.uint16
+    labels = np.zeros((size_k, size_j, size_i), dtype=dtype)
+    for label in range(1, n_labels + 1):
+        block = [max(s // 4, 1) for s in (size_k, size_j, size_i)]
+        k, j, i = [rng.integers(0, s - b + 1) for s, b in zip((size_k, size_j, size_i), block)]
+        labels[k:k + block[0], j:j + block[1], i:i + block[2]] = label
+    return labels
+
+
+def _markups_contents(rng: np.random.Generator, shape: tuple[int, int, int], n_points: int) -> dict:
+    # The (minimal) contents of a Slicer markups JSON file
+    control_points = [
+        {
+            "id": str(n + 1),
+            "label": f"{MARKUP_NAME}-{n + 1}",
+            "position": [float(rng.uniform(0, s)) for s in shape],
+        }
+        for n in range(n_points)
+    ]
+    return {
+        "@schema": "https://raw.githubusercontent.com/slicer/slicer/master/Modules/"
+                   "Loadable/Markups/Resources/Schema/markups-schema-v1.0.3.json#",
+        "markups": [{
+            "type": "Fiducial",
+            "coordinateSystem": "RAS",
+            "controlPoints": control_points,
+        }],
+    }
+
+
+def _modality(n: int) -> str:
+    # Cycle through the modalities, distinguishing repeats by acquisition
+    modality = MODALITIES[n % len(MODALITIES)]
+    if n >= len(MODALITIES):
+        return f"acq-{n // len(MODALITIES)}_{modality}"
+    return modality
+
+
+def _resource_filters(spec: CohortSpec) -> dict[str, ResourceFilter]:
+    filters = dict()
+    for n in range(spec.volumes_per_case):
+        modality = _modality(n)
+        resource_type = ReferenceVolumeResource if n == 0 else VolumeResource
+        label = resource_type.format_for_csv(modality)
+        # Skip derivatives, and repeat acquisitions of the same modality
+        exclude = ["derivatives"]
+        if "acq-" not in modality:
+            exclude.append("acq-")
+        filters[label] = ResourceFilter(
+            original_name=modality,
+            resource_type=resource_type.id,
+            # Anchor on the preceding underscore, so "T2w" doesn't match "T2starw"
+            include=[f"_{modality}.nii"],
+            exclude=exclude,
+            extension=".nii.gz",
+        )
+    filters[f"{LABEL_NAME}_{SEGMENTATION_RESOURCE_ID}"] = ResourceFilter(
+        original_name=LABEL_NAME,
+        resource_type=SEGMENTATION_RESOURCE_ID,
+        include=[f"_label-{LABEL_NAME}_seg"],
+        exclude=[],
+        extension=".nii.gz",
+    )
+    if spec.markups_per_case > 0:
+        filters[MarkupResource.format_for_csv(MARKUP_NAME)] = ResourceFilter(
+            original_name=MARKUP_NAME,
+            resource_type=MarkupResource.id,
+            include=[f"_desc-{MARKUP_NAME}"],
+            exclude=[],
+            extension=".mrk.json",
+        )
+    return filters
+
+
+## Generation ##
+def generate_cohort(root: Path, spec: CohortSpec = CohortSpec()) -> SyntheticCohort:
+    """
+    Generate a synthetic dataset (and its cohort) matching the spec within
+    the given directory.
+    """
+    if spec.n_cases < 1 or spec.volumes_per_case < 1:
+        raise ValueError("Synthetic cohorts need at least one case and one volume per case!")
+    if spec.sessions_per_subject < 1:
+        raise ValueError("Synthetic cohorts need at least one session per subject!")
+
+    rng = np.random.default_rng(spec.seed)
+    data_path = root / "rawdata"
+    label_root = data_path / "derivatives" / "labels"
+    markup_root = data_path / "derivatives" / MARKUP_NAME
+    filters = _resource_filters(spec)
+
+    uids = []
+    rows = []
+    case_paths = dict()
+    for n in range(spec.n_cases):
+        # Determine where (and under which UID) this case lives
+        subject = f"sub-{n // spec.sessions_per_subject + 1:03d}"
+        if spec.sessions_per_subject > 1:
+            session = f"ses-{n % spec.sessions_per_subject + 1:02d}"
+            case_dir = Path(subject) / session
+            uid = f"{subject}__{session}"
+            prefix = f"{subject}_{session}"
+        else:
+            case_dir = Path(subject)
+            uid = subject
+            prefix = subject
+
+        # Write each volume, w/ a BIDS sidecar
+        row = {"uid": uid}
+        for i, label in enumerate([k for k, v in filters.items() if VolumeResource.is_type(k)]):
+            volume_path = data_path / case_dir / "anat" / f"{prefix}_{_modality(i)}.nii.gz"
+            write_nifti(volume_path, _volume_array(rng, spec.shape))
+            _write_sidecar(find_json_sidecar_path(volume_path), {
+                "Modality": "MR",
+                "MagneticFieldStrength": 3,
+                "SeriesDescription": _modality(i),
+            })
+            row[label] = str(volume_path.relative_to(data_path))
+
+        # Write the segmentation, named after the reference volume
+        seg_path = label_root / case_dir / "anat" / f"{prefix}_{MODALITIES[0]}_label-{LABEL_NAME}_seg.nii.gz"
+        write_nifti(seg_path, _label_array(rng, spec.shape, spec.n_labels))
+        _write_sidecar(find_json_sidecar_path(seg_path), {
+            NIFTI_SIDECAR_LABELS_KEY: {str(v): f"{LABEL_NAME}_{v}" for v in range(1, spec.n_labels + 1)},
+        })
+        row[f"{LABEL_NAME}_{SEGMENTATION_RESOURCE_ID}"] = str(seg_path.relative_to(data_path))
+
+        # Write the markups, if requested
+        if spec.markups_per_case > 0:
+            markup_path = markup_root / case_dir / "anat" / f"{prefix}_{MODALITIES[0]}_desc-{MARKUP_NAME}.mrk.json"
+            markup_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_sidecar(markup_path, _markups_contents(rng, spec.shape, spec.markups_per_case))
+            row[MarkupResource.format_for_csv(MARKUP_NAME)] = str(markup_path.relative_to(data_path))
+
+        # Track the case, and where CART's BIDS generator would search for it
+        uids.append(uid)
+        rows.append(row)
+        case_paths[uid] = [
+            case_dir,
+            label_root.relative_to(data_path) / case_dir,
+        ]
+        if spec.markups_per_case > 0:
+            case_paths[uid].append(markup_root.relative_to(data_path) / case_dir)
+
+    # Write the cohort file matching the dataset, and its sidecar
+    cohort_path = root / "cohort.csv"
+    with open(cohort_path, "w", newline="") as fp:
+        writer = csv.DictWriter(fp, fieldnames=["uid", *filters.keys()])
+        writer.writeheader()
+        writer.writerows(rows)
+    _write_sidecar(cohort_path.with_suffix(".json"), {
+        CohortModel.VERSION_KEY: COHORT_VERSION,
+        CohortModel.CASE_PATH_KEY: {k: [str(p) for p in v] for k, v in case_paths.items()},
+        CohortModel.FILTERS_KEY: {k: v._asdict() for k, v in filters.items()},
+    })
+
+    return SyntheticCohort(spec, data_path, cohort_path, uids, filters)
+
+
+def read_cohort_rows(cohort_path: Path) -> list[dict[str, str]]:
+    """
+    Read a cohort file's rows, i.e. to compare against a generated one.
+    """
+    with open(cohort_path, newline="") as fp:
+        return list(csv.DictReader(fp))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    defaults = CohortSpec()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--cases", type=int, default=defaults.n_cases)
+    parser.add_argument("--volumes", type=int, default=defaults.volumes_per_case)
+    parser.add_argument("--shape", type=int, nargs=3, default=defaults.shape)
+    parser.add_argument("--labels", type=int, default=defaults.n_labels)
+    parser.add_argument("--sessions", type=int, default=defaults.sessions_per_subject)
+    parser.add_argument("--markups", type=int, default=defaults.markups_per_case)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    cohort = generate_cohort(args.output, CohortSpec(
+        args.cases, args.volumes, tuple(args.shape), args.labels,
+        args.sessions, args.markups, args.seed,
+    ))
+    print(f"Generated {len(cohort.uids)} cases in '{cohort.data_path}'; cohort at '{cohort.cohort_path}'.")